@@ -0,0 +1,5 @@
+"""
+The module containing benchmarks of the Xeus Pygame Extensions.
+
+The benchmarks run headless, under the SDL dummy video driver. Run them with: python -m benchmarks
+"""
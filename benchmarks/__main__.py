@@ -0,0 +1,106 @@
+"""
+Run the benchmarks and save their results.
+
+Usage: python -m benchmarks [--scales 100 1000 ...] [--only update draw ...] [--label LABEL] [--compare FILE]
+
+The results are saved as JSON in benchmarks/results/<label>.json, where the label defaults to the short hash of the
+current git commit. Passing --compare with the path of an earlier result prints the relative change of each
+measurement.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from time import perf_counter
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from benchmarks.scene_manager_benchmark import BENCHMARKS, SCREEN_SIZE
+
+DEFAULT_SCALES = (100, 1000, 10000, 100000)
+MIN_DURATION = 0.5
+MIN_FRAMES = 3
+RESULTS_DIRECTORY = os.path.join(os.path.dirname(__file__), "results")
+
+
+def measure(frame):
+    """
+    Run the frame function repeatedly and measure it.
+
+    :param frame: function running a single frame
+    :return: dictionary with the number of frames, the mean and the best frame time in milliseconds and the FPS
+    :rtype: dict
+    """
+
+    times = list()
+    start = perf_counter()
+    while len(times) < MIN_FRAMES or perf_counter() - start < MIN_DURATION:
+        frame_start = perf_counter()
+        frame()
+        times.append(perf_counter() - frame_start)
+    mean = sum(times) / len(times)
+    return {"frames": len(times), "mean_ms": mean * 1000, "best_ms": min(times) * 1000, "fps": 1 / mean}
+
+
+def git_label():
+    try:
+        output = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return output.decode().strip()
+
+
+def compare(results, previous):
+    for name, scales in results["benchmarks"].items():
+        for scale, result in scales.items():
+            old = previous.get("benchmarks", dict()).get(name, dict()).get(scale)
+            if old is None:
+                continue
+            change = (result["mean_ms"] - old["mean_ms"]) / old["mean_ms"] * 100
+            print("{:<18}{:>8}  {:>10.3f} ms -> {:>10.3f} ms  {:+7.1f}%".format(
+                name, scale, old["mean_ms"], result["mean_ms"], change))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the XPGE benchmarks.")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES, help="numbers of sprites")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--label", default=None, help="name of the results file, the git commit by default")
+    parser.add_argument("--compare", default=None, help="path of the results to compare with")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+
+    label = args.label or git_label()
+    results = {"label": label, "python": platform.python_version(), "pygame": pygame.version.ver,
+               "benchmarks": dict()}
+    for name in args.only or BENCHMARKS:
+        results["benchmarks"][name] = dict()
+        for scale in args.scales:
+            result = measure(BENCHMARKS[name](scale))
+            results["benchmarks"][name][str(scale)] = result
+            print("{:<18}{:>8}  {:>10.3f} ms  {:>10.1f} fps".format(name, scale, result["mean_ms"], result["fps"]))
+            sys.stdout.flush()
+
+    pygame.quit()
+
+    os.makedirs(RESULTS_DIRECTORY, exist_ok=True)
+    path = os.path.join(RESULTS_DIRECTORY, label + ".json")
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+    print("Results saved to " + path)
+
+    if args.compare is not None:
+        with open(args.compare) as file:
+            compare(results, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
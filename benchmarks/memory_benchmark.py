@@ -0,0 +1,64 @@
+"""
+Benchmark of the memory taken by a sprite with its components.
+
+Usage: python -m benchmarks.memory_benchmark [--count COUNT]
+
+The sprites are created like in the scene manager benchmarks, once as XPGESprite with SpriteBehaviour components and
+once as CompactSprite with CompactBehaviour components, and the memory allocated per sprite is measured with
+tracemalloc. The shared image is not counted.
+"""
+
+import argparse
+import os
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from pygame import Surface
+
+from benchmarks.scene_manager_benchmark import SPRITE_SIZE, _create_sprite
+from xpgext.scene_manager import SimpleSceneManager
+
+DEFAULT_COUNT = 100000
+
+
+def measure_memory(count, compact):
+    """
+    Create the sprites and measure the memory they take.
+
+    :param count: the number of the sprites
+    :type count: int
+    :param compact: create CompactSprite instead of XPGESprite
+    :type compact: bool
+    :return: the number of bytes allocated per sprite
+    :rtype: float
+    """
+
+    scene_manager = SimpleSceneManager()
+    image = Surface(SPRITE_SIZE)
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        sprites = [_create_sprite(scene_manager, index, image, compact) for index in range(count)]
+        end = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del sprites
+    return (end - start) / count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.memory_benchmark",
+                                     description="Measure the memory taken by a sprite.")
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT, help="number of sprites")
+    args = parser.parse_args(argv)
+
+    regular = measure_memory(args.count, compact=False)
+    compact = measure_memory(args.count, compact=True)
+    print("{:<18}{:>10.0f} B/sprite".format("XPGESprite", regular))
+    print("{:<18}{:>10.0f} B/sprite  {:+7.1f}%".format("CompactSprite", compact, (compact - regular) / regular * 100))
+
+
+if __name__ == "__main__":
+    main()
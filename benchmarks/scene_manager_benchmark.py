@@ -0,0 +1,269 @@
+"""
+Benchmarks of the scene manager and the sprite hot paths.
+
+Every benchmark is a function taking the number of sprites and returning a function that runs a single frame
+of the measured operation. The setup is not measured.
+"""
+
+from pygame import Surface, MOUSEMOTION, KEYDOWN
+from pygame.event import Event
+
+from xpgext.camera import Camera
+from xpgext.collision import CollisionSystem
+from xpgext.kinematics import KinematicsSystem
+from xpgext.particles import ParticleEmitter, numpy
+from xpgext.scene_manager import SimpleSceneManager
+from xpgext.sprite import XPGESprite, SpriteBehaviour, CompactSprite, CompactBehaviour
+from xpgext.tilemap import TilemapSprite
+
+SCREEN_SIZE = (800, 600)
+SPRITE_SIZE = (8, 8)
+
+
+class MovingBehaviour(SpriteBehaviour):
+
+    def __init__(self, sprite):
+        super().__init__(sprite)
+        self.velocity = (1, 0)
+
+    def on_update(self):
+        rect = self.sprite.rect
+        rect.x = (rect.x + self.velocity[0]) % SCREEN_SIZE[0]
+
+
+class KeyBehaviour(SpriteBehaviour):
+    handled_event_types = (KEYDOWN,)
+
+    def on_handle_event(self, event):
+        return False
+
+
+class HoverBehaviour(SpriteBehaviour):
+
+    def __init__(self, sprite):
+        super().__init__(sprite)
+        self.hovered = False
+
+    def on_hover(self):
+        self.hovered = True
+
+    def on_hover_exit(self):
+        self.hovered = False
+
+
+class CompactMovingBehaviour(CompactBehaviour):
+    __slots__ = ("velocity",)
+
+    def __init__(self, sprite):
+        super().__init__(sprite)
+        self.velocity = (1, 0)
+
+    on_update = MovingBehaviour.on_update
+
+
+class CompactKeyBehaviour(CompactBehaviour):
+    __slots__ = ()
+    handled_event_types = (KEYDOWN,)
+
+    on_handle_event = KeyBehaviour.on_handle_event
+
+
+class CompactHoverBehaviour(CompactBehaviour):
+    __slots__ = ("hovered",)
+
+    def __init__(self, sprite):
+        super().__init__(sprite)
+        self.hovered = False
+
+    on_hover = HoverBehaviour.on_hover
+    on_hover_exit = HoverBehaviour.on_hover_exit
+
+
+def _create_sprite(scene_manager, index, image, compact=False):
+    if compact:
+        sprite_type = CompactSprite
+        behaviour_types = (CompactMovingBehaviour, CompactHoverBehaviour, CompactKeyBehaviour)
+    else:
+        sprite_type = XPGESprite
+        behaviour_types = (MovingBehaviour, HoverBehaviour, KeyBehaviour)
+    sprite = sprite_type(scene_manager)
+    sprite.image = image
+    sprite.position = ((index * 13) % SCREEN_SIZE[0], (index * 7) % SCREEN_SIZE[1])
+    sprite.name = "sprite {}".format(index % 100)
+    sprite.components.append(behaviour_types[0](sprite))
+    sprite.components.append(behaviour_types[1](sprite))
+    if index % 10 == 0:
+        sprite.components.append(behaviour_types[2](sprite))
+    return sprite
+
+
+def _create_scene_manager(count, compact=False):
+    scene_manager = SimpleSceneManager()
+    image = Surface(SPRITE_SIZE)
+    image.fill((255, 255, 255))
+    for index in range(count):
+        scene_manager.spawn(_create_sprite(scene_manager, index, image, compact))
+    return scene_manager
+
+
+def bench_update(count):
+    scene_manager = _create_scene_manager(count)
+    return scene_manager.update
+
+
+def bench_update_compact(count):
+    scene_manager = _create_scene_manager(count, compact=True)
+    return scene_manager.update
+
+
+def bench_update_collisions(count):
+    scene_manager = _create_scene_manager(count)
+    scene_manager.collisions = CollisionSystem(cell_size=2 * SPRITE_SIZE[0])
+    for sprite in scene_manager._sprites:
+        scene_manager.collisions.add(sprite)
+    return scene_manager.update
+
+
+def bench_update_kinematics(count):
+    scene_manager = SimpleSceneManager()
+    scene_manager.kinematics = KinematicsSystem()
+    image = Surface(SPRITE_SIZE)
+    for index in range(count):
+        sprite = XPGESprite(scene_manager)
+        sprite.image = image
+        sprite.position = ((index * 13) % SCREEN_SIZE[0], (index * 7) % SCREEN_SIZE[1])
+        scene_manager.spawn(sprite)
+        scene_manager.kinematics.add(sprite, velocity=(60, 0))
+    return scene_manager.update
+
+
+def bench_draw(count):
+    scene_manager = _create_scene_manager(count)
+    surface = Surface(SCREEN_SIZE)
+    return lambda: scene_manager.draw(surface)
+
+
+def bench_draw_camera(count):
+    scene_manager = _create_scene_manager(0)
+    image = Surface(SPRITE_SIZE)
+    columns = max(1, int(count ** 0.5))
+    for index in range(count):
+        sprite = XPGESprite(scene_manager)
+        sprite.image = image
+        sprite.position = ((index % columns) * 16, (index // columns) * 16)
+        scene_manager.spawn(sprite)
+    scene_manager.camera = Camera()
+    surface = Surface(SCREEN_SIZE)
+    return lambda: scene_manager.draw(surface)
+
+
+def bench_draw_tilemap(count):
+    scene_manager = _create_scene_manager(0)
+    image = Surface((16, 16))
+    columns = max(1, int(count ** 0.5))
+    rows = max(1, count // columns)
+    tilemap = TilemapSprite(scene_manager, [image], (columns, rows), (16, 16))
+    tilemap.load_tiles([[1] * columns for _ in range(rows)])
+    scene_manager.spawn(tilemap)
+    scene_manager.camera = Camera()
+    surface = Surface(SCREEN_SIZE)
+    return lambda: scene_manager.draw(surface)
+
+
+def bench_particles(count):
+    scene_manager = _create_scene_manager(0)
+    emitter = ParticleEmitter(scene_manager, capacity=count)
+    emitter.emit(count, (SCREEN_SIZE[0] / 2, SCREEN_SIZE[1] / 2), spread=(200, 200), lifetime=1000)
+    scene_manager.spawn(emitter)
+    surface = Surface(SCREEN_SIZE)
+
+    def frame():
+        scene_manager.update()
+        scene_manager.draw(surface)
+
+    return frame
+
+
+def bench_handle_event(count):
+    scene_manager = _create_scene_manager(count)
+    events = [Event(MOUSEMOTION, {"pos": (x * 37 % SCREEN_SIZE[0], x * 17 % SCREEN_SIZE[1]), "rel": (1, 1),
+                                  "buttons": (0, 0, 0)}) for x in range(10)]
+    events.append(Event(KEYDOWN, {"key": 0, "mod": 0, "unicode": ""}))
+
+    def frame():
+        for event in events:
+            scene_manager.handle_event(event)
+
+    return frame
+
+
+def bench_spawn_kill(count):
+    scene_manager = _create_scene_manager(count)
+    image = Surface(SPRITE_SIZE)
+    churn = max(1, count // 10)
+    spawned = [_create_sprite(scene_manager, index, image) for index in range(churn)]
+
+    def frame():
+        for sprite in spawned:
+            scene_manager.spawn(sprite)
+        for sprite in spawned:
+            scene_manager.kill(sprite)
+
+    return frame
+
+
+def bench_spawn_kill_many(count):
+    scene_manager = _create_scene_manager(count)
+    image = Surface(SPRITE_SIZE)
+    churn = max(1, count // 10)
+    spawned = [_create_sprite(scene_manager, index, image) for index in range(churn)]
+
+    def frame():
+        scene_manager.spawn_many(spawned)
+        scene_manager.kill_many(spawned)
+
+    return frame
+
+
+def bench_find_by_name(count):
+    scene_manager = _create_scene_manager(count)
+    names = ["sprite {}".format(index) for index in range(100)]
+
+    def frame():
+        for name in names:
+            scene_manager.find_by_name(name)
+            scene_manager.get_by_name(name)
+
+    return frame
+
+
+def bench_component_lookup(count):
+    scene_manager = _create_scene_manager(count)
+    sprites = [scene_manager.get_by_name("sprite {}".format(index)) for index in range(100)]
+
+    def frame():
+        for sprite in sprites:
+            sprite.get_component_by_type(MovingBehaviour)
+            sprite.find_components_by_type(SpriteBehaviour)
+            sprite.get_component_by_type_name("HoverBehaviour")
+
+    return frame
+
+
+BENCHMARKS = {
+    "update": bench_update,
+    "update_compact": bench_update_compact,
+    "update_collisions": bench_update_collisions,
+    "draw": bench_draw,
+    "draw_camera": bench_draw_camera,
+    "draw_tilemap": bench_draw_tilemap,
+    "handle_event": bench_handle_event,
+    "spawn_kill": bench_spawn_kill,
+    "spawn_kill_many": bench_spawn_kill_many,
+    "find_by_name": bench_find_by_name,
+    "component_lookup": bench_component_lookup,
+}
+
+if numpy is not None:
+    BENCHMARKS["update_kinematics"] = bench_update_kinematics
+    BENCHMARKS["particles"] = bench_particles
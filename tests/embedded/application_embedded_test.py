@@ -5,6 +5,7 @@ import pygame
 
 from tests.test_utils import run_with_timeout
 from xpgext.application import XPGEApplication
+from xpgext.profiler import FrameProfiler
 from xpgext.scene_manager import SimpleSceneManager
 
 
@@ -35,3 +36,32 @@ class XPGApplicationTest(TestCase):
         # then
         self.assertTrue(application.is_running)
         self.scene_manager_mock.update.assert_called()
+
+    def test_should_run_main_loop_with_fixed_timestep(self):
+        # given
+        application = XPGEApplication(self.scene_manager_mock, (800, 600))
+        application.tick_rate = 60
+        application.frame_rate = 10
+
+        # when
+        run_with_timeout(1, application.run_main_loop)
+
+        # then
+        self.assertGreater(self.scene_manager_mock.update.call_count, self.scene_manager_mock.draw.call_count)
+        surface, alpha = self.scene_manager_mock.draw.call_args[0]
+        self.assertGreaterEqual(alpha, 0)
+        self.assertLess(alpha, 1)
+
+    def test_should_record_frames_in_profiler(self):
+        # given
+        application = XPGEApplication(self.scene_manager_mock, (800, 600))
+        application.profiler = FrameProfiler()
+
+        # when
+        run_with_timeout(1, application.run_main_loop)
+
+        # then
+        self.assertIs(application.profiler, self.scene_manager_mock.profiler)
+        self.assertGreater(application.profiler.frame_count, 0)
+        self.assertEqual(["events", "update", "draw", "display"],
+                         [phase[1] for phase in application.profiler.phases[:4]])
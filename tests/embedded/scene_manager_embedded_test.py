@@ -1,8 +1,11 @@
+import os
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 import pygame
-from pygame import Rect
+from pygame import Rect, Surface
 
+from xpgext.scene import SimpleScene
 from xpgext.scene_manager import SimpleSceneManager
 
 
@@ -30,3 +33,23 @@ class SimpleSceneManagerTest(TestCase):
         self.assertEqual(0, screen_rect.left)
         self.assertEqual(600, screen_rect.bottom)
         self.assertEqual(800, screen_rect.right)
+
+    def test_should_keep_converted_assets_after_switching_scenes(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.register_scene(SimpleScene, "test scene 1")
+        simple_scene_manager.register_scene(SimpleScene, "test scene 2")
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "image.png")
+            pygame.image.save(Surface((16, 16)), path)
+
+            # when
+            simple_scene_manager.load_scene("test scene 1")
+            image_1 = simple_scene_manager.assets.load_image(path)
+            simple_scene_manager.load_scene("test scene 2")
+            image_2 = simple_scene_manager.assets.load_image(path)
+
+        # then
+        self.assertIs(image_1, image_2)
+        self.assertEqual(1, simple_scene_manager.assets.misses)
+        self.assertEqual(1, simple_scene_manager.assets.hits)
@@ -0,0 +1,121 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import pygame
+from pygame import Surface
+
+from xpgext.assets import AssetCache, LRUCache
+
+IMAGE_SIZE = (16, 16)
+IMAGE_BYTES = 16 * 16 * 4
+
+
+class AssetCacheTest(TestCase):
+    """Test class for AssetCache class."""
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.paths = list()
+        for index in range(3):
+            path = os.path.join(self.directory.name, "image_{}.png".format(index))
+            pygame.image.save(Surface(IMAGE_SIZE, pygame.SRCALPHA), path)
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_should_load_image_once(self):
+        # given
+        asset_cache = AssetCache()
+
+        # when
+        image_1 = asset_cache.load_image(self.paths[0], convert=False)
+        image_2 = asset_cache.load_image(self.paths[0], convert=False)
+
+        # then
+        self.assertIs(image_1, image_2)
+        self.assertEqual(1, asset_cache.hits)
+        self.assertEqual(1, asset_cache.misses)
+        self.assertEqual(0.5, asset_cache.hit_ratio)
+        self.assertEqual(IMAGE_BYTES, asset_cache.memory_usage)
+
+    def test_should_evict_least_recently_used_image(self):
+        # given
+        asset_cache = AssetCache(memory_budget=2 * IMAGE_BYTES)
+        asset_cache.load_image(self.paths[0], convert=False)
+        asset_cache.load_image(self.paths[1], convert=False)
+        asset_cache.load_image(self.paths[0], convert=False)
+
+        # when
+        asset_cache.load_image(self.paths[2], convert=False)
+
+        # then
+        self.assertEqual(1, asset_cache.evictions)
+        self.assertIn(AssetCache.make_key(self.paths[0], convert=False), asset_cache)
+        self.assertNotIn(AssetCache.make_key(self.paths[1], convert=False), asset_cache)
+        self.assertIn(AssetCache.make_key(self.paths[2], convert=False), asset_cache)
+        self.assertEqual(2 * IMAGE_BYTES, asset_cache.memory_usage)
+
+    def test_should_evict_images_when_budget_is_lowered(self):
+        # given
+        asset_cache = AssetCache()
+        for path in self.paths:
+            asset_cache.load_image(path, convert=False)
+
+        # when
+        asset_cache.memory_budget = IMAGE_BYTES
+
+        # then
+        self.assertEqual(1, len(asset_cache))
+        self.assertEqual(2, asset_cache.evictions)
+
+    def test_should_clear_cache(self):
+        # given
+        asset_cache = AssetCache()
+        asset_cache.load_image(self.paths[0], convert=False)
+
+        # when
+        asset_cache.clear()
+
+        # then
+        self.assertEqual(0, len(asset_cache))
+        self.assertEqual(0, asset_cache.memory_usage)
+
+
+class LRUCacheTest(TestCase):
+    """Test class for LRUCache class."""
+
+    def setUp(self):
+        self.cache = LRUCache(2 * IMAGE_BYTES)
+
+    def test_should_evict_least_recently_used_entries(self):
+        # given
+        surfaces = [Surface(IMAGE_SIZE, 0, 32) for _ in range(3)]
+        self.cache._store("a", surfaces[0])
+        self.cache._store("b", surfaces[1])
+        self.cache._lookup("a")
+
+        # when
+        self.cache._store("c", surfaces[2])
+
+        # then
+        self.assertIn("a", self.cache)
+        self.assertNotIn("b", self.cache)
+        self.assertEqual(2 * IMAGE_BYTES, self.cache.memory_usage)
+        self.assertEqual(1, self.cache.evictions)
+
+    def test_should_evict_entries_of_collected_source(self):
+        # given
+        source = Surface(IMAGE_SIZE)
+        other_source = Surface(IMAGE_SIZE)
+        self.cache._store("a", Surface(IMAGE_SIZE, 0, 32), source)
+        self.cache._store("b", Surface(IMAGE_SIZE, 0, 32), other_source)
+
+        # when
+        del source
+
+        # then
+        self.assertNotIn("a", self.cache)
+        self.assertIn("b", self.cache)
+        self.assertEqual(IMAGE_BYTES, self.cache.memory_usage)
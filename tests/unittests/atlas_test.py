@@ -0,0 +1,144 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import pygame
+from pygame import Surface, Rect
+
+from xpgext.atlas import AtlasBuilder, TextureAtlas, load_atlas
+
+RED = (255, 0, 0, 255)
+GREEN = (0, 255, 0, 255)
+
+
+class AtlasBuilderTest(TestCase):
+    """Test class for AtlasBuilder class."""
+
+    def test_should_pack_images_without_overlapping(self):
+        # given
+        builder = AtlasBuilder((64, 64), padding=1)
+        for index in range(20):
+            builder.add("image {}".format(index), Surface((8 + index % 3, 10 - index % 4)))
+
+        # when
+        atlas = builder.build()
+
+        # then
+        self.assertEqual(20, len(atlas))
+        self.assertEqual(1, len(atlas.pages))
+        areas = [atlas[name].area for name in atlas]
+        for index, area in enumerate(areas):
+            self.assertTrue(atlas.pages[0].get_rect().contains(area))
+            self.assertEqual(-1, area.collidelist(areas[index + 1:]))
+
+    def test_should_start_new_page_when_page_is_full(self):
+        # given
+        builder = AtlasBuilder((32, 32), padding=0)
+        for index in range(5):
+            builder.add(str(index), Surface((16, 16)))
+
+        # when
+        atlas = builder.build()
+
+        # then
+        self.assertEqual(2, len(atlas.pages))
+        self.assertIs(atlas.pages[1], atlas["4"].surface)
+
+    def test_should_not_make_full_page_taller_than_page_size(self):
+        # given
+        single_image_builder = AtlasBuilder((64, 64), padding=1)
+        single_image_builder.add("image", Surface((63, 63)))
+        shelves_builder = AtlasBuilder((64, 64), padding=2)
+        for index in range(4):
+            shelves_builder.add(str(index), Surface((30, 30)))
+
+        # when
+        single_image_atlas = single_image_builder.build()
+        shelves_atlas = shelves_builder.build()
+
+        # then
+        self.assertEqual((64, 64), single_image_atlas.pages[0].get_size())
+        self.assertEqual(1, len(shelves_atlas.pages))
+        self.assertEqual((64, 64), shelves_atlas.pages[0].get_size())
+        for name in shelves_atlas:
+            self.assertTrue(shelves_atlas.pages[0].get_rect().contains(shelves_atlas[name].area))
+
+    def test_should_copy_images_into_pages(self):
+        # given
+        builder = AtlasBuilder((64, 64))
+        red = Surface((4, 4))
+        red.fill(RED)
+        builder.add("red", red)
+
+        # when
+        surface, area = builder.build()["red"]
+
+        # then
+        self.assertEqual(Rect(1, 1, 4, 4), area)
+        self.assertEqual(RED, surface.get_at(area.topleft))
+        self.assertEqual((0, 0, 0, 0), surface.get_at((0, 0)))
+
+    def test_should_not_add_image_larger_than_page(self):
+        # given
+        builder = AtlasBuilder((16, 16))
+
+        # when then
+        with self.assertRaises(ValueError):
+            builder.add("large", Surface((16, 8)))
+
+
+class LoadAtlasTest(TestCase):
+    """Test class for load_atlas function."""
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.cache_directory = os.path.join(self.directory.name, "cache")
+        self.paths = list()
+        for index, colour in enumerate((RED, GREEN)):
+            path = os.path.join(self.directory.name, "image_{}.png".format(index))
+            image = Surface((8, 8), pygame.SRCALPHA)
+            image.fill(colour)
+            pygame.image.save(image, path)
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_should_load_cached_atlas_without_packing(self):
+        # given
+        load_atlas(self.paths, self.cache_directory)
+
+        # when
+        with patch.object(AtlasBuilder, "build") as build:
+            atlas = load_atlas(self.paths, self.cache_directory)
+
+        # then
+        build.assert_not_called()
+        surface, area = atlas[os.path.normpath(self.paths[1])]
+        self.assertEqual(GREEN, surface.get_at(area.topleft))
+
+    def test_should_pack_again_when_image_changes(self):
+        # given
+        load_atlas(self.paths, self.cache_directory)
+        stat = os.stat(self.paths[0])
+        os.utime(self.paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+        # when
+        with patch.object(AtlasBuilder, "build", wraps=AtlasBuilder.build, autospec=True) as build:
+            load_atlas(self.paths, self.cache_directory)
+
+        # then
+        build.assert_called_once()
+
+    def test_should_save_and_load_atlas(self):
+        # given
+        builder = AtlasBuilder((32, 32))
+        builder.add("image", Surface((4, 4)))
+        index_path = builder.build().save(self.cache_directory, "test")
+
+        # when
+        atlas = TextureAtlas.load(index_path)
+
+        # then
+        self.assertEqual(Rect(1, 1, 4, 4), atlas["image"].area)
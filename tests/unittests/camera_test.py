@@ -0,0 +1,59 @@
+from unittest import TestCase
+
+from pygame import Rect
+
+from xpgext.camera import Camera
+
+
+class CameraTest(TestCase):
+    """Test class for Camera class."""
+
+    def test_should_compute_viewport(self):
+        # given
+        camera = Camera((100, 50))
+
+        # when
+        viewport = camera.get_viewport((800, 600))
+
+        # then
+        self.assertEqual(Rect(100, 50, 800, 600), viewport)
+
+    def test_should_shrink_viewport_when_zoomed_in(self):
+        # given
+        camera = Camera((10.5, 20), zoom=2)
+
+        # when
+        viewport = camera.get_viewport((100, 60))
+
+        # then
+        self.assertEqual(Rect(10, 20, 51, 30), viewport)
+
+    def test_should_convert_between_world_and_screen(self):
+        # given
+        camera = Camera((100, 50), zoom=2)
+
+        # when
+        screen_point = camera.world_to_screen((110, 60))
+        world_point = camera.screen_to_world(screen_point)
+
+        # then
+        self.assertEqual((20, 20), screen_point)
+        self.assertEqual((110, 60), world_point)
+
+    def test_should_center_on_point(self):
+        # given
+        camera = Camera(zoom=2)
+
+        # when
+        camera.center_on((500, 400), (800, 600))
+
+        # then
+        self.assertEqual((300, 250), camera.position)
+
+    def test_should_not_accept_non_positive_zoom(self):
+        # given
+        camera = Camera()
+
+        # when then
+        with self.assertRaises(ValueError):
+            camera.zoom = 0
@@ -0,0 +1,104 @@
+from unittest import TestCase
+
+import pygame
+from pygame import Surface
+
+from xpgext.collision import CollisionSystem
+from xpgext.sprite import XPGESprite
+
+
+def create_sprite(x, y, size=10):
+    sprite = XPGESprite(None)
+    sprite.rect.update(x, y, size, size)
+    return sprite
+
+
+class CollisionSystemTest(TestCase):
+    """Test class for CollisionSystem class."""
+
+    def setUp(self):
+        self.collisions = CollisionSystem(cell_size=16)
+        self.sprite_1 = create_sprite(0, 0)
+        self.sprite_2 = create_sprite(5, 5)
+        self.sprite_3 = create_sprite(100, 100)
+        for sprite in (self.sprite_1, self.sprite_2, self.sprite_3):
+            self.collisions.add(sprite)
+
+    def test_should_report_entered_stayed_and_exited_pairs(self):
+        # when
+        first_step = self.collisions.step()
+        second_step = self.collisions.step()
+        self.sprite_2.rect.topleft = (50, 50)
+        third_step = self.collisions.step()
+
+        # then
+        pair = (self.sprite_1, self.sprite_2)
+        self.assertEqual(([pair], [], []), first_step)
+        self.assertEqual(([], [pair], []), second_step)
+        self.assertEqual(([], [], [pair]), third_step)
+
+    def test_should_find_each_pair_once_when_sharing_many_cells(self):
+        # given
+        large_sprite_1 = create_sprite(200, 200, 64)
+        large_sprite_2 = create_sprite(210, 210, 64)
+        self.collisions.add(large_sprite_1)
+        self.collisions.add(large_sprite_2)
+
+        # when
+        entered, stayed, exited = self.collisions.step()
+
+        # then
+        self.assertEqual(2, len(entered))
+        self.assertIn((large_sprite_1, large_sprite_2), entered)
+
+    def test_should_respect_layers_and_masks(self):
+        # given
+        self.collisions.add(self.sprite_1, layer=0b01, mask=0b10)
+        self.collisions.add(self.sprite_2, layer=0b01, mask=0b10)
+
+        # when
+        entered, stayed, exited = self.collisions.step()
+
+        # then
+        self.assertEqual([], entered)
+
+    def test_should_not_collide_inactive_sprites(self):
+        # given
+        self.sprite_2.is_active = False
+
+        # when
+        entered, stayed, exited = self.collisions.step()
+
+        # then
+        self.assertEqual([], entered)
+
+    def test_should_report_exit_after_discarding_sprite(self):
+        # given
+        self.collisions.step()
+
+        # when
+        self.collisions.discard(self.sprite_2)
+        entered, stayed, exited = self.collisions.step()
+
+        # then
+        self.assertEqual([(self.sprite_1, self.sprite_2)], exited)
+        self.assertEqual([], self.collisions.get_contacts(self.sprite_1))
+
+    def test_should_get_contacts(self):
+        # when
+        self.collisions.step()
+
+        # then
+        self.assertEqual([self.sprite_2], self.collisions.get_contacts(self.sprite_1))
+        self.assertEqual([self.sprite_1], self.collisions.get_contacts(self.sprite_2))
+
+    def test_should_skip_pairs_not_touching_by_mask(self):
+        # given
+        self.sprite_1.image = Surface((10, 10), pygame.SRCALPHA)
+        self.sprite_1.use_mask = True
+
+        # when
+        entered, stayed, exited = self.collisions.step()
+
+        # then
+        self.assertEqual([], entered)
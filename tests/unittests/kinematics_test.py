@@ -0,0 +1,93 @@
+from unittest import TestCase, skipIf
+
+from pygame import Rect
+
+from xpgext.kinematics import KinematicsSystem, numpy
+from xpgext.sprite import XPGESprite
+
+
+def create_sprite(x, y):
+    sprite = XPGESprite(None)
+    sprite.rect.update(x, y, 10, 10)
+    return sprite
+
+
+@skipIf(numpy is None, "NumPy is not installed")
+class KinematicsSystemTest(TestCase):
+    """Test class for KinematicsSystem class."""
+
+    def setUp(self):
+        self.kinematics = KinematicsSystem(time_step=0.5)
+
+    def test_should_move_sprites_by_velocity_and_acceleration(self):
+        # given
+        sprite_1 = create_sprite(0, 0)
+        sprite_2 = create_sprite(100, 100)
+        self.kinematics.add(sprite_1, velocity=(10, 0))
+        self.kinematics.add(sprite_2, acceleration=(0, 8))
+
+        # when
+        self.kinematics.step()
+        self.kinematics.step()
+
+        # then
+        self.assertEqual((10, 0), sprite_1.rect.topleft)
+        self.assertEqual((100, 106), sprite_2.rect.topleft)
+        self.assertEqual((0, 8), self.kinematics.get_velocity(sprite_2))
+
+    def test_should_keep_subpixel_position(self):
+        # given
+        sprite = create_sprite(0, 0)
+        self.kinematics.add(sprite, velocity=(1, 0))
+
+        # when
+        moved_after_one_step = self.kinematics.step()
+        position_after_one_step = sprite.rect.topleft
+        moved_after_two_steps = self.kinematics.step()
+
+        # then
+        self.assertEqual([], moved_after_one_step)
+        self.assertEqual([sprite], moved_after_two_steps)
+        self.assertEqual((0, 0), position_after_one_step)
+        self.assertEqual((1, 0), sprite.rect.topleft)
+        self.assertEqual((1, 0), self.kinematics.get_position(sprite))
+
+    def test_should_swap_last_sprite_into_removed_place(self):
+        # given
+        sprites = [create_sprite(index, 0) for index in range(3)]
+        for index, sprite in enumerate(sprites):
+            self.kinematics.add(sprite, velocity=(index, 0))
+
+        # when
+        self.kinematics.discard(sprites[0])
+
+        # then
+        self.assertEqual([sprites[2], sprites[1]], list(self.kinematics))
+        self.assertEqual((2, 0), self.kinematics.get_velocity(sprites[2]))
+        self.assertNotIn(sprites[0], self.kinematics)
+
+    def test_should_grow_beyond_initial_capacity(self):
+        # given
+        sprites = [create_sprite(0, 0) for _ in range(1000)]
+
+        # when
+        for sprite in sprites:
+            self.kinematics.add(sprite, velocity=(2, 0))
+        self.kinematics.step()
+
+        # then
+        self.assertEqual(1000, len(self.kinematics))
+        self.assertTrue(all(sprite.rect.x == 1 for sprite in sprites))
+
+    def test_should_take_position_from_moved_rect(self):
+        # given
+        sprite = create_sprite(0, 0)
+        self.kinematics.add(sprite, velocity=(2, 0))
+        sprite.rect.topleft = (50, 50)
+
+        # when
+        self.kinematics.sync(sprite)
+        self.kinematics.step()
+
+        # then
+        self.assertEqual(Rect(51, 50, 10, 10), sprite.rect)
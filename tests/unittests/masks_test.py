@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+import pygame
+from pygame import Surface, Rect
+
+from xpgext.masks import MaskCache
+
+
+class MaskCacheTest(TestCase):
+    """Test class for MaskCache class."""
+
+    def setUp(self):
+        self.mask_cache = MaskCache()
+        self.image = Surface((16, 16), pygame.SRCALPHA)
+        self.image.fill((255, 255, 255, 255), Rect(0, 0, 8, 16))
+
+    def test_should_compute_mask_once(self):
+        # when
+        mask_1 = self.mask_cache.get(self.image)
+        mask_2 = self.mask_cache.get(self.image)
+
+        # then
+        self.assertIs(mask_1, mask_2)
+        self.assertEqual(128, mask_1.count())
+        self.assertEqual(1, self.mask_cache.hits)
+        self.assertEqual(1, self.mask_cache.misses)
+
+    def test_should_compute_mask_of_area(self):
+        # when
+        mask = self.mask_cache.get(self.image, Rect(4, 0, 8, 8))
+
+        # then
+        self.assertEqual((8, 8), mask.get_size())
+        self.assertEqual(32, mask.count())
+
+    def test_should_evict_least_recently_used_masks(self):
+        # given
+        self.mask_cache.memory_budget = 2 * 16 + 16
+        other_image = Surface((16, 16), pygame.SRCALPHA)
+
+        # when
+        mask = self.mask_cache.get(self.image)
+        self.mask_cache.get(other_image)
+
+        # then
+        self.assertEqual(1, len(self.mask_cache))
+        self.assertIsNot(mask, self.mask_cache.get(self.image))
+
+    def test_should_not_keep_image_alive(self):
+        # given
+        image = Surface((16, 16))
+        self.mask_cache.get(image)
+
+        # when
+        del image
+
+        # then
+        self.assertEqual(0, len(self.mask_cache))
+        self.assertEqual(0, self.mask_cache.memory_usage)
+
+    def test_should_discard_masks_of_image(self):
+        # given
+        other_image = Surface((16, 16), pygame.SRCALPHA)
+        mask = self.mask_cache.get(self.image)
+        self.mask_cache.get(self.image, Rect(0, 0, 8, 8))
+        self.mask_cache.get(other_image)
+        self.image.fill((255, 255, 255, 255))
+
+        # when
+        self.mask_cache.discard(self.image)
+
+        # then
+        self.assertEqual(1, len(self.mask_cache))
+        self.assertEqual(2 * 16, self.mask_cache.memory_usage)
+        self.assertIsNot(mask, self.mask_cache.get(self.image))
+        self.assertEqual(256, self.mask_cache.get(self.image).count())
@@ -0,0 +1,113 @@
+from unittest import TestCase, skipIf
+from unittest.mock import Mock
+
+from pygame import Surface, Rect
+
+from xpgext.particles import ParticleEmitter, numpy
+from xpgext.rendering import DirtyRectRenderer
+
+RED = (255, 0, 0)
+
+
+@skipIf(numpy is None, "NumPy is not installed")
+class ParticleEmitterTest(TestCase):
+    """Test class for ParticleEmitter class."""
+
+    def setUp(self):
+        self.emitter = ParticleEmitter(Mock(), capacity=100)
+
+    def test_should_emit_particles_up_to_capacity(self):
+        # when
+        created_1 = self.emitter.emit(60, (10, 10))
+        created_2 = self.emitter.emit(60, (10, 10))
+
+        # then
+        self.assertEqual(60, created_1)
+        self.assertEqual(40, created_2)
+        self.assertEqual(100, self.emitter.count)
+
+    def test_should_update_rect_on_emission(self):
+        # when
+        self.emitter.emit(1, (10, 20))
+
+        # then
+        self.assertEqual(Rect(10, 20, 1, 1), self.emitter.rect)
+        self.assertTrue(self.emitter.dirty)
+
+    def test_should_be_redrawn_by_dirty_rect_renderer_while_particles_change(self):
+        # given
+        renderer = DirtyRectRenderer()
+        surface = Surface((20, 20))
+        self.emitter.emit(1, (5, 5), lifetime=10, colour=RED)
+        renderer.draw(surface, [self.emitter])
+        renderer.draw(surface, [self.emitter])
+
+        # when
+        self.emitter.step(0.01)
+        dirty_rects = renderer.draw(surface, [self.emitter])
+
+        # then
+        self.assertEqual([Rect(5, 5, 1, 1), Rect(5, 5, 1, 1)], dirty_rects)
+
+    def test_should_integrate_particles(self):
+        # given
+        self.emitter.gravity = (0, 10)
+        self.emitter.emit(2, (10, 10), velocity=(5, 0), lifetime=5)
+
+        # when
+        self.emitter.step(1)
+
+        # then
+        numpy.testing.assert_allclose([[15, 20], [15, 20]], self.emitter.positions)
+        numpy.testing.assert_allclose([[5, 10], [5, 10]], self.emitter.velocities)
+        self.assertEqual(Rect(15, 20, 1, 1), self.emitter.rect)
+
+    def test_should_remove_expired_particles(self):
+        # given
+        self.emitter.emit(3, (0, 0), lifetime=1, colour=(1, 1, 1))
+        self.emitter.emit(2, (0, 0), lifetime=3, colour=RED)
+
+        # when
+        self.emitter.step(2)
+
+        # then
+        self.assertEqual(2, self.emitter.count)
+        numpy.testing.assert_array_equal([RED, RED], self.emitter.colours)
+
+    def test_should_draw_particles_within_clip(self):
+        # given
+        self.emitter.particle_size = 2
+        self.emitter.emit(1, (4, 4), colour=RED)
+        self.emitter.emit(1, (-5, 4), colour=RED)
+        surface = Surface((20, 20))
+
+        # when
+        self.emitter.draw(surface, (10, 0))
+
+        # then
+        self.assertEqual(RED + (255,), surface.get_at((14, 4)))
+        self.assertEqual(RED + (255,), surface.get_at((15, 5)))
+        self.assertEqual(RED + (255,), surface.get_at((5, 4)))
+        self.assertEqual((0, 0, 0, 255), surface.get_at((16, 6)))
+
+    def test_should_advance_by_time_step_of_scene_manager(self):
+        # given
+        emitter = ParticleEmitter(Mock(time_step=0.5), capacity=100)
+        emitter.emit(1, (0, 0), velocity=(60, 0), lifetime=1)
+
+        # when
+        emitter.update()
+
+        # then
+        numpy.testing.assert_allclose([[30, 0]], emitter.positions)
+
+    def test_should_not_simulate_when_inactive(self):
+        # given
+        self.emitter.emit(1, (0, 0), velocity=(60, 0))
+        self.emitter.is_active = False
+
+        # when
+        self.emitter.update()
+
+        # then
+        numpy.testing.assert_allclose([[0, 0]], self.emitter.positions)
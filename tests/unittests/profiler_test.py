@@ -0,0 +1,94 @@
+import csv
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import Mock
+
+from xpgext.profiler import FrameProfiler
+from xpgext.sprite import SpriteBehaviour
+
+
+class TestComponent(SpriteBehaviour):
+
+    def on_update(self):
+        return 1
+
+
+class FrameProfilerTest(TestCase):
+    """Test class for FrameProfiler class."""
+
+    def setUp(self):
+        self.profiler = FrameProfiler()
+        self.profiler.begin_frame()
+        self.profiler.begin_phase("update")
+        self.profiler.end_phase()
+        self.profiler.begin_phase("draw")
+        self.profiler.end_phase()
+        self.profiler.call_hook(TestComponent(Mock()), "on_update")
+        self.profiler.call_hook(TestComponent(Mock()), "on_update")
+
+    def test_should_record_phases(self):
+        # then
+        self.assertEqual(1, self.profiler.frame_count)
+        self.assertEqual(["update", "draw"], [phase[1] for phase in self.profiler.phases])
+        self.assertEqual([0, 0], [phase[0] for phase in self.profiler.phases])
+
+    def test_should_record_hook_times_per_component_type(self):
+        # when
+        hook_times = self.profiler.hook_times
+
+        # then
+        self.assertEqual(["TestComponent.on_update"], list(hook_times.keys()))
+        self.assertEqual(2, hook_times["TestComponent.on_update"][0])
+
+    def test_should_return_value_of_hook(self):
+        # when
+        result = self.profiler.call_hook(TestComponent(Mock()), "on_update")
+
+        # then
+        self.assertEqual(1, result)
+
+    def test_should_reset(self):
+        # when
+        self.profiler.reset()
+
+        # then
+        self.assertEqual(0, self.profiler.frame_count)
+        self.assertEqual([], self.profiler.phases)
+        self.assertEqual(dict(), self.profiler.hook_times)
+
+    def test_should_export_csv(self):
+        with TemporaryDirectory() as directory:
+            # given
+            phases_path = os.path.join(directory, "phases.csv")
+            hooks_path = os.path.join(directory, "hooks.csv")
+
+            # when
+            self.profiler.export_csv(phases_path)
+            self.profiler.export_hooks_csv(hooks_path)
+
+            # then
+            with open(phases_path, newline="") as file:
+                phase_rows = list(csv.reader(file))
+            with open(hooks_path, newline="") as file:
+                hook_rows = list(csv.reader(file))
+            self.assertEqual(["frame", "phase", "start_ms", "duration_ms"], phase_rows[0])
+            self.assertEqual(3, len(phase_rows))
+            self.assertEqual(["TestComponent.on_update", "2"], hook_rows[1][:2])
+
+    def test_should_export_chrome_trace(self):
+        with TemporaryDirectory() as directory:
+            # given
+            path = os.path.join(directory, "trace.json")
+
+            # when
+            self.profiler.export_chrome_trace(path)
+
+            # then
+            with open(path) as file:
+                trace = json.load(file)
+            events = trace["traceEvents"]
+            self.assertEqual(["update", "draw", "hook totals"], [event["name"] for event in events])
+            self.assertEqual("X", events[0]["ph"])
+            self.assertIn("TestComponent.on_update", events[2]["args"])
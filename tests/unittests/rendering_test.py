@@ -0,0 +1,190 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from pygame import Surface, Rect
+
+from xpgext.rendering import DirtyRectRenderer, draw_sprites, BLIT_BATCH_SIZE
+from xpgext.sprite import XPGESprite
+
+SURFACE_SIZE = (400, 400)
+SPRITE_SIZE = (10, 10)
+
+
+class DirtyRectRendererTest(TestCase):
+    """Test class for DirtyRectRenderer class."""
+
+    def setUp(self):
+        self.surface = Surface(SURFACE_SIZE)
+        self.renderer = DirtyRectRenderer()
+        self.sprite_1 = XPGESprite(None)
+        self.sprite_1.image = Surface(SPRITE_SIZE)
+        self.sprite_1.image.fill((255, 0, 0))
+        self.sprite_1.position = (0, 0)
+        self.sprite_2 = XPGESprite(None)
+        self.sprite_2.image = Surface(SPRITE_SIZE)
+        self.sprite_2.image.fill((0, 255, 0))
+        self.sprite_2.position = (100, 100)
+        self.sprites = [self.sprite_1, self.sprite_2]
+
+    def test_should_redraw_everything_on_first_frame(self):
+        # when
+        result = self.renderer.draw(self.surface, self.sprites)
+
+        # then
+        self.assertIsNone(result)
+        self.assertEqual((255, 0, 0, 255), self.surface.get_at((5, 5)))
+        self.assertEqual((0, 255, 0, 255), self.surface.get_at((105, 105)))
+
+    def test_should_return_no_rects_when_nothing_changed(self):
+        # given
+        self.renderer.draw(self.surface, self.sprites)
+
+        # when
+        result = self.renderer.draw(self.surface, self.sprites)
+
+        # then
+        self.assertEqual([], result)
+
+    def test_should_return_previous_and_current_rect_of_moved_sprite(self):
+        # given
+        self.renderer.draw(self.surface, self.sprites)
+
+        # when
+        self.sprite_1.position = (50, 50)
+        result = self.renderer.draw(self.surface, self.sprites)
+
+        # then
+        self.assertEqual([Rect(0, 0, 10, 10), Rect(50, 50, 10, 10)], result)
+        self.assertEqual((0, 0, 0, 255), self.surface.get_at((5, 5)))
+        self.assertEqual((255, 0, 0, 255), self.surface.get_at((55, 55)))
+
+    def test_should_redraw_sprite_marked_as_dirty(self):
+        # given
+        self.renderer.draw(self.surface, self.sprites)
+
+        # when
+        self.sprite_2.image.fill((0, 0, 255))
+        self.sprite_2.dirty = True
+        result = self.renderer.draw(self.surface, self.sprites)
+
+        # then
+        self.assertEqual([Rect(100, 100, 10, 10), Rect(100, 100, 10, 10)], result)
+        self.assertEqual((0, 0, 255, 255), self.surface.get_at((105, 105)))
+        self.assertFalse(self.sprite_2.dirty)
+
+    def test_should_clear_rect_of_removed_sprite(self):
+        # given
+        self.renderer.draw(self.surface, self.sprites)
+
+        # when
+        result = self.renderer.draw(self.surface, [self.sprite_1])
+
+        # then
+        self.assertEqual([Rect(100, 100, 10, 10)], result)
+        self.assertEqual((0, 0, 0, 255), self.surface.get_at((105, 105)))
+
+    def test_should_redraw_everything_when_too_much_is_dirty(self):
+        # given
+        self.renderer.draw(self.surface, self.sprites)
+        self.sprite_1.image = Surface((300, 300))
+
+        # when
+        result = self.renderer.draw(self.surface, self.sprites)
+
+        # then
+        self.assertIsNone(result)
+
+
+class DrawSpritesTest(TestCase):
+    """Test class for draw_sprites function."""
+
+    def test_should_blit_sprites_in_one_batch(self):
+        # given
+        sprite_1 = XPGESprite(None)
+        sprite_1.image = Surface(SPRITE_SIZE)
+        sprite_2 = XPGESprite(None)
+        sprite_2.image = Surface(SPRITE_SIZE)
+        sprite_2.position = (20, 20)
+        surface = Mock(spec=Surface)
+        blitted = list()
+        surface.blits = Mock(side_effect=lambda sequence, doreturn: blitted.append(list(sequence)))
+        batch = list()
+
+        # when
+        draw_sprites(surface, [sprite_1, sprite_2], batch)
+
+        # then
+        self.assertEqual([[(sprite_1.image, sprite_1.rect), (sprite_2.image, sprite_2.rect)]], blitted)
+        surface.blit.assert_not_called()
+        self.assertEqual([], batch)
+
+    def test_should_flush_batch_after_blit_batch_size_sprites(self):
+        # given
+        image = Surface(SPRITE_SIZE)
+        sprites = list()
+        for _ in range(BLIT_BATCH_SIZE + 1):
+            sprite = XPGESprite(None)
+            sprite.image = image
+            sprites.append(sprite)
+        surface = Mock(spec=Surface)
+        batch_sizes = list()
+        surface.blits = Mock(side_effect=lambda sequence, doreturn: batch_sizes.append(len(sequence)))
+
+        # when
+        draw_sprites(surface, sprites)
+
+        # then
+        self.assertEqual([BLIT_BATCH_SIZE, 1], batch_sizes)
+
+    def test_should_blit_areas_of_sprites_drawn_from_atlas(self):
+        # given
+        page = Surface((64, 64))
+        sprite = XPGESprite(None)
+        sprite.image = page
+        sprite.area = Rect(16, 0, 8, 8)
+        surface = Mock(spec=Surface)
+        blitted = list()
+        surface.blits = Mock(side_effect=lambda sequence, doreturn: blitted.append(list(sequence)))
+
+        # when
+        draw_sprites(surface, [sprite])
+
+        # then
+        self.assertEqual([[(page, sprite.rect, Rect(16, 0, 8, 8))]], blitted)
+
+    def test_should_skip_inactive_sprites(self):
+        # given
+        sprite = XPGESprite(None)
+        sprite.image = Surface(SPRITE_SIZE)
+        sprite.is_active = False
+        surface = Mock(spec=Surface)
+
+        # when
+        draw_sprites(surface, [sprite])
+
+        # then
+        surface.blits.assert_not_called()
+
+    def test_should_keep_order_of_sprites_with_custom_draw(self):
+        # given
+        class CustomSprite(XPGESprite):
+
+            def draw(self, surface):
+                surface.fill((0, 255, 0), self.rect)
+
+        sprite_1 = XPGESprite(None)
+        sprite_1.image = Surface(SPRITE_SIZE)
+        sprite_1.image.fill((255, 0, 0))
+        sprite_2 = CustomSprite(None)
+        sprite_2.image = Surface(SPRITE_SIZE)
+        sprite_3 = XPGESprite(None)
+        sprite_3.image = Surface((5, 5))
+        sprite_3.image.fill((0, 0, 255))
+        surface = Surface(SURFACE_SIZE)
+
+        # when
+        draw_sprites(surface, [sprite_1, sprite_2, sprite_3])
+
+        # then
+        self.assertEqual((0, 0, 255, 255), surface.get_at((2, 2)))
+        self.assertEqual((0, 255, 0, 255), surface.get_at((7, 7)))
@@ -1,12 +1,20 @@
-from unittest import TestCase
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipIf
 from unittest.mock import Mock, MagicMock
 
-from pygame import Surface, Rect
+import pygame
+from pygame import Surface, Rect, MOUSEMOTION, MOUSEBUTTONUP, KEYDOWN, USEREVENT
 from pygame.event import Event
 
+from xpgext.camera import Camera
+from xpgext.collision import CollisionSystem
+from xpgext.kinematics import KinematicsSystem, numpy
 from xpgext.scene_manager import SimpleSceneManager, SceneLoadingError, SceneRegisteringError
+from xpgext.profiler import FrameProfiler
+from xpgext.rendering import DirtyRectRenderer
 from xpgext.scene import SimpleScene
-from xpgext.sprite import XPGESprite, SpriteBehaviour
+from xpgext.sprite import XPGESprite, SpriteBehaviour, CompactSprite, CompactBehaviour
 
 
 class SimpleSceneManagerTest(TestCase):
@@ -86,9 +94,9 @@ class SimpleSceneManagerTest(TestCase):
     def test_should_draw_scene(self):
         # given
         simple_scene_manager = SimpleSceneManager()
-        test_sprite_1 = Mock(spec=XPGESprite)
-        test_sprite_2 = Mock(spec=XPGESprite)
-        test_sprite_3 = Mock(spec=XPGESprite)
+        test_sprite_1 = Mock(spec=XPGESprite, layer=0, depth=0)
+        test_sprite_2 = Mock(spec=XPGESprite, layer=0, depth=0)
+        test_sprite_3 = Mock(spec=XPGESprite, layer=0, depth=0)
         sprite_list = [test_sprite_1, test_sprite_2, test_sprite_3]
         simple_scene_manager._sprites = sprite_list
         surface = Mock(spec=Surface)
@@ -105,11 +113,11 @@ class SimpleSceneManagerTest(TestCase):
     def test_should_handle_event(self):
         # given
         simple_scene_manager = SimpleSceneManager()
-        test_sprite_1 = Mock(spec=XPGESprite)
+        test_sprite_1 = Mock(spec=XPGESprite, layer=0, depth=0)
         test_sprite_1.handle_event = Mock(return_value=False)
-        test_sprite_2 = Mock(spec=XPGESprite)
+        test_sprite_2 = Mock(spec=XPGESprite, layer=0, depth=0)
         test_sprite_2.handle_event = Mock(return_value=False)
-        test_sprite_3 = Mock(spec=XPGESprite)
+        test_sprite_3 = Mock(spec=XPGESprite, layer=0, depth=0)
         test_sprite_3.handle_event = Mock(return_value=False)
         sprite_list = [test_sprite_1, test_sprite_2, test_sprite_3]
         simple_scene_manager._sprites = sprite_list
@@ -126,11 +134,11 @@ class SimpleSceneManagerTest(TestCase):
     def test_should_stop_iteration_while_handling_event(self):
         # given
         simple_scene_manager = SimpleSceneManager()
-        test_sprite_1 = Mock(spec=XPGESprite)
+        test_sprite_1 = Mock(spec=XPGESprite, layer=0, depth=0)
         test_sprite_1.handle_event = Mock(return_value=False)
-        test_sprite_2 = Mock(spec=XPGESprite)
+        test_sprite_2 = Mock(spec=XPGESprite, layer=0, depth=0)
         test_sprite_2.handle_event = Mock(return_value=True)
-        test_sprite_3 = Mock(spec=XPGESprite)
+        test_sprite_3 = Mock(spec=XPGESprite, layer=0, depth=0)
         test_sprite_3.handle_event = Mock(return_value=False)
         sprite_list = [test_sprite_1, test_sprite_2, test_sprite_3]
         simple_scene_manager._sprites = sprite_list
@@ -140,16 +148,16 @@ class SimpleSceneManagerTest(TestCase):
         simple_scene_manager.handle_event(event)
 
         # then
-        test_sprite_1.handle_event.assert_not_called()
+        test_sprite_1.handle_event.assert_called_once_with(event)
         test_sprite_2.handle_event.assert_called_once_with(event)
-        test_sprite_3.handle_event.assert_called_once_with(event)
+        test_sprite_3.handle_event.assert_not_called()
 
     def test_should_update(self):
         # given
         simple_scene_manager = SimpleSceneManager()
-        test_sprite_1 = Mock(spec=XPGESprite)
-        test_sprite_2 = Mock(spec=XPGESprite)
-        test_sprite_3 = Mock(spec=XPGESprite)
+        test_sprite_1 = Mock(spec=XPGESprite, layer=0, depth=0)
+        test_sprite_2 = Mock(spec=XPGESprite, layer=0, depth=0)
+        test_sprite_3 = Mock(spec=XPGESprite, layer=0, depth=0)
         sprite_list = [test_sprite_1, test_sprite_2, test_sprite_3]
         simple_scene_manager._sprites = sprite_list
 
@@ -168,8 +176,8 @@ class SimpleSceneManagerTest(TestCase):
         test_sprite_1.name = "test_name"
         test_sprite_2 = XPGESprite(simple_scene_manager)
         test_sprite_3 = XPGESprite(simple_scene_manager)
-        sprite_list = [test_sprite_1, test_sprite_2, test_sprite_3]
-        simple_scene_manager._sprites = sprite_list
+        for sprite in (test_sprite_1, test_sprite_2, test_sprite_3):
+            simple_scene_manager.spawn(sprite)
 
         # when
         result = simple_scene_manager.find_by_name("test_name")
@@ -179,6 +187,35 @@ class SimpleSceneManagerTest(TestCase):
         self.assertEqual(1, len(result))
         self.assertIn(test_sprite_1, result)
 
+    def test_should_find_children_of_sprites_overriding_find_by_name(self):
+        # given
+        class ContainerSprite(XPGESprite):
+            def __init__(self, scene_manager, child):
+                super().__init__(scene_manager)
+                self.child = child
+
+            def find_by_name(self, name):
+                return super().find_by_name(name) + self.child.find_by_name(name)
+
+        simple_scene_manager = SimpleSceneManager()
+        first_sprite = XPGESprite(simple_scene_manager)
+        first_sprite.name = "test_name"
+        child = XPGESprite(simple_scene_manager)
+        child.name = "test_name"
+        container = ContainerSprite(simple_scene_manager, child)
+        container.name = "container"
+        last_sprite = XPGESprite(simple_scene_manager)
+        last_sprite.name = "test_name"
+        simple_scene_manager.spawn_many([first_sprite, container, last_sprite])
+
+        # when
+        result = simple_scene_manager.find_by_name("test_name")
+
+        # then
+        self.assertEqual([first_sprite, child, last_sprite], result)
+        self.assertIs(container, simple_scene_manager.get_by_name("container"))
+        self.assertEqual([], simple_scene_manager.find_by_name("other_name"))
+
     def test_should_return_empty_list_when_calling_find_by_name(self):
         # given
         simple_scene_manager = SimpleSceneManager()
@@ -186,8 +223,8 @@ class SimpleSceneManagerTest(TestCase):
         test_sprite_1.name = "test_name_2"
         test_sprite_2 = XPGESprite(simple_scene_manager)
         test_sprite_3 = XPGESprite(simple_scene_manager)
-        sprite_list = [test_sprite_1, test_sprite_2, test_sprite_3]
-        simple_scene_manager._sprites = sprite_list
+        for sprite in (test_sprite_1, test_sprite_2, test_sprite_3):
+            simple_scene_manager.spawn(sprite)
 
         # when
         result = simple_scene_manager.find_by_name("test_name")
@@ -203,8 +240,8 @@ class SimpleSceneManagerTest(TestCase):
         test_sprite_1.name = "test_name"
         test_sprite_2 = XPGESprite(simple_scene_manager)
         test_sprite_3 = XPGESprite(simple_scene_manager)
-        sprite_list = [test_sprite_1, test_sprite_2, test_sprite_3]
-        simple_scene_manager._sprites = sprite_list
+        for sprite in (test_sprite_1, test_sprite_2, test_sprite_3):
+            simple_scene_manager.spawn(sprite)
 
         # when
         result = simple_scene_manager.get_by_name("test_name")
@@ -220,8 +257,8 @@ class SimpleSceneManagerTest(TestCase):
         test_sprite_1.name = "test_name_2"
         test_sprite_2 = XPGESprite(simple_scene_manager)
         test_sprite_3 = XPGESprite(simple_scene_manager)
-        sprite_list = [test_sprite_1, test_sprite_2, test_sprite_3]
-        simple_scene_manager._sprites = sprite_list
+        for sprite in (test_sprite_1, test_sprite_2, test_sprite_3):
+            simple_scene_manager.spawn(sprite)
 
         # when
         result = simple_scene_manager.get_by_name("test_name")
@@ -266,11 +303,10 @@ class SimpleSceneManagerTest(TestCase):
 
         test_sprite = XPGESprite(simple_scene_manager)
         test_sprite.name = "test sprite"
+        simple_scene_manager.spawn(test_sprite)
         mock_component = Mock(spec=SpriteBehaviour)
         test_sprite.components.append(mock_component)
 
-        simple_scene_manager._sprites.append(test_sprite)
-
         # when then
         with self.assertRaises(ValueError):
             simple_scene_manager.spawn(test_sprite)
@@ -283,11 +319,10 @@ class SimpleSceneManagerTest(TestCase):
 
         test_sprite = XPGESprite(simple_scene_manager)
         test_sprite.name = "test sprite"
+        simple_scene_manager.spawn(test_sprite)
         mock_component = Mock(spec=SpriteBehaviour)
         test_sprite.components.append(mock_component)
 
-        simple_scene_manager._sprites.append(test_sprite)
-
         # when
         simple_scene_manager.kill(test_sprite)
 
@@ -309,3 +344,949 @@ class SimpleSceneManagerTest(TestCase):
             simple_scene_manager.kill(test_sprite)
 
         mock_component.on_kill.assert_not_called()
+
+    def test_should_draw_scene_with_renderer(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        test_sprite_1 = Mock(spec=XPGESprite, layer=0, depth=0)
+        test_sprite_2 = Mock(spec=XPGESprite, layer=0, depth=0)
+        simple_scene_manager._sprites = [test_sprite_1, test_sprite_2]
+        simple_scene_manager.renderer = Mock(spec=DirtyRectRenderer)
+        simple_scene_manager.renderer.draw = Mock(return_value=[])
+        surface = Mock(spec=Surface)
+
+        # when
+        result = simple_scene_manager.draw(surface)
+
+        # then
+        self.assertEqual([], result)
+        surface.fill.assert_not_called()
+        simple_scene_manager.renderer.draw.assert_called_once_with(surface, [test_sprite_2, test_sprite_1])
+
+    def test_should_redraw_overlapping_sprites_with_renderer_after_swapping_layers(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.renderer = DirtyRectRenderer()
+        red_sprite = XPGESprite(simple_scene_manager)
+        red_sprite.image = Surface((10, 10))
+        red_sprite.image.fill((255, 0, 0))
+        red_sprite.layer = 1
+        blue_sprite = XPGESprite(simple_scene_manager)
+        blue_sprite.image = Surface((10, 10))
+        blue_sprite.image.fill((0, 0, 255))
+        simple_scene_manager.spawn_many([red_sprite, blue_sprite])
+        surface = Surface((100, 100))
+        simple_scene_manager.draw(surface)
+
+        # when
+        red_sprite.layer, blue_sprite.layer = blue_sprite.layer, red_sprite.layer
+        result = simple_scene_manager.draw(surface)
+
+        # then
+        self.assertIn(Rect(0, 0, 10, 10), result)
+        self.assertEqual((0, 0, 255, 255), tuple(surface.get_at((5, 5))))
+
+    def test_should_update_focus_of_spawned_sprites_on_mouse_motion(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        test_sprite_1 = XPGESprite(simple_scene_manager)
+        test_sprite_1.image = Surface((10, 10))
+        test_sprite_2 = XPGESprite(simple_scene_manager)
+        test_sprite_2.image = Surface((10, 10))
+        test_sprite_2.position = (100, 100)
+        mock_component = Mock(spec=SpriteBehaviour)
+        test_sprite_1.components.append(mock_component)
+        simple_scene_manager.spawn(test_sprite_1)
+        simple_scene_manager.spawn(test_sprite_2)
+
+        # when
+        simple_scene_manager.handle_event(Event(MOUSEMOTION, {'pos': (5, 5)}))
+        focus_inside = test_sprite_1.focus
+        simple_scene_manager.handle_event(Event(MOUSEMOTION, {'pos': (50, 50)}))
+
+        # then
+        self.assertTrue(focus_inside)
+        self.assertFalse(test_sprite_1.focus)
+        self.assertFalse(test_sprite_2.focus)
+        mock_component.on_hover.assert_called_once()
+        mock_component.on_hover_exit.assert_called_once()
+
+    def test_should_find_sprite_moved_directly_after_update(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        test_sprite = XPGESprite(simple_scene_manager)
+        test_sprite.image = Surface((10, 10))
+        simple_scene_manager.spawn(test_sprite)
+
+        # when
+        test_sprite.rect.topleft = (100, 100)
+        simple_scene_manager.update()
+        simple_scene_manager.handle_event(Event(MOUSEMOTION, {'pos': (105, 105)}))
+
+        # then
+        self.assertTrue(test_sprite.focus)
+
+    def test_should_find_static_sprite_moved_by_other_sprite(self):
+        # given
+        class ControllerComponent(SpriteBehaviour):
+            def on_update(self):
+                self.scene_manager.get_by_name("target").rect.move_ip(100, 100)
+
+        simple_scene_manager = SimpleSceneManager()
+        test_sprite = XPGESprite(simple_scene_manager)
+        test_sprite.image = Surface((10, 10))
+        test_sprite.name = "target"
+        controller_sprite = XPGESprite(simple_scene_manager)
+        controller_sprite.takes_focus = False
+        controller_sprite.components.append(ControllerComponent(controller_sprite))
+        simple_scene_manager.spawn_many([test_sprite, controller_sprite])
+        simple_scene_manager.handle_event(Event(MOUSEMOTION, {'pos': (50, 50)}))
+
+        # when
+        simple_scene_manager.update()
+        simple_scene_manager.handle_event(Event(MOUSEMOTION, {'pos': (105, 105)}))
+
+        # then
+        self.assertTrue(test_sprite.focus)
+        self.assertEqual(set(), simple_scene_manager._unsynced)
+
+    def test_should_update_only_sprites_with_update_hooks(self):
+        # given
+        class UpdateComponent(SpriteBehaviour):
+            def on_update(self):
+                pass
+
+        simple_scene_manager = SimpleSceneManager()
+        static_sprite = XPGESprite(simple_scene_manager)
+        updated_sprite = XPGESprite(simple_scene_manager)
+        simple_scene_manager.spawn_many([static_sprite, updated_sprite])
+        simple_scene_manager.update()
+
+        # when
+        updated_sprite.components.append(UpdateComponent(updated_sprite))
+        simple_scene_manager.update()
+
+        # then
+        self.assertEqual([updated_sprite], simple_scene_manager._get_updated_sprites())
+        self.assertEqual(set(), simple_scene_manager._unsynced)
+
+    def test_should_not_focus_sprite_that_does_not_take_focus(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        test_sprite = XPGESprite(simple_scene_manager)
+        test_sprite.image = Surface((10, 10))
+        simple_scene_manager.spawn(test_sprite)
+
+        # when
+        test_sprite.takes_focus = False
+        simple_scene_manager.handle_event(Event(MOUSEMOTION, {'pos': (5, 5)}))
+
+        # then
+        self.assertFalse(test_sprite.focus)
+
+    def test_should_find_sprites_by_name_in_spawn_order_after_renaming(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        test_sprite_1 = XPGESprite(simple_scene_manager)
+        test_sprite_1.name = "other_name"
+        test_sprite_2 = XPGESprite(simple_scene_manager)
+        test_sprite_2.name = "test_name"
+        simple_scene_manager.spawn(test_sprite_1)
+        simple_scene_manager.spawn(test_sprite_2)
+
+        # when
+        test_sprite_1.name = "test_name"
+        result = simple_scene_manager.find_by_name("test_name")
+
+        # then
+        self.assertEqual([test_sprite_1, test_sprite_2], result)
+        self.assertEqual([], simple_scene_manager.find_by_name("other_name"))
+
+    def test_should_not_find_sprite_by_name_after_killing(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        test_sprite = XPGESprite(simple_scene_manager)
+        test_sprite.name = "test_name"
+        simple_scene_manager.spawn(test_sprite)
+
+        # when
+        simple_scene_manager.kill(test_sprite)
+
+        # then
+        self.assertIsNone(simple_scene_manager.get_by_name("test_name"))
+
+    def test_should_handle_event_only_by_interested_sprites(self):
+        # given
+        class KeyDownComponent(SpriteBehaviour):
+            handled_event_types = (KEYDOWN,)
+
+            def on_handle_event(self, event):
+                return False
+
+        simple_scene_manager = SimpleSceneManager()
+        test_sprite_1 = XPGESprite(simple_scene_manager)
+        test_sprite_1.handle_event = Mock(return_value=False)
+        test_sprite_1.components.append(KeyDownComponent(test_sprite_1))
+        test_sprite_2 = XPGESprite(simple_scene_manager)
+        test_sprite_2.handle_event = Mock(return_value=False)
+        simple_scene_manager.spawn(test_sprite_1)
+        simple_scene_manager.spawn(test_sprite_2)
+        event = Event(KEYDOWN, {'key': 0})
+
+        # when
+        simple_scene_manager.handle_event(event)
+        simple_scene_manager.handle_event(Event(USEREVENT, dict()))
+
+        # then
+        test_sprite_1.handle_event.assert_called_once_with(event)
+        test_sprite_2.handle_event.assert_not_called()
+
+    def test_should_rebuild_dispatch_table_when_components_change(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        test_sprite = XPGESprite(simple_scene_manager)
+        test_sprite.handle_event = Mock(return_value=False)
+        simple_scene_manager.spawn(test_sprite)
+        simple_scene_manager.handle_event(Event(USEREVENT, dict()))
+
+        class EventComponent(SpriteBehaviour):
+
+            def on_handle_event(self, event):
+                return False
+
+        # when
+        test_sprite.components.append(EventComponent(test_sprite))
+        simple_scene_manager.handle_event(Event(USEREVENT, dict()))
+
+        # then
+        test_sprite.handle_event.assert_called_once()
+
+    def test_should_call_only_overridden_hooks_on_spawn_and_kill(self):
+        # given
+        class SpawnComponent(SpriteBehaviour):
+
+            def __init__(self, sprite):
+                super().__init__(sprite)
+                self.spawned = False
+
+            def on_spawn(self):
+                self.spawned = True
+
+        simple_scene_manager = SimpleSceneManager()
+        test_sprite = XPGESprite(simple_scene_manager)
+        spawn_component = SpawnComponent(test_sprite)
+        test_sprite.components.append(spawn_component)
+        test_sprite.components.append(SpriteBehaviour(test_sprite))
+
+        # when
+        simple_scene_manager.spawn(test_sprite)
+
+        # then
+        self.assertTrue(spawn_component.spawned)
+        self.assertEqual([spawn_component], test_sprite.components_with_hook("on_spawn"))
+        self.assertEqual([], test_sprite.components_with_hook("on_kill"))
+
+    def test_should_record_hook_times_in_profiler(self):
+        # given
+        class UpdateComponent(SpriteBehaviour):
+
+            def on_update(self):
+                pass
+
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.profiler = FrameProfiler()
+        test_sprite = XPGESprite(simple_scene_manager)
+        test_sprite.components.append(UpdateComponent(test_sprite))
+        simple_scene_manager.spawn(test_sprite)
+
+        # when
+        simple_scene_manager.update()
+        simple_scene_manager.update()
+
+        # then
+        self.assertEqual(2, simple_scene_manager.profiler.hook_times["UpdateComponent.on_update"][0])
+
+    def test_should_load_preloaded_scene_on_update(self):
+        with TemporaryDirectory() as directory:
+            # given
+            path = os.path.join(directory, "image.png")
+            pygame.image.save(Surface((16, 16)), path)
+
+            class PreloadedScene(SimpleScene):
+                preload_images = [(path, False, False)]
+
+                def __init__(self, scene_manager):
+                    super().__init__(scene_manager)
+                    self.image = scene_manager.assets.load_image(path, convert=False)
+
+            simple_scene_manager = SimpleSceneManager()
+            simple_scene_manager.register_scene(PreloadedScene, "test scene")
+
+            # when
+            simple_scene_manager.preload_scene("test scene")
+            preloading = simple_scene_manager.is_preloading
+            for future in [future for key, future in simple_scene_manager._preloaded_images]:
+                future.result(timeout=5)
+            progress = simple_scene_manager.preload_progress
+            simple_scene_manager.update()
+
+        # then
+        self.assertTrue(preloading)
+        self.assertEqual(1.0, progress)
+        self.assertFalse(simple_scene_manager.is_preloading)
+        self.assertIsInstance(simple_scene_manager._current_scene, PreloadedScene)
+        self.assertEqual(1, simple_scene_manager.assets.hits)
+        self.assertEqual(0, simple_scene_manager.assets.misses)
+
+    def test_should_not_preload_scene_when_not_registered(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+
+        # when then
+        with self.assertRaises(SceneLoadingError):
+            simple_scene_manager.preload_scene("test scene")
+
+    def test_should_cancel_preloading_when_loading_other_scene(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.register_scene(SimpleScene, "test scene 1")
+        simple_scene_manager.register_scene(SimpleScene, "test scene 2")
+        simple_scene_manager.preload_scene("test scene 1")
+
+        # when
+        simple_scene_manager.load_scene("test scene 2")
+
+        # then
+        self.assertFalse(simple_scene_manager.is_preloading)
+
+    def test_should_resume_suspended_scene(self):
+        # given
+        class LifecycleComponent(SpriteBehaviour):
+
+            def __init__(self, sprite):
+                super().__init__(sprite)
+                self.calls = list()
+
+            def on_scene_loaded(self):
+                self.calls.append("on_scene_loaded")
+
+            def on_suspend(self):
+                self.calls.append("on_suspend")
+
+            def on_resume(self):
+                self.calls.append("on_resume")
+
+        class TestSimpleScene(SimpleScene):
+
+            def __init__(self, scene_manager):
+                super().__init__(scene_manager)
+                sprite = XPGESprite(scene_manager)
+                sprite.name = "test sprite"
+                sprite.components.append(LifecycleComponent(sprite))
+                self.sprites.append(sprite)
+
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.scene_retention = 1
+        simple_scene_manager.register_scene(TestSimpleScene, "test scene 1")
+        simple_scene_manager.register_scene(SimpleScene, "test scene 2")
+        simple_scene_manager.load_scene("test scene 1")
+        scene = simple_scene_manager._current_scene
+        sprite = simple_scene_manager.get_by_name("test sprite")
+
+        # when
+        simple_scene_manager.load_scene("test scene 2")
+        sprite_in_other_scene = simple_scene_manager.get_by_name("test sprite")
+        simple_scene_manager.load_scene("test scene 1")
+
+        # then
+        self.assertIsNone(sprite_in_other_scene)
+        self.assertIs(scene, simple_scene_manager._current_scene)
+        self.assertIs(sprite, simple_scene_manager.get_by_name("test sprite"))
+        self.assertEqual(["on_scene_loaded", "on_suspend", "on_resume"],
+                         sprite.get_component_by_type(LifecycleComponent).calls)
+
+    def test_should_find_sprite_renamed_while_suspended_after_resuming(self):
+        # given
+        class RenamingComponent(SpriteBehaviour):
+            def on_suspend(self):
+                self.sprite.name = "new name"
+
+        class TestSimpleScene(SimpleScene):
+            def __init__(self, scene_manager):
+                super().__init__(scene_manager)
+                sprite = XPGESprite(scene_manager)
+                sprite.name = "old name"
+                sprite.components.append(RenamingComponent(sprite))
+                self.sprites.append(sprite)
+
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.scene_retention = 1
+        simple_scene_manager.register_scene(TestSimpleScene, "test scene 1")
+        simple_scene_manager.register_scene(SimpleScene, "test scene 2")
+        simple_scene_manager.load_scene("test scene 1")
+        sprite = simple_scene_manager.get_by_name("old name")
+
+        # when
+        simple_scene_manager.load_scene("test scene 2")
+        simple_scene_manager.load_scene("test scene 1")
+
+        # then
+        self.assertIsNone(simple_scene_manager.get_by_name("old name"))
+        self.assertIs(sprite, simple_scene_manager.get_by_name("new name"))
+
+    def test_should_discard_least_recently_suspended_scene(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.scene_retention = 1
+        for name in ("test scene 1", "test scene 2", "test scene 3"):
+            simple_scene_manager.register_scene(SimpleScene, name)
+            simple_scene_manager.load_scene(name)
+        scene_1 = simple_scene_manager._current_scene
+
+        # when
+        simple_scene_manager.load_scene("test scene 1")
+
+        # then
+        self.assertIsNot(scene_1, simple_scene_manager._current_scene)
+        self.assertEqual(["test scene 3"], list(simple_scene_manager._suspended_scenes.keys()))
+
+    def test_should_not_suspend_scene_when_retention_disabled(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.register_scene(SimpleScene, "test scene 1")
+        simple_scene_manager.register_scene(SimpleScene, "test scene 2")
+        simple_scene_manager.load_scene("test scene 1")
+        scene_1 = simple_scene_manager._current_scene
+
+        # when
+        simple_scene_manager.load_scene("test scene 2")
+        simple_scene_manager.load_scene("test scene 1")
+
+        # then
+        self.assertIsNot(scene_1, simple_scene_manager._current_scene)
+
+    def test_should_defer_spawn_and_kill_until_sprites_are_updated(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        spawned_sprite = XPGESprite(simple_scene_manager)
+        killed_sprite = XPGESprite(simple_scene_manager)
+        simple_scene_manager.spawn(killed_sprite)
+        sprites_during_update = list()
+
+        class SpawningComponent(SpriteBehaviour):
+
+            def on_update(self):
+                self.scene_manager.spawn(spawned_sprite)
+                self.scene_manager.kill(killed_sprite)
+                sprites_during_update.extend(self.scene_manager._sprites)
+
+        spawning_sprite = XPGESprite(simple_scene_manager)
+        spawning_sprite.components.append(SpawningComponent(spawning_sprite))
+        simple_scene_manager.spawn(spawning_sprite)
+
+        # when
+        simple_scene_manager.update()
+
+        # then
+        self.assertEqual([killed_sprite, spawning_sprite], sprites_during_update)
+        self.assertEqual([spawning_sprite, spawned_sprite], simple_scene_manager._sprites)
+
+    def test_should_cancel_deferred_spawn_when_killed(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        test_sprite = XPGESprite(simple_scene_manager)
+        mock_component = Mock(spec=SpriteBehaviour)
+        test_sprite.components.append(mock_component)
+        simple_scene_manager._iteration_depth = 1
+
+        # when
+        simple_scene_manager.spawn(test_sprite)
+        simple_scene_manager.kill(test_sprite)
+        simple_scene_manager._iteration_depth = 0
+        simple_scene_manager._apply_pending_changes()
+
+        # then
+        self.assertNotIn(test_sprite, simple_scene_manager._sprites)
+        mock_component.on_spawn.assert_not_called()
+        mock_component.on_kill.assert_not_called()
+
+    def test_should_spawn_and_kill_many_sprites(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        sprites = [XPGESprite(simple_scene_manager) for _ in range(5)]
+
+        # when
+        simple_scene_manager.spawn_many(sprites)
+        simple_scene_manager.kill_many(sprites[1:4])
+
+        # then
+        self.assertEqual([sprites[0], sprites[4]], simple_scene_manager._sprites)
+
+    def test_should_compact_sprites_once_half_of_them_are_killed(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        sprites = [XPGESprite(simple_scene_manager) for _ in range(4)]
+        simple_scene_manager.spawn_many(sprites)
+
+        # when
+        simple_scene_manager.kill(sprites[1])
+        sprites_after_one_kill = list(simple_scene_manager._sprites)
+        simple_scene_manager.kill(sprites[2])
+
+        # then
+        self.assertEqual([sprites[0], None, sprites[2], sprites[3]], sprites_after_one_kill)
+        self.assertEqual([sprites[0], sprites[3]], simple_scene_manager._sprites)
+        self.assertEqual({sprites[0]: 0, sprites[3]: 1}, simple_scene_manager._sprite_indexes)
+
+    def test_should_update_and_draw_sprites_after_kill(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        sprites = [XPGESprite(simple_scene_manager) for _ in range(3)]
+        for sprite in sprites:
+            sprite.components.append(Mock(spec=SpriteBehaviour))
+        simple_scene_manager.spawn_many(sprites)
+
+        # when
+        simple_scene_manager.kill(sprites[1])
+        simple_scene_manager.update()
+
+        # then
+        self.assertEqual([sprites[2], sprites[0]], simple_scene_manager._get_draw_order())
+        sprites[0].components[0].on_update.assert_called_once()
+        sprites[1].components[0].on_update.assert_not_called()
+
+    def test_should_not_spawn_any_sprite_when_one_is_alive(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        sprites = [XPGESprite(simple_scene_manager) for _ in range(3)]
+        simple_scene_manager.spawn(sprites[2])
+
+        # when then
+        with self.assertRaises(ValueError):
+            simple_scene_manager.spawn_many(sprites)
+        self.assertEqual([sprites[2]], simple_scene_manager._sprites)
+
+    def test_should_draw_sprites_by_layer_and_depth(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        sprites = [XPGESprite(simple_scene_manager) for _ in range(4)]
+        for sprite in sprites:
+            sprite.image = Surface((1, 1))
+        sprites[0].layer = 1
+        sprites[1].depth = 5
+        simple_scene_manager.spawn_many(sprites)
+
+        # when
+        draw_order = list(simple_scene_manager._get_draw_order())
+
+        # then
+        self.assertEqual([sprites[3], sprites[2], sprites[1], sprites[0]], draw_order)
+
+    def test_should_reposition_sprite_when_depth_changes(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        sprites = [XPGESprite(simple_scene_manager) for _ in range(3)]
+        for depth, sprite in enumerate(sprites):
+            sprite.depth = depth
+        simple_scene_manager.spawn_many(sprites)
+        simple_scene_manager._get_draw_order()
+
+        # when
+        sprites[0].depth = 10
+        sprites[2].layer = -1
+        simple_scene_manager.kill(sprites[1])
+        new_sprite = XPGESprite(simple_scene_manager)
+        new_sprite.depth = 5
+        simple_scene_manager.spawn(new_sprite)
+
+        # then
+        self.assertEqual([sprites[2], new_sprite, sprites[0]], simple_scene_manager._get_draw_order())
+
+    def test_should_pass_events_to_sprites_overriding_handle_event(self):
+        # given
+        class EventSprite(XPGESprite):
+            def __init__(self, scene_manager):
+                super().__init__(scene_manager)
+                self.events = list()
+
+            def handle_event(self, event):
+                self.events.append(event)
+                return False
+
+        simple_scene_manager = SimpleSceneManager()
+        sprite = EventSprite(simple_scene_manager)
+        simple_scene_manager.spawn(sprite)
+        event = Event(KEYDOWN, {'key': 0})
+
+        # when
+        simple_scene_manager.handle_event(event)
+
+        # then
+        self.assertEqual([event], sprite.events)
+
+    def test_should_handle_event_by_top_sprite_first(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        bottom_sprite = XPGESprite(simple_scene_manager)
+        bottom_sprite.handles_event_type = Mock(return_value=True)
+        bottom_sprite.handle_event = Mock(return_value=True)
+        top_sprite = XPGESprite(simple_scene_manager)
+        top_sprite.handles_event_type = Mock(return_value=True)
+        top_sprite.handle_event = Mock(return_value=True)
+        top_sprite.layer = 1
+        simple_scene_manager.spawn_many([top_sprite, bottom_sprite])
+
+        # when
+        simple_scene_manager.handle_event(Event(USEREVENT, dict()))
+
+        # then
+        top_sprite.handle_event.assert_called_once()
+        bottom_sprite.handle_event.assert_not_called()
+
+    def test_should_stop_handling_event_when_scene_is_loaded_from_click(self):
+        # given
+        class LoadingComponent(SpriteBehaviour):
+            def on_click(self, button):
+                self.scene_manager.load_scene("test scene 2")
+
+        class RecordingComponent(SpriteBehaviour):
+            def __init__(self, sprite):
+                super().__init__(sprite)
+                self.events = list()
+
+            def on_handle_event(self, event):
+                self.events.append(event)
+
+        class TestSimpleScene(SimpleScene):
+            def __init__(self, scene_manager):
+                super().__init__(scene_manager)
+                top_sprite = XPGESprite(scene_manager)
+                top_sprite.image = Surface((10, 10))
+                top_sprite.layer = 1
+                top_sprite.components.append(LoadingComponent(top_sprite))
+                bottom_sprite = XPGESprite(scene_manager)
+                bottom_sprite.name = "bottom sprite"
+                bottom_sprite.components.append(RecordingComponent(bottom_sprite))
+                self.sprites.extend([top_sprite, bottom_sprite])
+
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.register_scene(TestSimpleScene, "test scene 1")
+        simple_scene_manager.register_scene(SimpleScene, "test scene 2")
+        simple_scene_manager.load_scene("test scene 1")
+        bottom_sprite = simple_scene_manager.get_by_name("bottom sprite")
+        simple_scene_manager.handle_event(Event(MOUSEMOTION, {'pos': (5, 5)}))
+        bottom_sprite.components[0].events.clear()
+
+        # when
+        simple_scene_manager.handle_event(Event(MOUSEBUTTONUP, {'pos': (5, 5), 'button': 1}))
+
+        # then
+        self.assertEqual([], bottom_sprite.components[0].events)
+
+    def test_should_stop_updating_when_scene_is_loaded_from_update(self):
+        # given
+        class LoadingComponent(SpriteBehaviour):
+            def on_update(self):
+                self.scene_manager.load_scene("test scene 2")
+
+        class TestSimpleScene(SimpleScene):
+            def __init__(self, scene_manager):
+                super().__init__(scene_manager)
+                updated_sprite = XPGESprite(scene_manager)
+                updated_sprite.name = "updated sprite"
+                updated_sprite.components.append(Mock(spec=SpriteBehaviour))
+                loading_sprite = XPGESprite(scene_manager)
+                loading_sprite.components.append(LoadingComponent(loading_sprite))
+                self.sprites.extend([updated_sprite, loading_sprite])
+
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.register_scene(TestSimpleScene, "test scene 1")
+        simple_scene_manager.register_scene(SimpleScene, "test scene 2")
+        simple_scene_manager.load_scene("test scene 1")
+        updated_sprite = simple_scene_manager.get_by_name("updated sprite")
+
+        # when
+        simple_scene_manager.update()
+
+        # then
+        updated_sprite.components[0].on_update.assert_not_called()
+        self.assertEqual(set(), simple_scene_manager._unsynced)
+
+    def test_should_update_and_draw_compact_sprites(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        image = Surface((1, 1))
+        sprites = [CompactSprite(simple_scene_manager) for _ in range(2)]
+        for index, sprite in enumerate(sprites):
+            sprite.image = image
+            sprite.position = (index, 0)
+            sprite.components.append(Mock(spec=CompactBehaviour))
+        sprites[1].layer = 1
+        simple_scene_manager.spawn_many(sprites)
+        surface = Mock(spec=Surface)
+        surface.get_size.return_value = (100, 100)
+        surface.get_clip.return_value = Rect(0, 0, 100, 100)
+        batches = list()
+        surface.blits.side_effect = lambda batch, doreturn: batches.append(list(batch))
+
+        # when
+        simple_scene_manager.update()
+        simple_scene_manager.draw(surface)
+
+        # then
+        for sprite in sprites:
+            sprite.components[0].on_update.assert_called_once()
+        self.assertEqual([[(image, Rect(0, 0, 1, 1)), (image, Rect(1, 0, 1, 1))]], batches)
+
+    def test_should_draw_only_sprites_visible_through_camera(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        image = Surface((10, 10))
+        image.fill((255, 255, 255))
+        visible_sprite = XPGESprite(simple_scene_manager)
+        visible_sprite.image = image
+        visible_sprite.position = (1000, 1000)
+        hidden_sprite = XPGESprite(simple_scene_manager)
+        hidden_sprite.image = image
+        simple_scene_manager.spawn_many([visible_sprite, hidden_sprite])
+        simple_scene_manager.camera = Camera((995, 990))
+        surface = Mock(spec=Surface)
+        surface.get_size.return_value = (100, 100)
+        batches = list()
+        surface.blits.side_effect = lambda batch, doreturn: batches.append(list(batch))
+
+        # when
+        simple_scene_manager.draw(surface)
+
+        # then
+        self.assertEqual([[(image, (5, 10))]], batches)
+
+    def test_should_cull_sprites_moved_directly_after_update(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.camera = Camera((500, 500))
+        sprite = XPGESprite(simple_scene_manager)
+        sprite.image = Surface((10, 10))
+        simple_scene_manager.spawn(sprite)
+        surface = Mock(spec=Surface)
+        surface.get_size.return_value = (100, 100)
+
+        # when
+        simple_scene_manager.draw(surface)
+        sprite.rect.topleft = (520, 520)
+        simple_scene_manager.update()
+        simple_scene_manager.draw(surface)
+
+        # then
+        self.assertEqual(1, surface.blits.call_count)
+
+    def test_should_draw_static_sprite_moved_by_other_sprite_through_camera(self):
+        # given
+        class ControllerComponent(SpriteBehaviour):
+            def on_update(self):
+                self.scene_manager.get_by_name("target").rect.topleft = (1000, 1000)
+
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.camera = Camera((990, 990))
+        image = Surface((10, 10))
+        image.fill((255, 0, 0))
+        sprite = XPGESprite(simple_scene_manager)
+        sprite.image = image
+        sprite.name = "target"
+        controller_sprite = XPGESprite(simple_scene_manager)
+        controller_sprite.components.append(ControllerComponent(controller_sprite))
+        simple_scene_manager.spawn_many([sprite, controller_sprite])
+        surface = Surface((100, 100))
+        simple_scene_manager.draw(surface)
+
+        # when
+        simple_scene_manager.update()
+        simple_scene_manager.draw(surface)
+
+        # then
+        self.assertEqual((255, 0, 0, 255), tuple(surface.get_at((15, 15))))
+
+    def test_should_not_resynchronise_static_sprites_when_drawing_through_camera(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.camera = Camera()
+        sprite = XPGESprite(simple_scene_manager)
+        sprite.image = Surface((10, 10))
+        simple_scene_manager.spawn(sprite)
+        surface = Surface((100, 100))
+        simple_scene_manager.update()
+        simple_scene_manager.draw(surface)
+        simple_scene_manager._cull_index.update = Mock()
+
+        # when
+        simple_scene_manager.update()
+        simple_scene_manager.draw(surface)
+
+        # then
+        simple_scene_manager._cull_index.update.assert_not_called()
+
+    def test_should_scale_scene_by_camera_zoom(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        image = Surface((10, 10))
+        image.fill((255, 255, 255))
+        sprite = XPGESprite(simple_scene_manager)
+        sprite.image = image
+        sprite.position = (100, 100)
+        simple_scene_manager.spawn(sprite)
+        simple_scene_manager.camera = Camera((100, 100), zoom=2)
+        surface = Surface((40, 40))
+
+        # when
+        simple_scene_manager.draw(surface)
+
+        # then
+        self.assertEqual((255, 255, 255, 255), surface.get_at((19, 19)))
+        self.assertEqual((0, 0, 0, 255), surface.get_at((21, 21)))
+
+    def test_should_focus_sprite_under_cursor_in_world_coordinates(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        sprite = XPGESprite(simple_scene_manager)
+        sprite.image = Surface((10, 10))
+        sprite.position = (1000, 1000)
+        simple_scene_manager.spawn(sprite)
+        simple_scene_manager.camera = Camera((990, 990), zoom=2)
+
+        # when
+        simple_scene_manager.handle_event(Event(MOUSEMOTION, {"pos": (25, 25), "rel": (0, 0), "buttons": (0, 0, 0)}))
+
+        # then
+        self.assertTrue(sprite.focus)
+
+    @skipIf(numpy is None, "NumPy is not installed")
+    def test_should_move_kinematic_sprites_on_update(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.kinematics = KinematicsSystem(time_step=1)
+        sprite = XPGESprite(simple_scene_manager)
+        sprite.image = Surface((10, 10))
+        simple_scene_manager.spawn(sprite)
+        simple_scene_manager.kinematics.add(sprite, velocity=(5, 0))
+
+        # when
+        simple_scene_manager.update()
+        sprite.position = (100, 100)
+        simple_scene_manager.update()
+
+        # then
+        self.assertEqual((105, 100), sprite.rect.topleft)
+        self.assertEqual([sprite], simple_scene_manager._focus_index.query_point(105, 100))
+
+    @skipIf(numpy is None, "NumPy is not installed")
+    def test_should_move_kinematic_sprites_by_time_step_of_update(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.kinematics = KinematicsSystem()
+        sprite = XPGESprite(simple_scene_manager)
+        simple_scene_manager.spawn(sprite)
+        simple_scene_manager.kinematics.add(sprite, velocity=(60, 0))
+
+        # when
+        simple_scene_manager.update(0.5)
+
+        # then
+        self.assertEqual(0.5, simple_scene_manager.time_step)
+        self.assertEqual((30, 0), sprite.rect.topleft)
+
+    @skipIf(numpy is None, "NumPy is not installed")
+    def test_should_remove_killed_sprite_from_kinematics(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.kinematics = KinematicsSystem()
+        sprite = XPGESprite(simple_scene_manager)
+        simple_scene_manager.spawn(sprite)
+        simple_scene_manager.kinematics.add(sprite, velocity=(5, 0))
+
+        # when
+        simple_scene_manager.kill(sprite)
+
+        # then
+        self.assertNotIn(sprite, simple_scene_manager.kinematics)
+
+    def test_should_deliver_collision_hooks_on_update(self):
+        # given
+        class CollisionRecorder(SpriteBehaviour):
+
+            def __init__(self, sprite):
+                super().__init__(sprite)
+                self.collisions = list()
+
+            def on_collision_enter(self, other):
+                self.collisions.append(("enter", other))
+
+            def on_collision_stay(self, other):
+                self.collisions.append(("stay", other))
+
+            def on_collision_exit(self, other):
+                self.collisions.append(("exit", other))
+
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.collisions = CollisionSystem()
+        sprites = list()
+        for position in ((0, 0), (5, 5)):
+            sprite = XPGESprite(simple_scene_manager)
+            sprite.image = Surface((10, 10))
+            sprite.position = position
+            sprite.components.append(CollisionRecorder(sprite))
+            simple_scene_manager.collisions.add(sprite)
+            sprites.append(sprite)
+        simple_scene_manager.spawn_many(sprites)
+
+        # when
+        simple_scene_manager.update()
+        simple_scene_manager.update()
+        simple_scene_manager.kill(sprites[1])
+        simple_scene_manager.update()
+
+        # then
+        self.assertEqual([("enter", sprites[1]), ("stay", sprites[1]), ("exit", sprites[1])],
+                         sprites[0].components[0].collisions)
+        self.assertEqual([("enter", sprites[0]), ("stay", sprites[0])], sprites[1].components[0].collisions)
+
+    def test_should_defer_killing_sprite_in_collision_hook(self):
+        # given
+        class KillOnCollision(SpriteBehaviour):
+
+            def on_collision_enter(self, other):
+                self.scene_manager.kill(self.sprite)
+
+        simple_scene_manager = SimpleSceneManager()
+        simple_scene_manager.collisions = CollisionSystem()
+        sprites = [XPGESprite(simple_scene_manager) for _ in range(2)]
+        for sprite in sprites:
+            sprite.image = Surface((10, 10))
+            sprite.components.append(KillOnCollision(sprite))
+            simple_scene_manager.collisions.add(sprite)
+        simple_scene_manager.spawn_many(sprites)
+
+        # when
+        simple_scene_manager.update()
+
+        # then
+        self.assertEqual([], simple_scene_manager._sprites)
+        self.assertEqual(0, len(simple_scene_manager.collisions))
+
+    def test_should_not_focus_sprite_under_cursor_on_transparent_pixel(self):
+        # given
+        simple_scene_manager = SimpleSceneManager()
+        sprite = XPGESprite(simple_scene_manager)
+        image = Surface((10, 10), pygame.SRCALPHA)
+        image.fill((255, 255, 255, 255), Rect(0, 0, 5, 10))
+        sprite.image = image
+        sprite.use_mask = True
+        simple_scene_manager.spawn(sprite)
+
+        # when
+        simple_scene_manager.handle_event(Event(MOUSEMOTION, {"pos": (7, 5), "rel": (0, 0), "buttons": (0, 0, 0)}))
+        focus_on_transparent_pixel = sprite.focus
+        simple_scene_manager.handle_event(Event(MOUSEMOTION, {"pos": (2, 5), "rel": (0, 0), "buttons": (0, 0, 0)}))
+
+        # then
+        self.assertFalse(focus_on_transparent_pixel)
+        self.assertTrue(sprite.focus)
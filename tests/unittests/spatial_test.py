@@ -0,0 +1,77 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from pygame import Rect
+
+from xpgext.spatial import SpatialGrid
+
+CELL_SIZE = 10
+
+
+class SpatialGridTest(TestCase):
+    """Test class for SpatialGrid class."""
+
+    def setUp(self):
+        self.grid = SpatialGrid(CELL_SIZE)
+        self.item_1 = Mock(rect=Rect(0, 0, 5, 5))
+        self.item_2 = Mock(rect=Rect(8, 8, 15, 15))
+        self.grid.add(self.item_1)
+        self.grid.add(self.item_2)
+
+    def test_should_add_items(self):
+        # then
+        self.assertEqual(2, len(self.grid))
+        self.assertIn(self.item_1, self.grid)
+        self.assertIn(self.item_2, self.grid)
+
+    def test_should_find_items_by_point(self):
+        # when
+        result_1 = self.grid.query_point(2, 2)
+        result_2 = self.grid.query_point(20, 20)
+        result_3 = self.grid.query_point(40, 40)
+
+        # then
+        self.assertEqual([self.item_1], result_1)
+        self.assertEqual([self.item_2], result_2)
+        self.assertEqual([], result_3)
+
+    def test_should_find_items_by_rect(self):
+        # when
+        result = self.grid.query_rect(Rect(0, 0, 30, 30))
+
+        # then
+        self.assertEqual([self.item_1, self.item_2], result)
+
+    def test_should_find_moved_item_after_update(self):
+        # given
+        self.item_1.rect.topleft = (100, 100)
+
+        # when
+        changed = self.grid.update(self.item_1)
+
+        # then
+        self.assertTrue(changed)
+        self.assertEqual([], self.grid.query_point(2, 2))
+        self.assertEqual([self.item_1], self.grid.query_point(102, 102))
+
+    def test_should_keep_old_position_until_refreshed(self):
+        # given
+        self.item_1.rect.topleft = (100, 100)
+
+        # when
+        result_before = self.grid.query_point(2, 2)
+        self.grid.refresh()
+        result_after = self.grid.query_point(2, 2)
+
+        # then
+        self.assertEqual([self.item_1], result_before)
+        self.assertEqual([], result_after)
+
+    def test_should_discard_item(self):
+        # when
+        self.grid.discard(self.item_2)
+        self.grid.discard(self.item_2)
+
+        # then
+        self.assertNotIn(self.item_2, self.grid)
+        self.assertEqual([], self.grid.query_point(20, 20))
@@ -1,11 +1,13 @@
 from unittest import TestCase
 from unittest.mock import Mock
 
+import pygame
 from pygame.event import Event
-from pygame import Rect, Surface, USEREVENT, MOUSEMOTION, MOUSEBUTTONUP
+from pygame import Rect, Surface, USEREVENT, MOUSEMOTION, MOUSEBUTTONUP, KEYDOWN
 from pygame.sprite import Group
 
-from xpgext.sprite import XPGESprite, SpriteBehaviour, ComponentNotFoundError
+from xpgext.sprite import XPGESprite, SpriteBehaviour, CompactSprite, CompactBehaviour, ComponentNotFoundError, \
+    get_overridden_hooks
 
 SPRITE_X = 0
 SPRITE_Y = 0
@@ -35,6 +37,37 @@ class TestComponent4(SpriteBehaviour):
     pass
 
 
+class TestComponent1Subclass(TestComponent1):
+    pass
+
+
+class TestKeyDownComponent(SpriteBehaviour):
+    handled_event_types = (KEYDOWN,)
+
+
+class TestUpdateComponent(SpriteBehaviour):
+
+    def on_update(self):
+        pass
+
+
+class TestCompactUpdateComponent(CompactBehaviour):
+    __slots__ = ("updates",)
+
+    def __init__(self, sprite):
+        super().__init__(sprite)
+        self.updates = 0
+
+    def on_update(self):
+        self.updates += 1
+
+
+class TestEventSprite(XPGESprite):
+
+    def handle_event(self, event):
+        return True
+
+
 class XPGESpriteTest(TestCase):
     """Test class for XPGESprite class."""
 
@@ -205,6 +238,144 @@ class XPGESpriteTest(TestCase):
         # then
         surface.blit.assert_called_once_with(self.sprite.image, (SPRITE_X, SPRITE_Y))
 
+    def test_should_draw_area_of_image(self):
+        # given
+        surface = Mock(spec=Surface)
+        self.sprite.area = Rect(10, 10, 20, 30)
+
+        # when
+        self.sprite.draw(surface, (5, 5))
+
+        # then
+        self.assertEqual((20, 30), self.sprite.rect.size)
+        surface.blit.assert_called_once_with(self.sprite.image, (SPRITE_X + 5, SPRITE_Y + 5), Rect(10, 10, 20, 30))
+
+    def test_should_reset_area_when_image_changes(self):
+        # given
+        self.sprite.area = Rect(10, 10, 20, 30)
+
+        # when
+        self.sprite.image = Surface((40, 40))
+
+        # then
+        self.assertIsNone(self.sprite.area)
+        self.assertEqual((40, 40), self.sprite.rect.size)
+
+    def test_should_resize_rect_about_center_when_rotated(self):
+        # given
+        self.sprite.image = Surface((20, 10))
+        self.sprite.position = (100, 100)
+
+        # when
+        self.sprite.rotation = 90
+
+        # then
+        self.assertEqual(Rect(105, 95, 10, 20), self.sprite.rect)
+        self.assertEqual((10, 20), self.sprite.rendered_image.get_size())
+        self.assertEqual((20, 10), self.sprite.image.get_size())
+
+    def test_should_share_transformed_image_between_sprites(self):
+        # given
+        image = Surface((20, 10))
+        sprite_1 = XPGESprite(None)
+        sprite_1.image = image
+        sprite_2 = XPGESprite(None)
+        sprite_2.image = image
+
+        # when
+        sprite_1.set_transform(rotation=30, scale=2, flip_x=True)
+        sprite_2.set_transform(rotation=30, scale=2, flip_x=True)
+
+        # then
+        self.assertIs(sprite_1.rendered_image, sprite_2.rendered_image)
+
+    def test_should_draw_image_without_transform(self):
+        # when
+        self.sprite.set_transform(rotation=0, scale=1)
+
+        # then
+        self.assertIs(self.sprite.image, self.sprite.rendered_image)
+
+    def test_should_not_accept_non_positive_scale(self):
+        # when then
+        with self.assertRaises(ValueError):
+            self.sprite.scale = 0
+
+    def test_should_hit_test_by_mask(self):
+        # given
+        image = Surface((20, 20), pygame.SRCALPHA)
+        image.fill((255, 255, 255, 255), Rect(0, 0, 10, 20))
+        self.sprite.image = image
+        self.sprite.position = (100, 100)
+
+        # when
+        self.sprite.use_mask = True
+
+        # then
+        self.assertTrue(self.sprite.contains_point(105, 105))
+        self.assertFalse(self.sprite.contains_point(115, 105))
+        self.assertFalse(self.sprite.contains_point(95, 105))
+
+    def test_should_not_focus_transparent_pixels(self):
+        # given
+        self.sprite.image = Surface((SPRITE_SIZE_X, SPRITE_SIZE_Y), pygame.SRCALPHA)
+        self.sprite.use_mask = True
+
+        # when
+        self.sprite.handle_event(TEST_MOUSEMOTION_EVENT_WITH_POS_INSIDE_SPRITE)
+
+        # then
+        self.assertFalse(self.sprite.focus)
+
+    def test_should_share_mask_between_sprites_and_recompute_after_image_change(self):
+        # given
+        image = Surface((20, 20), pygame.SRCALPHA)
+        other_sprite = XPGESprite(None)
+        other_sprite.image = image
+        self.sprite.image = image
+        mask = self.sprite.mask
+
+        # when
+        self.sprite.flip_x = True
+
+        # then
+        self.assertIs(mask, other_sprite.mask)
+        self.assertIsNot(mask, self.sprite.mask)
+
+    def test_should_recompute_mask_after_pixels_changed_in_place(self):
+        # given
+        image = Surface((20, 20), pygame.SRCALPHA)
+        self.sprite.image = image
+        self.sprite.position = (100, 100)
+        self.sprite.use_mask = True
+        self.assertFalse(self.sprite.contains_point(105, 105))
+        image.fill((255, 255, 255, 255))
+
+        # when
+        self.sprite.dirty = True
+
+        # then
+        self.assertTrue(self.sprite.contains_point(105, 105))
+
+    def test_should_collide_by_mask_after_rect_check(self):
+        # given
+        image = Surface((20, 20), pygame.SRCALPHA)
+        image.fill((255, 255, 255, 255), Rect(0, 0, 10, 10))
+        self.sprite.image = image
+        self.sprite.use_mask = True
+        other_sprite = XPGESprite(None)
+        other_sprite.image = Surface((5, 5))
+
+        # when
+        other_sprite.position = (15, 15)
+        collides_in_transparent_corner = self.sprite.collides_with(other_sprite)
+        other_sprite.position = (8, 8)
+        collides_in_solid_corner = other_sprite.collides_with(self.sprite)
+
+        # then
+        self.assertFalse(collides_in_transparent_corner)
+        self.assertTrue(collides_in_solid_corner)
+
     def test_should_get_component_by_type(self):
         # when
         component = self.sprite.get_component_by_type(TestComponent1)
@@ -276,3 +447,164 @@ class XPGESpriteTest(TestCase):
 
         # then
         self.assertEqual(0, len(components))
+
+    def test_should_find_components_of_subclass_by_type(self):
+        # given
+        test_component = TestComponent1Subclass(self.sprite)
+        self.sprite.components.append(test_component)
+
+        # when
+        components = self.sprite.find_components_by_type(TestComponent1)
+        components_by_name = self.sprite.find_components_by_type_name("TestComponent1")
+
+        # then
+        self.assertEqual([self.component_1, test_component], components)
+        self.assertEqual([self.component_1], components_by_name)
+
+    def test_should_update_found_components_when_components_change(self):
+        # given
+        components_before = self.sprite.find_components_by_type(TestComponent4)
+        test_component = TestComponent4(self.sprite)
+
+        # when
+        self.sprite.components.append(test_component)
+        components_after_append = self.sprite.find_components_by_type(TestComponent4)
+        self.sprite.components.remove(test_component)
+        components_after_remove = self.sprite.find_components_by_type(TestComponent4)
+
+        # then
+        self.assertEqual([], components_before)
+        self.assertEqual([test_component], components_after_append)
+        self.assertEqual([], components_after_remove)
+
+    def test_should_raise_error_when_component_of_type_not_present(self):
+        # when then
+        with self.assertRaises(ComponentNotFoundError):
+            self.sprite.get_component_by_type(TestComponent4)
+
+    def test_should_pass_event_only_to_components_handling_its_type(self):
+        # given
+        self.sprite.components.clear()
+        test_component = TestKeyDownComponent(self.sprite)
+        test_component.on_handle_event = Mock(return_value=False)
+        self.sprite.components.append(test_component)
+
+        # when
+        self.sprite.handle_event(TEST_USEREVENT)
+        self.sprite.handle_event(Event(KEYDOWN, {'key': 0}))
+
+        # then
+        test_component.on_handle_event.assert_called_once()
+        self.assertFalse(self.sprite.handles_event_type(USEREVENT))
+        self.assertTrue(self.sprite.handles_event_type(KEYDOWN))
+
+    def test_should_handle_all_event_types_when_handle_event_is_overridden(self):
+        # given
+        sprite = TestEventSprite(None)
+        sprite._managed = True
+
+        # when then
+        self.assertTrue(sprite.handles_event_type(KEYDOWN))
+        self.assertTrue(sprite.handles_event_type(USEREVENT))
+
+    def test_should_notify_scene_manager_when_rect_is_modified_in_place(self):
+        # given
+        scene_manager = Mock()
+        sprite = XPGESprite(scene_manager)
+        sprite._managed = True
+        copied_rect = sprite.rect.copy()
+
+        # when
+        sprite.rect.x = 10
+        sprite.rect.move_ip(5, 5)
+        sprite.rect[2] = 20
+        copied_rect.x = 30
+
+        # then
+        self.assertEqual(3, scene_manager.invalidate_sprite.call_count)
+        scene_manager.invalidate_sprite.assert_called_with(sprite)
+        self.assertEqual(Rect(15, 5, 20, 0), sprite.rect)
+
+    def test_should_find_overridden_hooks(self):
+        # when
+        hooks = get_overridden_hooks(TestUpdateComponent)
+        base_hooks = get_overridden_hooks(SpriteBehaviour)
+
+        # then
+        self.assertEqual(frozenset(["on_update"]), hooks)
+        self.assertEqual(frozenset(), base_hooks)
+
+    def test_should_update_only_components_overriding_on_update(self):
+        # given
+        self.sprite.components.clear()
+        update_component = TestUpdateComponent(self.sprite)
+        update_component.on_update = Mock()
+        other_component = TestComponent1(self.sprite)
+        self.sprite.components.append(update_component)
+        self.sprite.components.append(other_component)
+
+        # when
+        self.sprite.update()
+
+        # then
+        update_component.on_update.assert_called_once()
+        self.assertEqual([update_component], self.sprite.components_with_hook("on_update"))
+
+
+class CompactSpriteTest(TestCase):
+    """Test class for CompactSprite and CompactBehaviour classes."""
+
+    def test_should_not_have_instance_dictionary(self):
+        # given
+        sprite = CompactSprite(None)
+        component = TestCompactUpdateComponent(sprite)
+
+        # when then
+        self.assertFalse(hasattr(sprite, "__dict__"))
+        self.assertFalse(hasattr(component, "__dict__"))
+        with self.assertRaises(AttributeError):
+            sprite.velocity = (1, 0)
+
+    def test_should_update_components(self):
+        # given
+        sprite = CompactSprite(None)
+        component = TestCompactUpdateComponent(sprite)
+        sprite.components.append(component)
+        sprite.components.append(TestComponent1(sprite))
+
+        # when
+        sprite.update()
+
+        # then
+        self.assertEqual(1, component.updates)
+        self.assertIs(sprite, component.sprite)
+        self.assertEqual([component], sprite.components_with_hook("on_update"))
+
+    def test_should_find_overridden_hooks_of_compact_behaviour(self):
+        # when
+        hooks = get_overridden_hooks(TestCompactUpdateComponent)
+        base_hooks = get_overridden_hooks(CompactBehaviour)
+
+        # then
+        self.assertEqual(frozenset(["on_update"]), hooks)
+        self.assertEqual(frozenset(), base_hooks)
+
+    def test_should_behave_like_xpge_sprite(self):
+        # given
+        image = Surface((SPRITE_SIZE_X, SPRITE_SIZE_Y))
+        sprite = CompactSprite(None)
+        surface = Mock(spec=Surface)
+
+        # when
+        sprite.image = image
+        sprite.position = (SPRITE_X, SPRITE_Y)
+        sprite.name = "compact"
+        sprite.draw(surface)
+
+        # then
+        self.assertEqual(Rect(SPRITE_X, SPRITE_Y, SPRITE_SIZE_X, SPRITE_SIZE_Y), sprite.rect)
+        self.assertIs(sprite, sprite.find_by_name("compact")[0])
+        self.assertTrue(sprite.contains_point(SPRITE_X, SPRITE_Y))
+        surface.blit.assert_called_once_with(image, (SPRITE_X, SPRITE_Y))
+        self.assertIs(XPGESprite.draw, CompactSprite.draw)
+        self.assertIs(XPGESprite.update, CompactSprite.update)
@@ -0,0 +1,93 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import pygame
+
+from xpgext.text import TextCache, LabelSprite
+
+WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+
+
+class TextCacheTest(TestCase):
+    """Test class for TextCache class."""
+
+    def setUp(self):
+        pygame.font.init()
+        self.font = pygame.font.Font(None, 20)
+        self.text_cache = TextCache()
+
+    def test_should_render_string_once(self):
+        # when
+        result_1 = self.text_cache.render(self.font, "score", WHITE)
+        result_2 = self.text_cache.render(self.font, "score", [255, 255, 255])
+
+        # then
+        self.assertIs(result_1, result_2)
+        self.assertEqual(1, self.text_cache.hits)
+        self.assertEqual(1, self.text_cache.misses)
+
+    def test_should_render_string_again_in_other_colour(self):
+        # when
+        result_1 = self.text_cache.render(self.font, "score", WHITE)
+        result_2 = self.text_cache.render(self.font, "score", RED)
+
+        # then
+        self.assertIsNot(result_1, result_2)
+        self.assertEqual(2, len(self.text_cache))
+
+    def test_should_evict_least_recently_used_strings(self):
+        # given
+        sizes = [surface.get_pitch() * surface.get_height()
+                 for surface in (self.font.render(text, True, WHITE) for text in "012")]
+        self.text_cache.memory_budget = sizes[0] + max(sizes[1], sizes[2])
+        self.text_cache.render(self.font, "0", WHITE)
+
+        # when
+        self.text_cache.render(self.font, "1", WHITE)
+        self.text_cache.render(self.font, "0", WHITE)
+        self.text_cache.render(self.font, "2", WHITE)
+
+        # then
+        self.assertEqual(2, len(self.text_cache))
+        self.text_cache.render(self.font, "0", WHITE)
+        self.assertEqual(2, self.text_cache.hits)
+
+
+class LabelSpriteTest(TestCase):
+    """Test class for LabelSprite class."""
+
+    def setUp(self):
+        pygame.font.init()
+        self.font = pygame.font.Font(None, 20)
+
+    def test_should_render_text(self):
+        # when
+        label = LabelSprite(Mock(), self.font, 42)
+
+        # then
+        self.assertEqual("42", label.text)
+        self.assertEqual(self.font.size("42"), label.rect.size)
+
+    def test_should_render_only_when_text_changes(self):
+        # given
+        label = LabelSprite(Mock(), self.font, "0")
+        text_cache = Mock(spec=TextCache)
+        text_cache.render.return_value = pygame.Surface((10, 10))
+
+        # when
+        with patch("xpgext.text.default_cache", text_cache):
+            label.text = 0
+            label.text = "0"
+            label.text = 1
+
+        # then
+        text_cache.render.assert_called_once_with(self.font, "1", WHITE, True, None)
+
+    def test_should_share_image_between_labels(self):
+        # when
+        label_1 = LabelSprite(Mock(), self.font, "shared", RED)
+        label_2 = LabelSprite(Mock(), self.font, "shared", RED)
+
+        # then
+        self.assertIs(label_1.image, label_2.image)
@@ -0,0 +1,121 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from pygame import Surface, Rect
+
+from xpgext.tilemap import TilemapSprite, split_tileset, EMPTY_TILE
+
+RED = (255, 0, 0, 255)
+GREEN = (0, 255, 0, 255)
+TRANSPARENT = (0, 0, 0, 0)
+
+
+class TilemapSpriteTest(TestCase):
+    """Test class for TilemapSprite class."""
+
+    def setUp(self):
+        red = Surface((4, 4))
+        red.fill(RED)
+        green = Surface((4, 4))
+        green.fill(GREEN)
+        self.tilemap = TilemapSprite(Mock(), [red, green], (8, 6), (4, 4), chunk_size=2)
+
+    def test_should_size_rect_to_map(self):
+        # then
+        self.assertEqual(Rect(0, 0, 32, 24), self.tilemap.rect)
+
+    def test_should_draw_tiles(self):
+        # given
+        self.tilemap.set_tile(0, 0, 1)
+        self.tilemap.set_tile(7, 5, 2)
+        surface = Surface((32, 24))
+
+        # when
+        self.tilemap.draw(surface)
+
+        # then
+        self.assertEqual(RED, surface.get_at((1, 1)))
+        self.assertEqual(GREEN, surface.get_at((30, 22)))
+        self.assertEqual((0, 0, 0, 255), surface.get_at((10, 10)))
+
+    def test_should_blit_only_visible_chunks(self):
+        # given
+        surface = Mock(spec=Surface)
+        surface.get_clip.return_value = Rect(0, 0, 10, 10)
+        destinations = list()
+        surface.blits.side_effect = lambda batch, doreturn: destinations.extend(position for chunk, position in batch)
+
+        # when
+        self.tilemap.draw(surface, (-12, -4))
+
+        # then
+        self.assertEqual([(-4, -4), (4, -4), (-4, 4), (4, 4)], destinations)
+
+    def test_should_render_again_only_changed_chunk(self):
+        # given
+        surface = Surface((32, 24))
+        self.tilemap.draw(surface)
+        self.tilemap._render_chunk = Mock()
+
+        # when
+        self.tilemap.set_tile(3, 3, 1)
+        self.tilemap.set_tile(2, 2, 1)
+        self.tilemap.set_tile(0, 0, EMPTY_TILE)
+        self.tilemap.draw(surface)
+
+        # then
+        self.tilemap._render_chunk.assert_called_once()
+        self.assertEqual((1, 1), self.tilemap._render_chunk.call_args[0][1:])
+
+    def test_should_render_chunk_changed_before_creation_once(self):
+        # given
+        surface = Surface((32, 24))
+        self.tilemap.set_tile(0, 0, 1)
+        self.tilemap.draw(surface)
+        self.tilemap._render_chunk = Mock()
+
+        # when
+        self.tilemap.draw(surface)
+
+        # then
+        self.tilemap._render_chunk.assert_not_called()
+
+    def test_should_load_tiles(self):
+        # given
+        rows = [[(column + row) % 3 for column in range(8)] for row in range(6)]
+
+        # when
+        self.tilemap.load_tiles(rows)
+
+        # then
+        self.assertEqual(2, self.tilemap.get_tile(1, 1))
+        self.assertEqual(48, len(self.tilemap.tiles))
+
+    def test_should_not_load_tiles_of_wrong_size(self):
+        # when then
+        with self.assertRaises(ValueError):
+            self.tilemap.load_tiles([[0] * 7] * 6)
+
+    def test_should_find_cell_at_point(self):
+        # given
+        self.tilemap.position = (100, 100)
+
+        # then
+        self.assertEqual((2, 1), self.tilemap.get_cell_at(110, 105))
+        self.assertIsNone(self.tilemap.get_cell_at(10, 10))
+
+
+class SplitTilesetTest(TestCase):
+    """Test class for split_tileset function."""
+
+    def test_should_split_tileset_row_by_row(self):
+        # given
+        tileset = Surface((8, 4))
+        tileset.fill(RED, Rect(4, 0, 4, 4))
+
+        # when
+        tiles = split_tileset(tileset, (4, 4))
+
+        # then
+        self.assertEqual(2, len(tiles))
+        self.assertEqual(RED, tiles[1].get_at((0, 0)))
@@ -0,0 +1,86 @@
+from unittest import TestCase
+
+from pygame import Surface, Rect
+
+from xpgext.transform import TransformCache
+
+RED = (255, 0, 0, 255)
+GREEN = (0, 255, 0, 255)
+
+
+class TransformCacheTest(TestCase):
+    """Test class for TransformCache class."""
+
+    def setUp(self):
+        self.transform_cache = TransformCache()
+        self.image = Surface((20, 10))
+
+    def test_should_share_surface_of_equal_transformations(self):
+        # when
+        result_1 = self.transform_cache.get(self.image, 45, 2)
+        result_2 = self.transform_cache.get(self.image, 45.2, 2.001)
+
+        # then
+        self.assertIs(result_1, result_2)
+        self.assertEqual(1, self.transform_cache.hits)
+        self.assertEqual(1, self.transform_cache.misses)
+
+    def test_should_scale_image(self):
+        # when
+        result = self.transform_cache.get(self.image, scale=1.5)
+
+        # then
+        self.assertEqual((30, 15), result.get_size())
+
+    def test_should_rotate_image(self):
+        # when
+        result = self.transform_cache.get(self.image, rotation=90)
+
+        # then
+        self.assertEqual((10, 20), result.get_size())
+
+    def test_should_flip_area_of_image(self):
+        # given
+        self.image.fill(RED, Rect(0, 0, 5, 10))
+        self.image.fill(GREEN, Rect(5, 0, 5, 10))
+
+        # when
+        result = self.transform_cache.get(self.image, flip_x=True, area=Rect(0, 0, 10, 10))
+
+        # then
+        self.assertEqual((10, 10), result.get_size())
+        self.assertEqual(GREEN, result.get_at((0, 0)))
+        self.assertEqual(RED, result.get_at((9, 0)))
+
+    def test_should_evict_least_recently_used_surfaces(self):
+        # given
+        self.transform_cache.memory_budget = 20 * 10 * 4 * 2
+
+        # when
+        result_1 = self.transform_cache.get(self.image, flip_x=True)
+        self.transform_cache.get(self.image, flip_y=True)
+        self.transform_cache.get(self.image, flip_x=True, flip_y=True)
+
+        # then
+        self.assertEqual(2, len(self.transform_cache))
+        self.assertIsNot(result_1, self.transform_cache.get(self.image, flip_x=True))
+
+    def test_should_not_keep_source_image_alive(self):
+        # given
+        image = Surface((20, 10))
+        self.transform_cache.get(image, 45)
+
+        # when
+        del image
+
+        # then
+        self.assertEqual(0, len(self.transform_cache))
+        self.assertEqual(0, self.transform_cache.memory_usage)
+
+    def test_should_return_source_image_for_identity_transformation(self):
+        # when
+        result = self.transform_cache.get(self.image, 0.2, 1.001)
+
+        # then
+        self.assertIs(self.image, result)
+        self.assertEqual(0, len(self.transform_cache))
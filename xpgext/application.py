@@ -18,6 +18,9 @@ class XPGEApplication:
 
         self._scene_manager = scene_manager
         self._frame_rate = 30
+        self._tick_rate = None
+        self._max_updates_per_frame = 5
+        self._profiler = None
         self._is_running = False
 
     @property
@@ -43,6 +46,57 @@ class XPGEApplication:
     def frame_rate(self, value):
         self._frame_rate = value
 
+    @property
+    def tick_rate(self):
+        """
+        The number of the simulation steps per second, or None if the fixed timestep mode is disabled.
+
+        In the fixed timestep mode, the scene manager is updated at this constant rate, independently of the frame
+        rate. The time elapsed since the last frame is accumulated and consumed in steps of 1 / tick_rate seconds,
+        which are passed to the update of the scene manager as its time step. Otherwise, the scene manager is updated
+        once per frame with the duration of the previous frame.
+        Drawing happens once per frame and receives the fraction of the step left in the accumulator, which can be
+        used to interpolate the positions between two simulation steps. Set frame_rate to 0 to render as fast as
+        the display allows.
+        """
+
+        return self._tick_rate
+
+    @tick_rate.setter
+    def tick_rate(self, value):
+        self._tick_rate = value
+
+    @property
+    def max_updates_per_frame(self):
+        """
+        The maximum number of the simulation steps run in a single frame in the fixed timestep mode.
+
+        When the simulation falls behind by more steps, the remaining time is dropped, so a slow frame cannot cause
+        even slower frames afterwards.
+        """
+
+        return self._max_updates_per_frame
+
+    @max_updates_per_frame.setter
+    def max_updates_per_frame(self, value):
+        self._max_updates_per_frame = value
+
+    @property
+    def profiler(self):
+        """
+        The FrameProfiler recording the timings of the frames, or None if profiling is disabled.
+
+        The profiler is passed on to the scene manager as well, so it also records the time spent in the hooks
+        of the components.
+        """
+
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler):
+        self._profiler = profiler
+        self._scene_manager.profiler = profiler
+
     @property
     def caption(self):
         """
@@ -74,13 +128,56 @@ class XPGEApplication:
         """Run the main loop of the application."""
 
         self._is_running = True
+        accumulator = 0.0
         while self._is_running:
-            self._clock.tick(self._frame_rate)
-            for event in pygame.event.get():
-                if event.type == QUIT:
-                    self.on_quit()
-                else:
-                    self._scene_manager.handle_event(event)
-            self._scene_manager.update()
-            self._scene_manager.draw(self._surface)
+            elapsed = self._clock.tick(self._frame_rate)
+            if self._profiler is not None:
+                self._profiler.begin_frame()
+            self._begin_phase("events")
+            self._handle_events()
+            self._end_phase()
+            self._begin_phase("update")
+            if self._tick_rate is None:
+                self._scene_manager.update(elapsed / 1000.0)
+                self._end_phase()
+                self._begin_phase("draw")
+                dirty_rects = self._scene_manager.draw(self._surface)
+            else:
+                step = 1000.0 / self._tick_rate
+                accumulator += elapsed
+                updates = 0
+                while accumulator >= step:
+                    if updates == self._max_updates_per_frame:
+                        accumulator %= step
+                        break
+                    self._scene_manager.update(step / 1000.0)
+                    accumulator -= step
+                    updates += 1
+                self._end_phase()
+                self._begin_phase("draw")
+                dirty_rects = self._scene_manager.draw(self._surface, accumulator / step)
+            self._end_phase()
+            self._begin_phase("display")
+            self._present(dirty_rects)
+            self._end_phase()
+
+    def _begin_phase(self, name):
+        if self._profiler is not None:
+            self._profiler.begin_phase(name)
+
+    def _end_phase(self):
+        if self._profiler is not None:
+            self._profiler.end_phase()
+
+    def _handle_events(self):
+        for event in pygame.event.get():
+            if event.type == QUIT:
+                self.on_quit()
+            else:
+                self._scene_manager.handle_event(event)
+
+    def _present(self, dirty_rects):
+        if isinstance(dirty_rects, list):
+            pygame.display.update(dirty_rects)
+        else:
             pygame.display.flip()
@@ -0,0 +1,220 @@
+import os
+import weakref
+from collections import OrderedDict
+from functools import partial
+
+import pygame
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+
+class LRUCache:
+    """
+    Base class of the caches holding surfaces and other large objects within a memory budget.
+
+    The entries are kept in the order of their use. When their total size exceeds the memory budget, the least
+    recently used ones are evicted; the most recent entry is always kept, even if it alone exceeds the budget.
+    Subclasses look the entries up with _lookup, add them with _store and define their size with _size_of, which
+    by default gives the number of bytes taken by the pixels of a surface.
+
+    An entry can depend on a source object, e.g. the surface it has been computed from. Such an entry is evicted
+    as soon as its source is garbage collected, so the cache does not keep the source alive; its key should then
+    hold a weak reference to the source rather than the source itself.
+
+    :param memory_budget: the maximum number of bytes taken by the cached objects
+    :type memory_budget: int
+    """
+
+    def __init__(self, memory_budget):
+        self._memory_budget = memory_budget
+        self._entries = OrderedDict()
+        self._memory_usage = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._source_keys = dict()
+        self._key_sources = dict()
+        self._references = dict()
+
+    @property
+    def memory_budget(self):
+        """
+        The maximum number of bytes taken by the cached objects.
+
+        Lowering the budget evicts the least recently used entries immediately.
+        """
+
+        return self._memory_budget
+
+    @memory_budget.setter
+    def memory_budget(self, value):
+        self._memory_budget = value
+        self._evict()
+
+    @property
+    def memory_usage(self):
+        """The number of bytes taken by the cached objects."""
+
+        return self._memory_usage
+
+    @property
+    def hits(self):
+        """The number of the requests served from the cache."""
+
+        return self._hits
+
+    @property
+    def misses(self):
+        """The number of the requests that had to create the object."""
+
+        return self._misses
+
+    @property
+    def evictions(self):
+        """The number of the entries evicted from the cache."""
+
+        return self._evictions
+
+    @property
+    def hit_ratio(self):
+        """The fraction of the requests served from the cache, or 0 if there have been no requests."""
+
+        requests = self._hits + self._misses
+        if requests == 0:
+            return 0.0
+        return self._hits / requests
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all the entries from the cache. The statistics are kept."""
+
+        self._entries.clear()
+        self._source_keys.clear()
+        self._key_sources.clear()
+        self._references.clear()
+        self._memory_usage = 0
+
+    def _lookup(self, key):
+        value = self._entries.get(key)
+        if value is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key, value, source=None):
+        self._remove(key)
+        self._entries[key] = value
+        self._memory_usage += self._size_of(value)
+        if source is not None:
+            source_id = id(source)
+            keys = self._source_keys.get(source_id)
+            if keys is None:
+                keys = self._source_keys[source_id] = dict()
+                self._references[source_id] = weakref.ref(source, partial(self._forget_source, source_id))
+            keys[key] = None
+            self._key_sources[key] = source_id
+        self._evict()
+        return value
+
+    def _remove(self, key):
+        value = self._entries.pop(key, None)
+        if value is None:
+            return False
+        self._memory_usage -= self._size_of(value)
+        source_id = self._key_sources.pop(key, None)
+        if source_id is not None:
+            keys = self._source_keys[source_id]
+            del keys[key]
+            if not keys:
+                del self._source_keys[source_id]
+                del self._references[source_id]
+        return True
+
+    def _forget_source(self, source_id, reference):
+        for key in list(self._source_keys.get(source_id, ())):
+            self._remove(key)
+
+    def _evict(self):
+        while self._memory_usage > self._memory_budget and len(self._entries) > 1:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    @staticmethod
+    def _size_of(value):
+        return value.get_pitch() * value.get_height()
+
+
+class AssetCache(LRUCache):
+    """
+    Cache of the images loaded from disk.
+
+    Each image is loaded only once per combination of its path and conversion flags. When the total size of the
+    cached surfaces exceeds the memory budget, the least recently used ones are evicted. Evicted surfaces stay valid
+    for the sprites still using them; they are only loaded again on the next request.
+
+    :param memory_budget: the maximum number of bytes taken by the pixels of the cached surfaces
+    :type memory_budget: int
+    """
+
+    def __init__(self, memory_budget=DEFAULT_MEMORY_BUDGET):
+        super().__init__(memory_budget)
+
+    def load_image(self, path, convert=True, alpha=False):
+        """
+        Get the image from the cache, loading it from disk if necessary.
+
+        :param path: path of the image file
+        :type path: str
+        :param convert: convert the surface to the pixel format of the display; requires the display mode to be set
+        :type convert: bool
+        :param alpha: keep the per-pixel alpha when converting the surface
+        :type alpha: bool
+        :return: the image
+        :rtype: pygame.Surface
+        """
+
+        key = self.make_key(path, convert, alpha)
+        surface = self._lookup(key)
+        if surface is not None:
+            return surface
+        return self.store(key, pygame.image.load(path))
+
+    def store(self, key, surface):
+        """
+        Put a surface decoded elsewhere into the cache, converting it as requested by the key.
+
+        :param key: key created by make_key
+        :type key: tuple
+        :param surface: the surface loaded from the file given in the key
+        :type surface: pygame.Surface
+        :return: the cached surface
+        :rtype: pygame.Surface
+        """
+
+        path, convert, alpha = key
+        if convert:
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        return self._store(key, surface)
+
+    @staticmethod
+    def make_key(path, convert=True, alpha=False):
+        """
+        Create the key under which the image is cached.
+
+        :param path: path of the image file
+        :type path: str
+        :param convert: convert the surface to the pixel format of the display
+        :type convert: bool
+        :param alpha: keep the per-pixel alpha when converting the surface
+        :type alpha: bool
+        :rtype: tuple
+        """
+
+        return os.path.normpath(path), bool(convert), bool(alpha)
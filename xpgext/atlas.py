@@ -0,0 +1,254 @@
+import hashlib
+import json
+import os
+
+import pygame
+
+DEFAULT_PAGE_SIZE = (1024, 1024)
+IMAGE_TOO_LARGE_ = "image '{}' of size {}x{} does not fit into atlas pages of size {}x{}"
+
+
+class AtlasRegion:
+    """
+    The part of an atlas page holding a single image.
+
+    Assign both attributes to a sprite to draw the image from the atlas::
+
+        sprite.image, sprite.area = region.surface, region.area
+
+    :param surface: the atlas page
+    :type surface: pygame.Surface
+    :param area: the rectangle of the image within the page
+    :type area: pygame.Rect
+    """
+
+    def __init__(self, surface, area):
+        self.surface = surface
+        self.area = area
+
+    def __iter__(self):
+        return iter((self.surface, self.area))
+
+
+class TextureAtlas:
+    """
+    Collection of images packed into a few large surfaces, called pages.
+
+    Blitting many images from the same page is faster than blitting as many separate surfaces, and the pages take
+    less memory than the images they hold. Atlases are created with AtlasBuilder or loaded from disk with load_atlas.
+
+    :param pages: the page surfaces
+    :type pages: list
+    :param index: dictionary mapping the name of each image to a tuple (page number, x, y, width, height)
+    :type index: dict
+    """
+
+    def __init__(self, pages, index):
+        self._pages = list(pages)
+        self._index = dict(index)
+        self._regions = {name: AtlasRegion(self._pages[page], pygame.Rect(x, y, width, height))
+                         for name, (page, x, y, width, height) in self._index.items()}
+
+    @property
+    def pages(self):
+        """The page surfaces."""
+
+        return self._pages
+
+    def __contains__(self, name):
+        return name in self._regions
+
+    def __len__(self):
+        return len(self._regions)
+
+    def __iter__(self):
+        return iter(self._regions)
+
+    def __getitem__(self, name):
+        return self._regions[name]
+
+    def get_region(self, name):
+        """
+        Get the region of the atlas holding the image of the given name.
+
+        :param name: the name under which the image has been added
+        :type name: str
+        :rtype: AtlasRegion
+        :raise KeyError: when there is no image of this name
+        """
+
+        return self._regions[name]
+
+    def convert(self):
+        """
+        Create a copy of the atlas with the pages converted to the pixel format of the display.
+
+        Requires the display mode to be set.
+
+        :rtype: TextureAtlas
+        """
+
+        return TextureAtlas([page.convert_alpha() for page in self._pages], self._index)
+
+    def save(self, directory, name):
+        """
+        Save the pages as PNG files and the index as a JSON file.
+
+        :param directory: the directory of the files; it is created if necessary
+        :type directory: str
+        :param name: the base name of the files
+        :type name: str
+        :return: the path of the index file
+        :rtype: str
+        """
+
+        os.makedirs(directory, exist_ok=True)
+        page_files = list()
+        for number, page in enumerate(self._pages):
+            page_file = "{}_{}.png".format(name, number)
+            pygame.image.save(page, os.path.join(directory, page_file))
+            page_files.append(page_file)
+        index_path = os.path.join(directory, name + ".json")
+        with open(index_path, "w") as file:
+            json.dump({"pages": page_files, "regions": self._index}, file)
+        return index_path
+
+    @classmethod
+    def load(cls, index_path):
+        """
+        Load the atlas saved with save.
+
+        :param index_path: the path of the index file
+        :type index_path: str
+        :rtype: TextureAtlas
+        """
+
+        with open(index_path) as file:
+            data = json.load(file)
+        directory = os.path.dirname(index_path)
+        pages = [pygame.image.load(os.path.join(directory, page_file)) for page_file in data["pages"]]
+        return cls(pages, {name: tuple(entry) for name, entry in data["regions"].items()})
+
+
+class AtlasBuilder:
+    """
+    Builder packing images into a TextureAtlas.
+
+    The images are packed with a shelf algorithm: sorted from the tallest, they are placed side by side in rows,
+    and a new page is started when a page is full. Every image is surrounded by transparent padding, so scaled
+    or filtered images do not bleed into their neighbours.
+
+    :param page_size: the maximum width and height of a page
+    :type page_size: tuple
+    :param padding: the number of transparent pixels between the images
+    :type padding: int
+    """
+
+    def __init__(self, page_size=DEFAULT_PAGE_SIZE, padding=1):
+        self._page_size = tuple(page_size)
+        self._padding = padding
+        self._images = dict()
+
+    def add(self, name, surface):
+        """
+        Add the image to be packed.
+
+        :param name: the name under which the image will be available in the atlas
+        :type name: str
+        :param surface: the image
+        :type surface: pygame.Surface
+        """
+
+        width, height = surface.get_size()
+        if width + self._padding > self._page_size[0] or height + self._padding > self._page_size[1]:
+            raise ValueError(IMAGE_TOO_LARGE_.format(name, width, height, *self._page_size))
+        self._images[name] = surface
+
+    def add_file(self, path, name=None):
+        """
+        Load the image from disk and add it to be packed.
+
+        :param path: the path of the image file
+        :type path: str
+        :param name: the name of the image in the atlas, the normalised path by default
+        :type name: str
+        """
+
+        self.add(os.path.normpath(path) if name is None else name, pygame.image.load(path))
+
+    def build(self):
+        """
+        Pack the added images.
+
+        :rtype: TextureAtlas
+        """
+
+        page_width, page_height = self._page_size
+        padding = self._padding
+        index = dict()
+        page_heights = list()
+        x = y = shelf_height = 0
+        names = sorted(self._images, key=lambda name: -self._images[name].get_height())
+        if names:
+            page_heights.append(0)
+        for name in names:
+            width, height = self._images[name].get_size()
+            if x + width + padding > page_width:
+                x = 0
+                y += shelf_height
+                shelf_height = 0
+            if y + height + padding > page_height:
+                x = y = shelf_height = 0
+                page_heights.append(0)
+            index[name] = (len(page_heights) - 1, x + padding, y + padding, width, height)
+            x += width + padding
+            shelf_height = max(shelf_height, height + padding)
+            page_heights[-1] = max(page_heights[-1], min(y + shelf_height, page_height))
+
+        pages = [pygame.Surface((page_width, height), pygame.SRCALPHA) for height in page_heights]
+        for page in pages:
+            page.fill((0, 0, 0, 0))
+        for name, (page, x, y, width, height) in index.items():
+            pages[page].blit(self._images[name], (x, y))
+        return TextureAtlas(pages, index)
+
+
+def load_atlas(paths, cache_directory, page_size=DEFAULT_PAGE_SIZE, padding=1):
+    """
+    Get the atlas of the given image files, packing it only if it is not cached on disk.
+
+    The cached atlas is identified by the paths, sizes and modification times of the files and by the packing
+    parameters, so modifying any of the images packs the atlas again. The images are named by their normalised paths.
+
+    :param paths: the paths of the image files
+    :param cache_directory: the directory of the cached atlases
+    :type cache_directory: str
+    :param page_size: the maximum width and height of a page
+    :type page_size: tuple
+    :param padding: the number of transparent pixels between the images
+    :type padding: int
+    :rtype: TextureAtlas
+    """
+
+    paths = [os.path.normpath(path) for path in paths]
+    key = _make_cache_key(paths, page_size, padding)
+    index_path = os.path.join(cache_directory, key + ".json")
+    if os.path.exists(index_path):
+        try:
+            return TextureAtlas.load(index_path)
+        except (OSError, ValueError, KeyError, pygame.error):
+            pass
+    builder = AtlasBuilder(page_size, padding)
+    for path in paths:
+        builder.add_file(path)
+    atlas = builder.build()
+    atlas.save(cache_directory, key)
+    return atlas
+
+
+def _make_cache_key(paths, page_size, padding):
+    digest = hashlib.sha1(repr((tuple(page_size), padding)).encode())
+    for path in paths:
+        stat = os.stat(path)
+        digest.update(repr((path, stat.st_size, stat.st_mtime_ns)).encode())
+    return "atlas_" + digest.hexdigest()[:16]
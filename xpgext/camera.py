@@ -0,0 +1,97 @@
+from math import ceil, floor
+
+import pygame
+
+
+class Camera:
+    """
+    The camera looking at the world of the scene.
+
+    The rects of the sprites are given in world coordinates. The camera translates them to the screen: the point
+    at its position is shown in the top-left corner of the screen, and the world is scaled by its zoom.
+
+    :param position: the world coordinates shown in the top-left corner of the screen
+    :type position: tuple
+    :param zoom: the scale of the world on the screen
+    :type zoom: float
+    """
+
+    def __init__(self, position=(0, 0), zoom=1.0):
+        self._position = tuple(position)
+        self._zoom = zoom
+
+    @property
+    def position(self):
+        """The world coordinates shown in the top-left corner of the screen."""
+
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self._position = tuple(value)
+
+    @property
+    def zoom(self):
+        """
+        The scale of the world on the screen.
+
+        Values greater than 1 magnify the world, so a smaller part of it is visible.
+        """
+
+        return self._zoom
+
+    @zoom.setter
+    def zoom(self, value):
+        if value <= 0:
+            raise ValueError("zoom must be positive, got {}".format(value))
+        self._zoom = value
+
+    def center_on(self, point, screen_size):
+        """
+        Move the camera so the given world point is shown in the center of the screen.
+
+        :param point: world coordinates
+        :type point: tuple
+        :param screen_size: the size of the screen in pixels
+        :type screen_size: tuple
+        """
+
+        self._position = (point[0] - screen_size[0] / 2 / self._zoom, point[1] - screen_size[1] / 2 / self._zoom)
+
+    def get_viewport(self, screen_size):
+        """
+        Get the part of the world visible on the screen.
+
+        :param screen_size: the size of the screen in pixels
+        :type screen_size: tuple
+        :return: the visible area in world coordinates
+        :rtype: pygame.Rect
+        """
+
+        x, y = self._position
+        left = floor(x)
+        top = floor(y)
+        return pygame.Rect(left, top, ceil(x + screen_size[0] / self._zoom) - left,
+                           ceil(y + screen_size[1] / self._zoom) - top)
+
+    def world_to_screen(self, point):
+        """
+        Convert world coordinates to screen coordinates.
+
+        :param point: world coordinates
+        :type point: tuple
+        :rtype: tuple
+        """
+
+        return (point[0] - self._position[0]) * self._zoom, (point[1] - self._position[1]) * self._zoom
+
+    def screen_to_world(self, point):
+        """
+        Convert screen coordinates, e.g. the position of the mouse cursor, to world coordinates.
+
+        :param point: screen coordinates
+        :type point: tuple
+        :rtype: tuple
+        """
+
+        return point[0] / self._zoom + self._position[0], point[1] / self._zoom + self._position[1]
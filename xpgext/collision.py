@@ -0,0 +1,179 @@
+ALL_LAYERS = 0xFFFFFFFF
+
+
+class CollisionSystem:
+    """
+    Subsystem detecting the overlapping rects of the registered sprites.
+
+    Every step, the active bodies are hashed into a uniform grid, and only the bodies sharing a cell are tested
+    against each other with pygame.Rect.collidelistall, so the cost grows with the number of bodies and their
+    neighbours rather than with the square of the number of bodies. The contacts are compared with the ones of
+    the previous step, which gives the pairs that have started touching, are still touching and have stopped
+    touching.
+
+    The rects found overlapping are tested pixel by pixel when any of the two sprites has XPGESprite.use_mask set.
+
+    Each body has a collision layer and a mask, both being bit sets. Two bodies collide only when the layer of each
+    one intersects the mask of the other one.
+
+    Assign the system to SimpleSceneManager.collisions to have it stepped after every update; the scene manager then
+    calls on_collision_enter, on_collision_stay and on_collision_exit of the components of the colliding sprites.
+
+    :param cell_size: the width and the height of a cell of the grid in pixels; it should be about the size
+        of a typical body
+    :type cell_size: int
+    """
+
+    def __init__(self, cell_size=64):
+        self._cell_size = cell_size
+        self._bodies = dict()
+        self._order = dict()
+        self._count = 0
+        self._pairs = set()
+
+    @property
+    def cell_size(self):
+        """The width and the height of a cell of the grid in pixels."""
+
+        return self._cell_size
+
+    @property
+    def pairs(self):
+        """
+        The pairs of the sprites touching each other in the last step.
+
+        :rtype: frozenset
+        """
+
+        return frozenset(self._pairs)
+
+    def __contains__(self, sprite):
+        return sprite in self._bodies
+
+    def __iter__(self):
+        return iter(list(self._bodies))
+
+    def __len__(self):
+        return len(self._bodies)
+
+    def add(self, sprite, layer=1, mask=ALL_LAYERS):
+        """
+        Register the sprite, or change its layer and mask if it is already registered.
+
+        :param sprite: the sprite
+        :param layer: the bit set of the collision layers of the sprite
+        :type layer: int
+        :param mask: the bit set of the collision layers the sprite collides with
+        :type mask: int
+        """
+
+        if sprite not in self._order:
+            self._order[sprite] = self._count
+            self._count += 1
+        self._bodies[sprite] = (layer, mask)
+
+    def discard(self, sprite):
+        """
+        Stop detecting the collisions of the sprite, if it is registered.
+
+        The sprites touching it receive on_collision_exit in the next step.
+
+        :param sprite: the sprite
+        """
+
+        self._bodies.pop(sprite, None)
+        self._order.pop(sprite, None)
+
+    def clear(self):
+        """Unregister all the sprites and forget their contacts."""
+
+        self._bodies.clear()
+        self._order.clear()
+        self._pairs.clear()
+
+    def get_layer(self, sprite):
+        """
+        Get the collision layer and mask of the registered sprite.
+
+        :param sprite: a registered sprite
+        :return: tuple (layer, mask)
+        :rtype: tuple
+        """
+
+        return self._bodies[sprite]
+
+    def get_contacts(self, sprite):
+        """
+        Get the sprites touching the given one in the last step.
+
+        :param sprite: the sprite
+        :rtype: list
+        """
+
+        return [second if first is sprite else first for first, second in self._pairs if sprite in (first, second)]
+
+    def step(self):
+        """
+        Detect the collisions of the registered sprites.
+
+        Inactive sprites do not collide.
+
+        :return: three lists of the pairs of the sprites: the ones that have started touching, the ones that are still
+            touching and the ones that have stopped touching since the previous step
+        :rtype: tuple
+        """
+
+        pairs = self._find_pairs()
+        previous_pairs = self._pairs
+        entered = [pair for pair in pairs if pair not in previous_pairs]
+        stayed = [pair for pair in pairs if pair in previous_pairs]
+        exited = [pair for pair in previous_pairs if pair not in pairs]
+        self._pairs = pairs
+        return entered, stayed, exited
+
+    def _find_pairs(self):
+        size = self._cell_size
+        cells = dict()
+        bodies = list()
+        for sprite, (layer, mask) in self._bodies.items():
+            if not sprite.is_active:
+                continue
+            rect = sprite.rect
+            index = len(bodies)
+            bodies.append((sprite, rect, layer, mask, self._order[sprite]))
+            left = rect.left // size
+            top = rect.top // size
+            right = (rect.right - 1) // size if rect.width > 0 else left
+            bottom = (rect.bottom - 1) // size if rect.height > 0 else top
+            for x in range(left, right + 1):
+                for y in range(top, bottom + 1):
+                    cell = cells.get((x, y))
+                    if cell is None:
+                        cells[(x, y)] = [index]
+                    else:
+                        cell.append(index)
+
+        pairs = set()
+        tested = set()
+        for cell in cells.values():
+            if len(cell) < 2:
+                continue
+            rects = [bodies[index][1] for index in cell]
+            for position, first_index in enumerate(cell):
+                hits = rects[position].collidelistall(rects[position + 1:])
+                if not hits:
+                    continue
+                first, first_rect, first_layer, first_mask, first_order = bodies[first_index]
+                for hit in hits:
+                    second_index = cell[position + 1 + hit]
+                    second, second_rect, second_layer, second_mask, second_order = bodies[second_index]
+                    if not (first_layer & second_mask and second_layer & first_mask):
+                        continue
+                    key = (first_index, second_index)
+                    if key in tested:
+                        continue
+                    tested.add(key)
+                    if (first.use_mask or second.use_mask) and not first.collides_with(second):
+                        continue
+                    pairs.add((first, second) if first_order < second_order else (second, first))
+        return pairs
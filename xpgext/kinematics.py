@@ -0,0 +1,258 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NUMPY_REQUIRED = "KinematicsSystem requires NumPy, install it with 'pip install numpy'"
+DEFAULT_TIME_STEP = 1 / 30
+INITIAL_CAPACITY = 256
+
+
+class KinematicsSystem:
+    """
+    Subsystem moving sprites by their velocity and acceleration.
+
+    The positions, velocities and accelerations of the registered sprites are kept in contiguous NumPy arrays and
+    integrated in a single vectorised step per update, instead of every sprite moving itself in on_update. Afterwards,
+    the new positions are written back to the rects of the sprites; only the sprites that have moved by at least one
+    pixel are touched. The positions are kept with subpixel precision, so slow sprites move smoothly.
+
+    Assign the system to SimpleSceneManager.kinematics to have it stepped after every update by the time step of
+    the update, and register the sprites with add, e.g. in SpriteBehaviour.on_spawn. Killed sprites are removed
+    automatically. Sprites moved with their position property are synchronised automatically as well, while after
+    modifying the rect of a registered sprite directly, call set_position or SimpleSceneManager.refresh_sprite.
+
+    NumPy is an optional dependency of xpgext, required only by this class.
+
+    :param time_step: the simulated time in seconds advanced by every step
+    :type time_step: float
+    """
+
+    def __init__(self, time_step=DEFAULT_TIME_STEP):
+        if numpy is None:
+            raise ImportError(NUMPY_REQUIRED)
+        self._time_step = time_step
+        self._sprites = list()
+        self._indexes = dict()
+        self._positions = numpy.zeros((INITIAL_CAPACITY, 2))
+        self._velocities = numpy.zeros((INITIAL_CAPACITY, 2))
+        self._accelerations = numpy.zeros((INITIAL_CAPACITY, 2))
+        self._pixels = numpy.zeros((INITIAL_CAPACITY, 2), numpy.int64)
+
+    @property
+    def time_step(self):
+        """
+        The simulated time in seconds advanced by every step.
+
+        It is used when step is called without a time step, e.g. by a scene manager updated without one. It defaults
+        to 1/30, the duration of a frame at the default frame rate of XPGEApplication.
+        """
+
+        return self._time_step
+
+    @time_step.setter
+    def time_step(self, value):
+        self._time_step = value
+
+    @property
+    def positions(self):
+        """View of the positions of the registered sprites, an array of shape (len(self), 2)."""
+
+        return self._positions[:len(self._sprites)]
+
+    @property
+    def velocities(self):
+        """
+        View of the velocities of the registered sprites in pixels per second, an array of shape (len(self), 2).
+
+        The rows follow the order of iteration over the system. The view can be modified in place to change many
+        velocities at once.
+        """
+
+        return self._velocities[:len(self._sprites)]
+
+    @property
+    def accelerations(self):
+        """View of the accelerations of the registered sprites in pixels per second squared."""
+
+        return self._accelerations[:len(self._sprites)]
+
+    def __contains__(self, sprite):
+        return sprite in self._indexes
+
+    def __iter__(self):
+        return iter(list(self._sprites))
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def add(self, sprite, velocity=(0, 0), acceleration=(0, 0)):
+        """
+        Register the sprite, or change its velocity and acceleration if it is already registered.
+
+        :param sprite: the sprite to move
+        :param velocity: the velocity in pixels per second
+        :type velocity: tuple
+        :param acceleration: the acceleration in pixels per second squared
+        :type acceleration: tuple
+        """
+
+        index = self._indexes.get(sprite)
+        if index is None:
+            index = len(self._sprites)
+            if index == len(self._positions):
+                self._grow()
+            self._sprites.append(sprite)
+            self._indexes[sprite] = index
+            self._positions[index] = sprite.rect.topleft
+            self._pixels[index] = sprite.rect.topleft
+        self._velocities[index] = velocity
+        self._accelerations[index] = acceleration
+
+    def discard(self, sprite):
+        """
+        Stop moving the sprite, if it is registered.
+
+        The last registered sprite takes the place of the removed one, so removing is O(1).
+
+        :param sprite: the sprite
+        """
+
+        index = self._indexes.pop(sprite, None)
+        if index is None:
+            return None
+        last = len(self._sprites) - 1
+        if index != last:
+            moved = self._sprites[last]
+            self._sprites[index] = moved
+            self._indexes[moved] = index
+            for array in (self._positions, self._velocities, self._accelerations, self._pixels):
+                array[index] = array[last]
+        self._sprites.pop()
+
+    def clear(self):
+        """Unregister all the sprites."""
+
+        self._sprites.clear()
+        self._indexes.clear()
+
+    def get_velocity(self, sprite):
+        """
+        Get the velocity of the registered sprite.
+
+        :param sprite: a registered sprite
+        :return: the velocity of the sprite in pixels per second
+        :rtype: tuple
+        """
+
+        return tuple(self._velocities[self._indexes[sprite]].tolist())
+
+    def set_velocity(self, sprite, velocity):
+        """
+        Change the velocity of the registered sprite.
+
+        :param sprite: a registered sprite
+        :param velocity: the velocity in pixels per second
+        :type velocity: tuple
+        """
+
+        self._velocities[self._indexes[sprite]] = velocity
+
+    def get_acceleration(self, sprite):
+        """
+        Get the acceleration of the registered sprite.
+
+        :param sprite: a registered sprite
+        :return: the acceleration of the sprite in pixels per second squared
+        :rtype: tuple
+        """
+
+        return tuple(self._accelerations[self._indexes[sprite]].tolist())
+
+    def set_acceleration(self, sprite, acceleration):
+        """
+        Change the acceleration of the registered sprite.
+
+        :param sprite: a registered sprite
+        :param acceleration: the acceleration in pixels per second squared
+        :type acceleration: tuple
+        """
+
+        self._accelerations[self._indexes[sprite]] = acceleration
+
+    def get_position(self, sprite):
+        """
+        Get the position of the registered sprite.
+
+        :param sprite: a registered sprite
+        :return: the position of the sprite with subpixel precision
+        :rtype: tuple
+        """
+
+        return tuple(self._positions[self._indexes[sprite]].tolist())
+
+    def set_position(self, sprite, position):
+        """
+        Move the sprite, updating both its rect and its position in the system.
+
+        :param sprite: a registered sprite
+        :param position: the new position, which may be fractional
+        :type position: tuple
+        """
+
+        index = self._indexes[sprite]
+        self._positions[index] = position
+        self._pixels[index] = numpy.floor(self._positions[index])
+        sprite.rect.topleft = self._pixels[index].tolist()
+
+    def sync(self, sprite):
+        """
+        Take the position of the sprite from its rect, if the sprite is registered and its rect has been moved.
+
+        :param sprite: the sprite
+        """
+
+        index = self._indexes.get(sprite)
+        if index is not None and tuple(self._pixels[index].tolist()) != tuple(sprite.rect.topleft):
+            self._positions[index] = sprite.rect.topleft
+            self._pixels[index] = sprite.rect.topleft
+
+    def step(self, time_step=None):
+        """
+        Integrate the motion of all the registered sprites and move their rects.
+
+        :param time_step: the simulated time in seconds, the time_step property by default
+        :type time_step: float
+        :return: the sprites that have moved by at least one pixel
+        :rtype: list
+        """
+
+        count = len(self._sprites)
+        if count == 0:
+            return list()
+        if time_step is None:
+            time_step = self._time_step
+        velocities = self._velocities[:count]
+        velocities += self._accelerations[:count] * time_step
+        positions = self._positions[:count]
+        positions += velocities * time_step
+        pixels = numpy.floor(positions).astype(numpy.int64)
+        moved = numpy.flatnonzero((pixels != self._pixels[:count]).any(axis=1))
+        if len(moved) == 0:
+            return list()
+        self._pixels[:count] = pixels
+        sprites = self._sprites
+        moved_sprites = list()
+        for index, position in zip(moved.tolist(), pixels[moved].tolist()):
+            sprite = sprites[index]
+            sprite.rect.topleft = position
+            moved_sprites.append(sprite)
+        return moved_sprites
+
+    def _grow(self):
+        capacity = 2 * len(self._positions)
+        for name in ("_positions", "_velocities", "_accelerations", "_pixels"):
+            array = getattr(self, name)
+            grown = numpy.zeros((capacity, 2), array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
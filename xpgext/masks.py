@@ -0,0 +1,75 @@
+import weakref
+
+import pygame
+
+from xpgext.assets import LRUCache
+
+DEFAULT_MEMORY_BUDGET = 4 * 1024 * 1024
+
+
+class MaskCache(LRUCache):
+    """
+    Cache of the collision masks of images.
+
+    The masks are computed with pygame.mask.from_surface and looked up by the surface and its area, so all the sprites
+    showing the same image, e.g. the same animation frame or the same cached rotation, share a single mask. When the
+    total size of the cached masks exceeds the memory budget, the least recently used ones are evicted. The cache
+    holds only weak references to the images, and their masks are evicted once they are garbage collected.
+
+    The images are identified by the surface objects, not by their pixels, so when an image is modified in place,
+    its stale masks have to be removed with discard. Setting XPGESprite.dirty to True does that for the rendered
+    image of the sprite, but the other sprites showing the same image keep their already fetched masks until their
+    image changes or they are marked dirty too.
+
+    :param memory_budget: the maximum number of bytes taken by the bits of the cached masks
+    :type memory_budget: int
+    :param threshold: the alpha value above which a pixel of an image with per-pixel alpha is solid
+    :type threshold: int
+    """
+
+    def __init__(self, memory_budget=DEFAULT_MEMORY_BUDGET, threshold=127):
+        super().__init__(memory_budget)
+        self._threshold = threshold
+
+    @property
+    def threshold(self):
+        """The alpha value above which a pixel of an image with per-pixel alpha is solid."""
+
+        return self._threshold
+
+    def get(self, surface, area=None):
+        """
+        Get the mask of the image, computing it if it is not cached.
+
+        :param surface: the image
+        :type surface: pygame.Surface
+        :param area: the part of the image, or None for the whole image
+        :type area: pygame.Rect
+        :rtype: pygame.mask.Mask
+        """
+
+        key = (weakref.ref(surface), None if area is None else tuple(area))
+        mask = self._lookup(key)
+        if mask is not None:
+            return mask
+        mask = pygame.mask.from_surface(surface if area is None else surface.subsurface(area), self._threshold)
+        return self._store(key, mask, surface)
+
+    def discard(self, surface):
+        """
+        Remove all the masks of the image, e.g. after its pixels have been modified in place.
+
+        :param surface: the image
+        :type surface: pygame.Surface
+        """
+
+        for key in list(self._source_keys.get(id(surface), ())):
+            self._remove(key)
+
+    @staticmethod
+    def _size_of(mask):
+        width, height = mask.get_size()
+        return (width + 7) // 8 * height
+
+
+default_cache = MaskCache()
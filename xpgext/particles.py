@@ -0,0 +1,253 @@
+import pygame
+
+from xpgext.sprite import XPGESprite
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NUMPY_REQUIRED = "ParticleEmitter requires NumPy, install it with 'pip install numpy'"
+DEFAULT_TIME_STEP = 1 / 30
+
+
+class ParticleEmitter(XPGESprite):
+    """
+    Sprite simulating and drawing a whole particle effect.
+
+    The positions, velocities, remaining lifetimes and colours of the particles are kept in NumPy arrays, with the
+    living particles packed at their beginning. Every update integrates all the particles with a few vectorised
+    operations and removes the expired ones, and drawing writes them straight into the pixels of the surface,
+    so the cost of a particle is a few array elements instead of a sprite with its components.
+
+    The rect of the emitter is the bounding box of its particles, updated every frame, and the emitter is marked dirty
+    whenever its particles change. The particles are given in the coordinates of the scene, not relative to
+    the emitter.
+
+    NumPy is an optional dependency of xpgext, required only by this class.
+
+    :param scene_manager: the scene manager of the sprite
+    :param capacity: the maximum number of the living particles; new particles are dropped when it is reached
+    :type capacity: int
+    :param particle_size: the width and the height of a particle in pixels
+    :type particle_size: int
+    """
+
+    def __init__(self, scene_manager, capacity=10000, particle_size=1, *groups):
+        if numpy is None:
+            raise ImportError(NUMPY_REQUIRED)
+        super().__init__(scene_manager, *groups)
+        self._takes_focus = False
+        self._capacity = capacity
+        self._particle_size = particle_size
+        self._count = 0
+        self._positions = numpy.zeros((capacity, 2), numpy.float32)
+        self._velocities = numpy.zeros((capacity, 2), numpy.float32)
+        self._lifetimes = numpy.zeros(capacity, numpy.float32)
+        self._colours = numpy.zeros((capacity, 3), numpy.uint8)
+        self._gravity = numpy.zeros(2, numpy.float32)
+        self._time_step = DEFAULT_TIME_STEP
+        self._random = numpy.random.default_rng()
+
+    @property
+    def capacity(self):
+        """The maximum number of the living particles."""
+
+        return self._capacity
+
+    @property
+    def count(self):
+        """The number of the living particles."""
+
+        return self._count
+
+    @property
+    def particle_size(self):
+        """The width and the height of a particle in pixels."""
+
+        return self._particle_size
+
+    @particle_size.setter
+    def particle_size(self, value):
+        self._particle_size = value
+
+    @property
+    def gravity(self):
+        """The acceleration of all the particles, in pixels per second squared."""
+
+        return tuple(self._gravity.tolist())
+
+    @gravity.setter
+    def gravity(self, value):
+        self._gravity[:] = value
+
+    @property
+    def time_step(self):
+        """
+        The simulated time in seconds advanced by every update when the scene manager has not been given one.
+
+        Normally the emitter advances by SimpleSceneManager.time_step. This value is used when the scene manager
+        is updated without a time step. It defaults to 1/30, the duration of a frame at the default frame rate of
+        XPGEApplication.
+        """
+
+        return self._time_step
+
+    @time_step.setter
+    def time_step(self, value):
+        self._time_step = value
+
+    @property
+    def positions(self):
+        """View of the positions of the living particles, an array of shape (count, 2)."""
+
+        return self._positions[:self._count]
+
+    @property
+    def velocities(self):
+        """View of the velocities of the living particles in pixels per second, an array of shape (count, 2)."""
+
+        return self._velocities[:self._count]
+
+    @property
+    def lifetimes(self):
+        """View of the remaining lifetimes of the living particles in seconds, an array of shape (count,)."""
+
+        return self._lifetimes[:self._count]
+
+    @property
+    def colours(self):
+        """View of the RGB colours of the living particles, an array of shape (count, 3)."""
+
+        return self._colours[:self._count]
+
+    def emit(self, count, position, velocity=(0, 0), spread=(0, 0), lifetime=1.0, lifetime_spread=0.0,
+             colour=(255, 255, 255)):
+        """
+        Create new particles.
+
+        :param count: the number of the particles to create
+        :type count: int
+        :param position: the position of the new particles
+        :type position: tuple
+        :param velocity: the mean velocity of the new particles in pixels per second
+        :type velocity: tuple
+        :param spread: the maximum random deviation of the velocity along each axis
+        :type spread: tuple
+        :param lifetime: the mean lifetime of the new particles in seconds
+        :type lifetime: float
+        :param lifetime_spread: the maximum random deviation of the lifetime
+        :type lifetime_spread: float
+        :param colour: the RGB colour of the new particles
+        :type colour: tuple
+        :return: the number of the particles actually created
+        :rtype: int
+        """
+
+        start = self._count
+        count = max(0, min(count, self._capacity - start))
+        end = start + count
+        self._positions[start:end] = position
+        self._velocities[start:end] = velocity
+        if spread != (0, 0):
+            self._velocities[start:end] += self._random.uniform(-1, 1, (count, 2)) * numpy.asarray(spread)
+        self._lifetimes[start:end] = lifetime
+        if lifetime_spread:
+            self._lifetimes[start:end] += self._random.uniform(-lifetime_spread, lifetime_spread, count)
+        self._colours[start:end] = colour[:3]
+        self._count = end
+        if count > 0:
+            self._update_bounds()
+        return count
+
+    def clear(self):
+        """Remove all the particles."""
+
+        if self._count > 0:
+            self._count = 0
+            self._update_bounds()
+
+    def update(self):
+        """
+        Update the components of the emitter and advance the simulation by the time step of the scene manager.
+        """
+
+        super().update()
+        if self._is_active:
+            time_step = None if self._scene_manager is None else self._scene_manager.time_step
+            self.step(self._time_step if time_step is None else time_step)
+
+    def step(self, time_step):
+        """
+        Advance the simulation of all the particles and remove the expired ones.
+
+        :param time_step: the simulated time in seconds
+        :type time_step: float
+        """
+
+        count = self._count
+        if count == 0:
+            return None
+        velocities = self._velocities[:count]
+        velocities += self._gravity * time_step
+        self._positions[:count] += velocities * time_step
+        lifetimes = self._lifetimes[:count]
+        lifetimes -= time_step
+        alive = lifetimes > 0
+        living = int(numpy.count_nonzero(alive))
+        if living < count:
+            for array in (self._positions, self._velocities, self._lifetimes, self._colours):
+                array[:living] = array[:count][alive]
+            self._count = living
+        self._update_bounds()
+
+    def _update_bounds(self):
+        self._dirty = True
+        previous_rect = tuple(self._rect)
+        if self._count == 0:
+            self._rect.size = (0, 0)
+        else:
+            positions = self._positions[:self._count]
+            left, top = numpy.floor(positions.min(axis=0)).astype(int).tolist()
+            right, bottom = numpy.floor(positions.max(axis=0)).astype(int).tolist()
+            self._rect.update(left, top, right - left + self._particle_size, bottom - top + self._particle_size)
+        if tuple(self._rect) != previous_rect:
+            self._notify_changed()
+
+    def draw(self, surface, offset=None):
+        """
+        Draw the particles onto the given surface.
+
+        The particles are written into the pixels of the surface with pygame.surfarray, within its clipping area.
+        Surfaces whose pixels cannot be referenced as an array, e.g. 8-bit ones, are filled particle by particle.
+
+        :param surface: the destination surface
+        :type surface: pygame.Surface
+        :param offset: the translation from world to surface coordinates, given when the scene is seen by a camera
+        :type offset: tuple
+        """
+
+        if not self._is_active or self._count == 0:
+            return None
+        dx, dy = offset if offset is not None else (0, 0)
+        clip = surface.get_clip()
+        positions = numpy.floor(self._positions[:self._count]).astype(numpy.intp)
+        xs = positions[:, 0] + dx
+        ys = positions[:, 1] + dy
+        colours = self._colours[:self._count]
+        size = self._particle_size
+        try:
+            pixels = pygame.surfarray.pixels3d(surface)
+        except ValueError:
+            for x, y, colour in zip(xs.tolist(), ys.tolist(), colours.tolist()):
+                surface.fill(colour, (x, y, size, size))
+            return None
+        try:
+            for offset_x in range(size):
+                for offset_y in range(size):
+                    x = xs + offset_x
+                    y = ys + offset_y
+                    visible = (x >= clip.left) & (x < clip.right) & (y >= clip.top) & (y < clip.bottom)
+                    pixels[x[visible], y[visible]] = colours[visible]
+        finally:
+            del pixels
@@ -0,0 +1,167 @@
+import csv
+import json
+from time import perf_counter
+
+
+class FrameProfiler:
+    """
+    Profiler recording where the time of each frame goes.
+
+    The profiler records the duration of the phases of every frame (event handling, updating, drawing and pushing
+    the frame to the display) and the cumulative time spent in the hooks of each type of the components. Assign it
+    to XPGEApplication.profiler to enable it; when no profiler is assigned, nothing is measured.
+
+    The collected data can be exported to CSV files or to the Chrome trace format, which can be opened in
+    chrome://tracing or Perfetto.
+    """
+
+    def __init__(self):
+        self._origin = perf_counter()
+        self._frame = -1
+        self._phases = list()
+        self._phase_name = None
+        self._phase_start = 0.0
+        self._hooks = dict()
+
+    @property
+    def frame_count(self):
+        """The number of the frames recorded so far."""
+
+        return self._frame + 1
+
+    @property
+    def phases(self):
+        """
+        List of the recorded phases.
+
+        Each element is a tuple (frame, name, start, duration), with the times given in seconds since the creation
+        of the profiler.
+        """
+
+        return self._phases
+
+    @property
+    def hook_times(self):
+        """
+        Dictionary mapping 'ComponentType.hook' to a tuple (number of calls, total time in seconds).
+        """
+
+        return {name: tuple(record) for name, record in self._hooks.items()}
+
+    def reset(self):
+        """Forget all the recorded data."""
+
+        self._origin = perf_counter()
+        self._frame = -1
+        self._phases.clear()
+        self._phase_name = None
+        self._hooks.clear()
+
+    def begin_frame(self):
+        """Start recording a new frame."""
+
+        self._frame += 1
+
+    def begin_phase(self, name):
+        """
+        Start measuring a phase of the current frame.
+
+        :param name: name of the phase
+        :type name: str
+        """
+
+        self._phase_name = name
+        self._phase_start = perf_counter()
+
+    def end_phase(self):
+        """Finish measuring the phase started with begin_phase."""
+
+        end = perf_counter()
+        self._phases.append((self._frame, self._phase_name, self._phase_start - self._origin, end - self._phase_start))
+        self._phase_name = None
+
+    def call_hook(self, component, hook, *args):
+        """
+        Call the hook of the component, adding its duration to the total of the type of the component.
+
+        :param component: the component
+        :param hook: name of the method to call
+        :type hook: str
+        :param args: arguments passed to the method
+        :return: the value returned by the method
+        """
+
+        start = perf_counter()
+        result = getattr(component, hook)(*args)
+        self.record_hook(type(component).__name__ + "." + hook, perf_counter() - start)
+        return result
+
+    def record_hook(self, name, duration):
+        """
+        Add the duration of a single call to the total of the given hook.
+
+        :param name: name of the hook, by convention 'ComponentType.hook'
+        :type name: str
+        :param duration: time in seconds
+        :type duration: float
+        """
+
+        record = self._hooks.get(name)
+        if record is None:
+            self._hooks[name] = [1, duration]
+        else:
+            record[0] += 1
+            record[1] += duration
+
+    def export_csv(self, path):
+        """
+        Write the recorded phases to a CSV file, one row per phase.
+
+        The columns are: frame, phase, start_ms and duration_ms.
+
+        :param path: path of the file
+        :type path: str
+        """
+
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(("frame", "phase", "start_ms", "duration_ms"))
+            for frame, name, start, duration in self._phases:
+                writer.writerow((frame, name, "{:.4f}".format(start * 1000), "{:.4f}".format(duration * 1000)))
+
+    def export_hooks_csv(self, path):
+        """
+        Write the cumulative hook times to a CSV file, sorted from the most expensive hook.
+
+        The columns are: hook, calls, total_ms and mean_ms.
+
+        :param path: path of the file
+        :type path: str
+        """
+
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(("hook", "calls", "total_ms", "mean_ms"))
+            for name, (calls, total) in sorted(self._hooks.items(), key=lambda item: -item[1][1]):
+                writer.writerow((name, calls, "{:.4f}".format(total * 1000), "{:.6f}".format(total * 1000 / calls)))
+
+    def export_chrome_trace(self, path):
+        """
+        Write the recorded data to a JSON file in the Chrome trace event format.
+
+        Every phase becomes a complete event. The cumulative hook times are attached as the arguments of a metadata
+        event named 'hook totals'.
+
+        :param path: path of the file
+        :type path: str
+        """
+
+        events = list()
+        for frame, name, start, duration in self._phases:
+            events.append({"name": name, "cat": "frame", "ph": "X", "pid": 0, "tid": 0,
+                           "ts": start * 1000000, "dur": duration * 1000000, "args": {"frame": frame}})
+        events.append({"name": "hook totals", "ph": "M", "pid": 0, "tid": 0,
+                       "args": {name: {"calls": calls, "total_ms": total * 1000}
+                                for name, (calls, total) in self._hooks.items()}})
+        with open(path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
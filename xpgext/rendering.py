@@ -0,0 +1,183 @@
+import pygame
+
+from xpgext.sprite import XPGESprite
+
+BLIT_BATCH_SIZE = 256
+
+
+def draw_sprites(surface, sprites, batch=None, offset=None):
+    """
+    Draw the sprites onto the given surface in the given order.
+
+    The rendered images of the active sprites that do not override XPGESprite.draw are collected and blitted with
+    pygame.Surface.blits, together with their areas when they are drawn from a part of the image. The batch is flushed
+    before each sprite with a custom draw method, so the drawing order is preserved, and after every BLIT_BATCH_SIZE
+    sprites, so its tuples are freed before the garbage collector moves them to the oldest generation and triggers
+    full collections. When an offset is given, it is added to the positions of the sprites and passed to the custom
+    draw methods.
+
+    :param surface: the destination surface
+    :type surface: pygame.Surface
+    :param sprites: the sprites to draw, in the drawing order
+    :param batch: the list reused for collecting the blits; it is empty after the call
+    :type batch: list
+    :param offset: the translation from world to surface coordinates
+    :type offset: tuple
+    """
+
+    if batch is None:
+        batch = list()
+    if offset is not None:
+        _draw_sprites_with_offset(surface, sprites, batch, offset)
+        return None
+    for sprite in sprites:
+        if getattr(type(sprite), "draw", None) is XPGESprite.draw:
+            if sprite.is_active:
+                area = sprite.rendered_area
+                if area is None:
+                    batch.append((sprite.rendered_image, sprite.rect))
+                else:
+                    batch.append((sprite.rendered_image, sprite.rect, area))
+                if len(batch) >= BLIT_BATCH_SIZE:
+                    surface.blits(batch, doreturn=False)
+                    batch.clear()
+        else:
+            if batch:
+                surface.blits(batch, doreturn=False)
+                batch.clear()
+            sprite.draw(surface)
+    if batch:
+        surface.blits(batch, doreturn=False)
+        batch.clear()
+
+
+def _draw_sprites_with_offset(surface, sprites, batch, offset):
+    dx, dy = offset
+    for sprite in sprites:
+        if getattr(type(sprite), "draw", None) is XPGESprite.draw:
+            if sprite.is_active:
+                rect = sprite.rect
+                area = sprite.rendered_area
+                if area is None:
+                    batch.append((sprite.rendered_image, (rect.x + dx, rect.y + dy)))
+                else:
+                    batch.append((sprite.rendered_image, (rect.x + dx, rect.y + dy), area))
+                if len(batch) >= BLIT_BATCH_SIZE:
+                    surface.blits(batch, doreturn=False)
+                    batch.clear()
+        else:
+            if batch:
+                surface.blits(batch, doreturn=False)
+                batch.clear()
+            sprite.draw(surface, offset)
+    if batch:
+        surface.blits(batch, doreturn=False)
+        batch.clear()
+
+
+class DirtyRectRenderer:
+    """
+    Renderer redrawing only the parts of the surface that have changed since the previous frame.
+
+    The renderer remembers the rectangle and the image each sprite has been drawn with. On every frame, the regions
+    of the sprites that have moved, changed their image, have been (de)activated, spawned or killed are restored from
+    the cached background and the sprites overlapping them are redrawn. Only these regions need to be pushed to the
+    display with pygame.display.update.
+
+    :param background: the surface drawn under the sprites; a black surface of the target size is used when None
+    :type background: pygame.Surface
+    :param full_redraw_threshold: the fraction of the surface area above which the whole surface is redrawn instead
+    :type full_redraw_threshold: float
+    """
+
+    def __init__(self, background=None, full_redraw_threshold=0.5):
+        self._background = background
+        self._full_redraw_threshold = full_redraw_threshold
+        self._drawn = dict()
+        self._needs_full_redraw = True
+        self._batch = list()
+
+    @property
+    def background(self):
+        """
+        The surface drawn under the sprites.
+
+        Assigning a new background forces a full redraw on the next frame.
+        """
+
+        return self._background
+
+    @background.setter
+    def background(self, surface):
+        self._background = surface
+        self._needs_full_redraw = True
+
+    @property
+    def full_redraw_threshold(self):
+        """
+        The fraction of the surface area that can be dirty before the renderer falls back to a full redraw.
+        """
+
+        return self._full_redraw_threshold
+
+    @full_redraw_threshold.setter
+    def full_redraw_threshold(self, value):
+        self._full_redraw_threshold = value
+
+    def invalidate(self):
+        """Force a full redraw on the next frame."""
+
+        self._needs_full_redraw = True
+
+    def draw(self, surface, sprites):
+        """
+        Draw the sprites onto the given surface.
+
+        :param surface: the destination surface
+        :type surface: pygame.Surface
+        :param sprites: the sprites to draw, in the drawing order
+        :return: list of the rectangles that have changed, or None if the whole surface has been redrawn
+        :rtype: list
+        """
+
+        if self._background is None or self._background.get_size() != surface.get_size():
+            self._background = pygame.Surface(surface.get_size())
+            self._needs_full_redraw = True
+
+        drawn = dict()
+        dirty_rects = list()
+        for sprite in sprites:
+            state = (pygame.Rect(sprite.rect), sprite.rendered_image) if sprite.is_active else None
+            drawn[sprite] = state
+            previous_state = self._drawn.pop(sprite, None)
+            if state != previous_state or sprite.dirty:
+                if previous_state is not None:
+                    dirty_rects.append(previous_state[0])
+                if state is not None:
+                    dirty_rects.append(state[0])
+            sprite.dirty = False
+        for previous_state in self._drawn.values():
+            if previous_state is not None:
+                dirty_rects.append(previous_state[0])
+        self._drawn = drawn
+
+        if self._needs_full_redraw or self._is_too_dirty(surface, dirty_rects):
+            self._needs_full_redraw = False
+            surface.blit(self._background, (0, 0))
+            draw_sprites(surface, sprites, self._batch)
+            return None
+
+        surface_rect = surface.get_rect()
+        dirty_rects = [rect.clip(surface_rect) for rect in dirty_rects if rect.colliderect(surface_rect)]
+        clip = surface.get_clip()
+        for rect in dirty_rects:
+            surface.set_clip(rect)
+            surface.blit(self._background, rect, rect)
+            draw_sprites(surface, [sprite for sprite in sprites if sprite.rect.colliderect(rect)], self._batch)
+        surface.set_clip(clip)
+        return dirty_rects
+
+    def _is_too_dirty(self, surface, dirty_rects):
+        width, height = surface.get_size()
+        dirty_area = sum(rect.width * rect.height for rect in dirty_rects)
+        return dirty_area > self._full_redraw_threshold * width * height
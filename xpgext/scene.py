@@ -2,10 +2,15 @@ class SceneBase:
     """
     Abstract base class for all the scene types.
 
+    The class attribute preload_images lists the images used by the scene, as paths or tuples (path, convert, alpha)
+    accepted by AssetCache.load_image. They are decoded in the background by SimpleSceneManager.preload_scene.
+
     :param scene_manager: scene manager that owns this scene
     :type scene_manager: SceneManagerBase
     """
 
+    preload_images = ()
+
     def __init__(self, scene_manager):
         self.scene_manager = scene_manager
 
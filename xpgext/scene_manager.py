@@ -1,7 +1,25 @@
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from math import floor
+from time import perf_counter
+
 import pygame
+from pygame.locals import MOUSEMOTION
+
+from xpgext.assets import AssetCache
+from xpgext.rendering import draw_sprites
+from xpgext.spatial import SpatialGrid
+from xpgext.sprite import XPGESprite
 
 SCENE_NOT_REGISTERED_ = "Scene {} has not been registered."
 SCENE_ALREADY_REGISTERED_ = "Scene {} has already been registered."
+SCENE_PRELOADING_FAILED_ = "Preloading assets of scene {} failed."
+SPRITE_ALREADY_ALIVE_ = "cannot spawn sprite '{}' - it is already alive"
+SPRITE_NOT_ALIVE_ = "sprite '{}' cannot be killed, because it is not alive in the scene manager"
+
+PRELOAD_WORKERS = 4
+CULLING_CELL_SIZE = 256
 
 
 class SceneRegisteringError(Exception):
@@ -12,6 +30,19 @@ class SceneLoadingError(Exception):
     """Raised when loading a scene was unsuccessful."""
 
 
+class _SuspendedScene:
+    """The state of a scene kept by the scene manager while the scene is suspended."""
+
+    def __init__(self, scene, sprites, registered, focus_index, focused, kinematic_bodies, collision_bodies):
+        self.scene = scene
+        self.sprites = sprites
+        self.registered = registered
+        self.focus_index = focus_index
+        self.focused = focused
+        self.kinematic_bodies = kinematic_bodies
+        self.collision_bodies = collision_bodies
+
+
 class SimpleSceneManager:
     """
     The class managing the scenes of the game.
@@ -24,9 +55,44 @@ class SimpleSceneManager:
     def __init__(self):
         self._scenes = dict()
         self._current_scene = None
+        self._current_scene_name = None
+        self._scene_retention = 0
+        self._scene_generation = 0
+        self._suspended_scenes = OrderedDict()
         self._sprites = list()
+        self._sprite_indexes = dict()
+        self._removed_count = 0
         self._static = dict()
+        self._assets = AssetCache()
+        self._preload_executor = None
+        self._preloaded_scene = None
+        self._preloaded_images = list()
         self._screen_rect = None
+        self._renderer = None
+        self._camera = None
+        self._camera_surface = None
+        self._cull_index = None
+        self._kinematics = None
+        self._collisions = None
+        self._blit_batch = list()
+        self._interpolation_alpha = 1.0
+        self._time_step = None
+        self._profiler = None
+        self._registered = dict()
+        self._registration_count = 0
+        self._iteration_depth = 0
+        self._draw_order = None
+        self._draw_keys = None
+        self._draw_key_of = dict()
+        self._pending_spawns = dict()
+        self._pending_kills = dict()
+        self._names = dict()
+        self._containers = dict()
+        self._focus_index = SpatialGrid()
+        self._focused = dict()
+        self._event_subscribers = dict()
+        self._updated_sprites = None
+        self._unsynced = set()
 
     @property
     def screen_rect(self):
@@ -38,6 +104,121 @@ class SimpleSceneManager:
             self._screen_rect = pygame.display.get_surface().get_rect()
         return self._screen_rect
 
+    @property
+    def renderer(self):
+        """
+        The renderer used to draw the scene, or None if the whole scene is redrawn every frame.
+
+        Assign an instance of DirtyRectRenderer to this property to redraw only the regions of the screen that
+        have changed. The renderer is invalidated on loading a scene, so the first frame of the scene is always fully
+        redrawn.
+        """
+
+        return self._renderer
+
+    @renderer.setter
+    def renderer(self, renderer):
+        self._renderer = renderer
+
+    @property
+    def camera(self):
+        """
+        The Camera through which the scene is seen, or None if the rects of the sprites are screen coordinates.
+
+        While a camera is assigned, the scene manager keeps all the sprites in a spatial index, so only the sprites
+        whose rects intersect the viewport are drawn, and the mouse position is converted to world coordinates before
+        the focus of the sprites is updated. The index is synchronised only with the sprites whose rects have changed
+        since the last frame (see invalidate_sprite), so the cost of drawing grows with the number of the visible and
+        the moving sprites rather than with the size of the level. The renderer is not used while a camera is assigned,
+        as scrolling changes the whole screen anyway.
+        """
+
+        return self._camera
+
+    @camera.setter
+    def camera(self, camera):
+        self._camera = camera
+        self._camera_surface = None
+        if self._renderer is not None:
+            self._renderer.invalidate()
+        if camera is None:
+            self._cull_index = None
+        elif self._cull_index is None:
+            self._cull_index = SpatialGrid(CULLING_CELL_SIZE)
+            for sprite in self._registered:
+                self._cull_index.add(sprite)
+
+    @property
+    def kinematics(self):
+        """
+        The KinematicsSystem moving the sprites registered in it after every update, or None if it is disabled.
+
+        The system is cleared when a new scene is loaded. The sprites of a suspended scene are removed from the system
+        and registered again, with their velocities and accelerations, when the scene is resumed.
+        """
+
+        return self._kinematics
+
+    @kinematics.setter
+    def kinematics(self, kinematics):
+        self._kinematics = kinematics
+
+    @property
+    def collisions(self):
+        """
+        The CollisionSystem detecting the collisions of the sprites registered in it, or None if it is disabled.
+
+        The system is stepped after every update, once the sprites have moved. The components of the colliding sprites
+        receive on_collision_enter, on_collision_stay and on_collision_exit with the other sprite, and they can spawn
+        and kill sprites safely, as it is deferred until all the collisions have been delivered. Like the kinematics
+        system, it is cleared when a new scene is loaded, and the bodies of a suspended scene are restored when it is
+        resumed.
+        """
+
+        return self._collisions
+
+    @collisions.setter
+    def collisions(self, collisions):
+        self._collisions = collisions
+
+    @property
+    def interpolation_alpha(self):
+        """
+        The fraction of the simulation step elapsed since the last update, passed to the draw method.
+
+        In the fixed timestep mode of XPGEApplication, it is a value between 0 and 1 that can be used by sprites
+        with custom draw methods to interpolate between their previous and current state. Otherwise, it is 1.
+        """
+
+        return self._interpolation_alpha
+
+    @property
+    def time_step(self):
+        """
+        The simulated time in seconds advanced by the current update, or None if it has not been given.
+
+        XPGEApplication passes 1 / tick_rate in the fixed timestep mode and the duration of the previous frame
+        otherwise. The kinematics system and the particle emitters advance by this time, falling back on their own
+        time_step property when it is None.
+        """
+
+        return self._time_step
+
+    @property
+    def profiler(self):
+        """
+        The FrameProfiler recording the time spent in the hooks of the components, or None if profiling is disabled.
+
+        The hooks called by the scene manager are timed per component type. Events are timed per sprite type under
+        the name 'SpriteType.handle_event', as well as the update of sprites overriding XPGESprite.update.
+        """
+
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler):
+        self._profiler = profiler
+
     @property
     def static(self):
         """
@@ -49,6 +230,36 @@ class SimpleSceneManager:
 
         return self._static
 
+    @property
+    def assets(self):
+        """
+        The AssetCache shared by all the scenes.
+
+        Like static, the cache is kept when a new scene is loaded, so the images used by many scenes are loaded from
+        disk only once. Scenes should load their images with scene_manager.assets.load_image.
+        """
+
+        return self._assets
+
+    @property
+    def scene_retention(self):
+        """
+        The maximum number of the suspended scenes kept by the scene manager.
+
+        By default it is 0, and every call to load_scene creates a new instance of the scene. When it is greater,
+        the scene being left is suspended instead of discarded: the components of its sprites receive on_suspend,
+        and the scene is kept with its sprites and indexes. Loading it again resumes it without reconstruction,
+        calling on_resume instead of on_scene_loaded and on_spawn. When there are more suspended scenes than allowed,
+        the least recently suspended ones are discarded.
+        """
+
+        return self._scene_retention
+
+    @scene_retention.setter
+    def scene_retention(self, value):
+        self._scene_retention = value
+        self._discard_suspended_scenes()
+
     def register_scene(self, scene, name):
         """
         Register new scene for later use. It will be accessible under the provided name.
@@ -63,105 +274,720 @@ class SimpleSceneManager:
             raise SceneRegisteringError(SCENE_ALREADY_REGISTERED_.format(name))
         self._scenes[name] = scene
 
+    @property
+    def preload_progress(self):
+        """
+        The fraction of the images of the preloaded scene that have already been decoded.
+
+        It is a value between 0 and 1, convenient for drawing a loading screen. When no scene is being preloaded,
+        it is 1.
+        """
+
+        if len(self._preloaded_images) == 0:
+            return 1.0
+        done = sum(1 for key, future in self._preloaded_images if future.done())
+        return done / len(self._preloaded_images)
+
+    @property
+    def is_preloading(self):
+        """Is a scene being preloaded?"""
+
+        return self._preloaded_scene is not None
+
+    def preload_scene(self, name):
+        """
+        Start loading the scene in the background.
+
+        The images listed in the preload_images attribute of the scene are decoded on a thread pool, while the current
+        scene keeps running. Once all of them are decoded, the scene is loaded at the beginning of the next update,
+        and its images are served from the asset cache.
+
+        :param name: name of the scene to load
+        :type name: str
+        """
+
+        try:
+            scene = self._scenes[name]
+        except KeyError:
+            raise SceneLoadingError(SCENE_NOT_REGISTERED_.format(name))
+        if self._preload_executor is None:
+            self._preload_executor = ThreadPoolExecutor(max_workers=PRELOAD_WORKERS)
+        keys = dict()
+        for image in getattr(scene, "preload_images", ()):
+            key = AssetCache.make_key(image) if isinstance(image, str) else AssetCache.make_key(*image)
+            if key not in self._assets:
+                keys[key] = None
+        self._preloaded_scene = name
+        self._preloaded_images = [(key, self._preload_executor.submit(pygame.image.load, key[0])) for key in keys]
+
+    def _commit_preloaded_scene(self):
+        if self._preloaded_scene is None or self.preload_progress < 1:
+            return None
+        name = self._preloaded_scene
+        try:
+            for key, future in self._preloaded_images:
+                self._assets.store(key, future.result())
+        except (pygame.error, OSError) as error:
+            self._preloaded_scene = None
+            self._preloaded_images = list()
+            raise SceneLoadingError(SCENE_PRELOADING_FAILED_.format(name)) from error
+        self.load_scene(name)
+
     def load_scene(self, name):
         """
         Load a previously registered scene.
 
+        Loading a scene cancels preloading of any other scene. If the scene has been suspended, it is resumed
+        (see scene_retention).
+
         :param name: name of the scene to load
         :type name: str
         """
 
+        self._preloaded_scene = None
+        self._preloaded_images = list()
+        suspended_scene = self._suspended_scenes.pop(name, None)
+        if suspended_scene is not None:
+            self._leave_current_scene(name)
+            self._resume_scene(name, suspended_scene)
+            return None
         try:
-            self._current_scene = self._scenes[name](self)
+            scene = self._scenes[name](self)
         except KeyError:
             raise SceneLoadingError(SCENE_NOT_REGISTERED_.format(name))
         else:
-            self._sprites.clear()
+            self._leave_current_scene(name)
+            self._current_scene = scene
+            self._current_scene_name = name
             for sprite in self._current_scene.sprites:
+                self._sprite_indexes[sprite] = len(self._sprites)
                 self._sprites.append(sprite)
-            for sprite in self._sprites:
-                for component in sprite.components:
-                    component.on_scene_loaded()
-            for sprite in self._sprites:
-                for component in sprite.components:
-                    component.on_spawn()
-
-    def draw(self, surface):
+                self._register_sprite(sprite)
+            for hook in ("on_scene_loaded", "on_spawn"):
+                for sprite in list(self._sprites):
+                    if sprite in self._sprite_indexes:
+                        self._call_hooks(sprite, hook)
+
+    def _leave_current_scene(self, next_name):
+        self._scene_generation += 1
+        self._pending_spawns.clear()
+        self._pending_kills.clear()
+        self._invalidate_draw_order()
+        if self._renderer is not None:
+            self._renderer.invalidate()
+        self._event_subscribers.clear()
+        self._updated_sprites = None
+        for sprite in self._registered:
+            sprite._managed = False
+        if self._scene_retention > 0 and self._current_scene is not None and self._current_scene_name != next_name:
+            self._compact_sprites()
+            self._suspended_scenes[self._current_scene_name] = _SuspendedScene(
+                self._current_scene, self._sprites, self._registered, self._focus_index, self._focused,
+                self._get_kinematic_bodies(), self._get_collision_bodies())
+            self._discard_suspended_scenes()
+            self._sprites = list()
+            self._sprite_indexes = dict()
+            self._registered = dict()
+            self._names = dict()
+            self._containers = dict()
+            self._focus_index = SpatialGrid()
+            self._focused = dict()
+            if self._cull_index is not None:
+                self._cull_index = SpatialGrid(CULLING_CELL_SIZE)
+            for sprite in self._suspended_scenes[self._current_scene_name].sprites:
+                self._call_hooks(sprite, "on_suspend")
+        else:
+            self._registered.clear()
+            self._names.clear()
+            self._containers.clear()
+            self._sprites.clear()
+            self._sprite_indexes.clear()
+            self._removed_count = 0
+            self._focus_index.clear()
+            self._focused.clear()
+            if self._cull_index is not None:
+                self._cull_index.clear()
+        if self._kinematics is not None:
+            self._kinematics.clear()
+        if self._collisions is not None:
+            self._collisions.clear()
+        self._unsynced.clear()
+
+    def _get_kinematic_bodies(self):
+        if self._kinematics is None:
+            return list()
+        return [(sprite, self._kinematics.get_velocity(sprite), self._kinematics.get_acceleration(sprite))
+                for sprite in self._kinematics]
+
+    def _get_collision_bodies(self):
+        if self._collisions is None:
+            return list()
+        return [(sprite,) + self._collisions.get_layer(sprite) for sprite in self._collisions]
+
+    def _resume_scene(self, name, suspended_scene):
+        self._current_scene = suspended_scene.scene
+        self._current_scene_name = name
+        self._sprites = suspended_scene.sprites
+        self._sprite_indexes = {sprite: index for index, sprite in enumerate(self._sprites)}
+        self._registered = suspended_scene.registered
+        self._names = dict()
+        for sprite in self._registered:
+            self._add_name(sprite)
+        self._containers = dict.fromkeys(sprite for sprite in self._registered if self._is_container(sprite))
+        self._focus_index = suspended_scene.focus_index
+        self._focused = suspended_scene.focused
+        for sprite in self._registered:
+            sprite._managed = True
+        self._focus_index.refresh()
+        if self._cull_index is not None:
+            for sprite in self._registered:
+                self._cull_index.add(sprite)
+        if self._kinematics is not None:
+            for sprite, velocity, acceleration in suspended_scene.kinematic_bodies:
+                self._kinematics.add(sprite, velocity, acceleration)
+        if self._collisions is not None:
+            for sprite, layer, mask in suspended_scene.collision_bodies:
+                self._collisions.add(sprite, layer, mask)
+        for sprite in list(self._sprites):
+            if sprite in self._sprite_indexes:
+                self._call_hooks(sprite, "on_resume")
+
+    def _discard_suspended_scenes(self):
+        while len(self._suspended_scenes) > self._scene_retention:
+            self._suspended_scenes.popitem(last=False)
+
+    def draw(self, surface, alpha=1.0):
         """
         Draw all the scene elements on the given surface.
 
+        The sprites are drawn from the lowest layer to the highest one, and within a layer from the lowest depth
+        to the highest one. Sprites with equal layer and depth are drawn in the reversed order of spawning.
+
+        The images of the sprites that do not override XPGESprite.draw are blitted in batches with
+        pygame.Surface.blits.
+
+        When a camera is assigned, only the sprites intersecting its viewport are drawn, translated by the position
+        of the camera. If the zoom of the camera is not 1, they are drawn onto an intermediate surface of the size
+        of the viewport, which is then scaled onto the given surface.
+
         :param surface: the pygame main surface
         :type surface: pygame.Surface
+        :param alpha: the interpolation factor between the last two simulation steps
+        :type alpha: float
+        :return: list of the rectangles that have changed, or None if the whole surface has been redrawn
+        :rtype: list
         """
 
+        self._interpolation_alpha = alpha
+        if self._camera is not None:
+            self._draw_through_camera(surface)
+            return None
+        if self._renderer is not None:
+            return self._renderer.draw(surface, self._get_draw_order())
+
         surface.fill((0, 0, 0))
-        for sprite in reversed(self._sprites):
-            sprite.draw(surface)
+        draw_sprites(surface, self._get_draw_order(), self._blit_batch)
+        return None
+
+    def _draw_through_camera(self, surface):
+        if self._unsynced:
+            self._synchronise_indexes()
+        viewport = self._camera.get_viewport(surface.get_size())
+        self._get_draw_order()
+        sprites = self._cull_index.query_rect(viewport)
+        sprites.sort(key=self._draw_key_of.__getitem__)
+        offset = (-viewport.x, -viewport.y)
+        if self._camera.zoom == 1:
+            surface.fill((0, 0, 0))
+            draw_sprites(surface, sprites, self._blit_batch, offset)
+            return None
+        if self._camera_surface is None or self._camera_surface.get_size() != viewport.size:
+            self._camera_surface = pygame.Surface(viewport.size)
+        self._camera_surface.fill((0, 0, 0))
+        draw_sprites(self._camera_surface, sprites, self._blit_batch, offset)
+        pygame.transform.scale(self._camera_surface, surface.get_size(), surface)
 
     def handle_event(self, event):
         """
         Pass the event to each of the scene elements until one of them handles the event.
 
+        The sprites receive the event in the reversed drawing order, so the sprite on top is the first one.
+
+        Only the sprites interested in the type of the event are checked. They are looked up in a dispatch table built
+        lazily for each event type and rebuilt after the sprites or their components change.
+
+        On pygame.MOUSEMOTION, the focus of the sprites is updated beforehand. Only the sprites that were focused
+        and the sprites found in the spatial index under the new cursor position are checked. When a camera is
+        assigned, the cursor position is converted to world coordinates first.
+
+        When a sprite loads another scene while handling the event, the event is not passed any further.
+
         :param event: event to handle
         :type event: pygame.event.Event
         """
 
-        for sprite in reversed(self._sprites):
-            if sprite.handle_event(event):
-                break
-
-    def update(self):
+        generation = self._scene_generation
+        self._iteration_depth += 1
+        try:
+            if event.type == MOUSEMOTION:
+                if self._camera is None:
+                    self._update_focus(event.pos[0], event.pos[1])
+                else:
+                    x, y = self._camera.screen_to_world(event.pos)
+                    self._update_focus(floor(x), floor(y))
+            subscribers = self._get_event_subscribers(event.type) if self._scene_generation == generation else ()
+            if self._profiler is None:
+                for sprite in subscribers:
+                    if sprite.handle_event(event) or self._scene_generation != generation:
+                        break
+            else:
+                for sprite in subscribers:
+                    handled = self._profile_sprite_method(sprite, "handle_event", event)
+                    if handled or self._scene_generation != generation:
+                        break
+        finally:
+            self._iteration_depth -= 1
+        self._apply_pending_changes()
+
+    def update(self, time_step=None):
         """
         Update all the scene elements. Called every frame.
+
+        If a preloaded scene is ready, it is loaded first. The sprites spawned and killed while updating are added
+        and removed after all the sprites have been updated. Then the kinematics system, if any, moves its sprites,
+        and the collisions detected by the collision system are delivered to the components. When a sprite loads
+        another scene while being updated, the remaining sprites of the left scene are not updated.
+
+        Only the sprites that override update or have components implementing on_update are updated, so static
+        sprites cost nothing. The sprites moved while updating, however their rects have been modified, are found
+        at their new position by the focus and the culling, as the sprites report the changes of their rects.
+
+        :param time_step: the simulated time in seconds since the previous update (see time_step)
+        :type time_step: float
         """
 
-        for sprite in reversed(self._sprites):
-            sprite.update()
+        self._time_step = time_step
+        self._commit_preloaded_scene()
+        updated_sprites = self._get_updated_sprites()
+        generation = self._scene_generation
+        self._iteration_depth += 1
+        try:
+            if self._profiler is None:
+                for sprite in updated_sprites:
+                    sprite.update()
+                    if self._scene_generation != generation:
+                        break
+            else:
+                for sprite in updated_sprites:
+                    self._profile_sprite_update(sprite)
+                    if self._scene_generation != generation:
+                        break
+        finally:
+            self._iteration_depth -= 1
+        self._apply_pending_changes()
+        if self._kinematics is not None:
+            self._kinematics.step(time_step)
+        if self._collisions is not None:
+            self._dispatch_collisions()
+
+    def _get_updated_sprites(self):
+        if self._updated_sprites is None:
+            self._updated_sprites = [sprite for sprite in reversed(self._sprites)
+                                     if sprite is not None and self._updates_itself(sprite)]
+        return self._updated_sprites
+
+    @staticmethod
+    def _updates_itself(sprite):
+        if getattr(type(sprite), "update", None) is not XPGESprite.update:
+            return True
+        if "update" in getattr(sprite, "__dict__", ()):
+            return True
+        return len(sprite.components_with_hook("on_update")) > 0
+
+    def _synchronise_indexes(self):
+        focus_index = self._focus_index
+        cull_index = self._cull_index
+        for sprite in self._unsynced:
+            if sprite in focus_index:
+                focus_index.update(sprite)
+            if cull_index is not None and sprite in cull_index:
+                cull_index.update(sprite)
+        self._unsynced.clear()
+
+    def _dispatch_collisions(self):
+        entered, stayed, exited = self._collisions.step()
+        collisions = self._collisions
+        self._iteration_depth += 1
+        try:
+            for hook, pairs in (("on_collision_enter", entered), ("on_collision_stay", stayed),
+                                ("on_collision_exit", exited)):
+                for first, second in pairs:
+                    if first in collisions:
+                        self._call_hooks(first, hook, second)
+                    if second in collisions:
+                        self._call_hooks(second, hook, first)
+        finally:
+            self._iteration_depth -= 1
+        self._apply_pending_changes()
 
     def spawn(self, sprite):
         """
         Spawn the sprite.
 
+        When called while the scene manager updates the sprites or handles an event, spawning is deferred until
+        all the sprites have been processed.
+
         :param sprite: the sprite to spawn
+        :raise ValueError: when the sprite is already alive
         """
 
-        if sprite in self._sprites:
-            msg = "cannot spawn sprite '{}' - it is already alive"
-            raise ValueError(msg.format(sprite.name))
+        self.spawn_many((sprite,))
 
-        self._sprites.append(sprite)
-        for component in sprite.components:
-            component.on_spawn()
+    def spawn_many(self, sprites):
+        """
+        Spawn all the given sprites.
+
+        This method is faster than calling spawn for each sprite. If any of the sprites is already alive, none of
+        them is spawned.
+
+        :param sprites: the sprites to spawn
+        :raise ValueError: when any of the sprites is already alive or is given twice
+        """
+
+        sprites = list(sprites)
+        checked = set()
+        for sprite in sprites:
+            if self._is_alive(sprite) or sprite in checked:
+                raise ValueError(SPRITE_ALREADY_ALIVE_.format(sprite.name))
+            checked.add(sprite)
+
+        if self._iteration_depth > 0:
+            for sprite in sprites:
+                if sprite in self._pending_kills:
+                    del self._pending_kills[sprite]
+                else:
+                    self._pending_spawns[sprite] = None
+            return None
+        for sprite in sprites:
+            self._sprite_indexes[sprite] = len(self._sprites)
+            self._sprites.append(sprite)
+        for sprite in sprites:
+            self._register_sprite(sprite)
+        for sprite in sprites:
+            self._call_hooks(sprite, "on_spawn")
 
     def kill(self, sprite):
         """
         Remove the sprite from the game.
 
+        When called while the scene manager updates the sprites or handles an event, killing is deferred until all
+        the sprites have been processed.
+
         :param sprite: the sprite to remove
+        :raise ValueError: when the sprite is not alive
         """
 
-        try:
-            self._sprites.remove(sprite)
-        except ValueError:
-            msg = "sprite '{}' cannot be killed, because it is not alive in the scene manager"
-            raise ValueError(msg.format(sprite.name))
+        self.kill_many((sprite,))
+
+    def kill_many(self, sprites):
+        """
+        Remove all the given sprites from the game.
+
+        This method is faster than calling kill for each sprite, because the drawing order is compacted only once.
+        If any of the sprites is not alive, none of them is removed.
+
+        The killed sprites leave empty slots in the list of the sprites, which is compacted once at least half of it
+        is empty, so killing a single sprite takes constant time on average.
+
+        :param sprites: the sprites to remove
+        :raise ValueError: when any of the sprites is not alive or is given twice
+        """
+
+        sprites = list(sprites)
+        checked = set()
+        for sprite in sprites:
+            if not self._is_alive(sprite) or sprite in checked:
+                raise ValueError(SPRITE_NOT_ALIVE_.format(sprite.name))
+            checked.add(sprite)
+
+        if self._iteration_depth > 0:
+            for sprite in sprites:
+                if sprite in self._pending_spawns:
+                    del self._pending_spawns[sprite]
+                else:
+                    self._pending_kills[sprite] = None
+            return None
+        for sprite in sprites:
+            self._sprites[self._sprite_indexes.pop(sprite)] = None
+        self._removed_count += len(sprites)
+        if 2 * self._removed_count >= len(self._sprites):
+            self._compact_sprites()
+        if len(sprites) > 1:
+            if self._draw_order is not None:
+                order = [(key, sprite) for key, sprite in zip(self._draw_keys, self._draw_order)
+                         if sprite not in checked]
+                self._draw_keys = [key for key, sprite in order]
+                self._draw_order = [sprite for key, sprite in order]
+                for sprite in sprites:
+                    self._draw_key_of.pop(sprite, None)
+        for sprite in sprites:
+            self._unregister_sprite(sprite)
+        for sprite in sprites:
+            self._call_hooks(sprite, "on_kill")
+
+    def _compact_sprites(self):
+        if self._removed_count == 0:
+            return None
+        self._sprites[:] = [sprite for sprite in self._sprites if sprite is not None]
+        self._sprite_indexes = {sprite: index for index, sprite in enumerate(self._sprites)}
+        self._removed_count = 0
+
+    def _is_alive(self, sprite):
+        if sprite in self._pending_spawns:
+            return True
+        return sprite in self._registered and sprite not in self._pending_kills
+
+    def _apply_pending_changes(self):
+        while self._iteration_depth == 0 and (self._pending_kills or self._pending_spawns):
+            kills = list(self._pending_kills)
+            spawns = list(self._pending_spawns)
+            self._pending_kills.clear()
+            self._pending_spawns.clear()
+            if kills:
+                self.kill_many(kills)
+            if spawns:
+                self.spawn_many(spawns)
+
+    def refresh_sprite(self, sprite):
+        """
+        Update the data the scene manager keeps about the sprite.
+
+        This method is called by the sprite when its position, image or takes_focus property changes. It needs to be
+        called manually only when the rect of a sprite registered in the kinematics system has been modified directly.
+
+        :param sprite: the sprite that has changed
+        """
+
+        self._unsynced.discard(sprite)
+        if sprite.takes_focus:
+            self._focus_index.add(sprite)
         else:
-            for component in sprite.components:
-                component.on_kill()
+            self._focus_index.discard(sprite)
+        if self._cull_index is not None:
+            self._cull_index.add(sprite)
+        if self._kinematics is not None:
+            self._kinematics.sync(sprite)
+
+    def invalidate_sprite(self, sprite):
+        """
+        Remember that the rect of the sprite has been modified.
+
+        This method is called by the sprite whenever its rect changes. The spatial indexes are synchronised with
+        the rects of the invalidated sprites only when they are queried, i.e. when the next pygame.MOUSEMOTION arrives
+        or the scene is drawn through a camera, so a sprite moved many times in a frame is reindexed once.
+
+        :param sprite: the sprite whose rect has changed
+        """
+
+        self._unsynced.add(sprite)
+
+    def rename_sprite(self, sprite, old_name):
+        """
+        Move the sprite in the name index.
+
+        This method is called by the sprite when its name changes.
+
+        :param sprite: the renamed sprite
+        :param old_name: the previous name of the sprite
+        :type old_name: str
+        """
+
+        self._remove_name(sprite, old_name)
+        self._add_name(sprite)
+        sprites = self._names.get(sprite.name)
+        if sprites is not None and len(sprites) > 1 and self._registered[sprites[-2]] > self._registered[sprite]:
+            sprites.sort(key=self._registered.__getitem__)
+
+    def refresh_event_handlers(self, sprite):
+        """
+        Invalidate the event dispatch table and the list of the sprites to update.
+
+        This method is called by the sprite when its components change.
+
+        :param sprite: the sprite whose components have changed
+        """
+
+        self._event_subscribers.clear()
+        self._updated_sprites = None
+
+    def _get_event_subscribers(self, event_type):
+        sprites = self._event_subscribers.get(event_type)
+        if sprites is None:
+            sprites = [sprite for sprite in reversed(self._get_draw_order()) if sprite.handles_event_type(event_type)]
+            self._event_subscribers[event_type] = sprites
+        return sprites
+
+    def _call_hooks(self, sprite, hook, *args):
+        if self._profiler is None:
+            for component in sprite.components_with_hook(hook):
+                getattr(component, hook)(*args)
+        else:
+            for component in sprite.components_with_hook(hook):
+                self._profiler.call_hook(component, hook, *args)
+
+    def _profile_sprite_update(self, sprite):
+        if getattr(type(sprite), "update", None) is XPGESprite.update:
+            if sprite.is_active:
+                for component in sprite.components_with_hook("on_update"):
+                    self._profiler.call_hook(component, "on_update")
+        else:
+            self._profile_sprite_method(sprite, "update")
+
+    def _profile_sprite_method(self, sprite, method, *args):
+        start = perf_counter()
+        result = getattr(sprite, method)(*args)
+        self._profiler.record_hook(type(sprite).__name__ + "." + method, perf_counter() - start)
+        return result
+
+    def reorder_sprite(self, sprite):
+        """
+        Move the sprite to the position in the drawing order matching its layer and depth.
+
+        This method is called by the sprite when its layer or depth changes. Only this sprite is repositioned;
+        the rest of the drawing order is not sorted again. The sprite is marked as dirty, so the renderer redraws it
+        with the sprites it overlaps in their new order.
+
+        :param sprite: the sprite whose layer or depth has changed
+        """
+
+        sprite._dirty = True
+        if self._draw_order is None:
+            return None
+        self._remove_from_draw_order(sprite)
+        self._insert_into_draw_order(sprite)
+        self._event_subscribers.clear()
+
+    def _get_draw_order(self):
+        if self._draw_order is None:
+            keys = dict()
+            for index, sprite in enumerate(self._sprites):
+                if sprite is None:
+                    continue
+                keys[sprite] = (sprite.layer, sprite.depth, -self._registered.get(sprite, index))
+            self._draw_order = sorted(keys, key=keys.__getitem__)
+            self._draw_keys = [keys[sprite] for sprite in self._draw_order]
+            self._draw_key_of = keys
+        return self._draw_order
+
+    def _invalidate_draw_order(self):
+        self._draw_order = None
+        self._draw_keys = None
+        self._draw_key_of = dict()
+
+    def _insert_into_draw_order(self, sprite):
+        key = (sprite.layer, sprite.depth, -self._registered[sprite])
+        index = bisect_left(self._draw_keys, key)
+        self._draw_keys.insert(index, key)
+        self._draw_order.insert(index, sprite)
+        self._draw_key_of[sprite] = key
+
+    def _remove_from_draw_order(self, sprite):
+        key = self._draw_key_of.pop(sprite, None)
+        if key is None:
+            return None
+        index = bisect_left(self._draw_keys, key)
+        del self._draw_keys[index]
+        del self._draw_order[index]
+
+    def _register_sprite(self, sprite):
+        sprite._managed = True
+        self._event_subscribers.clear()
+        self._updated_sprites = None
+        self._registered[sprite] = self._registration_count
+        self._registration_count += 1
+        if self._draw_order is not None:
+            self._insert_into_draw_order(sprite)
+        self._add_name(sprite)
+        if self._is_container(sprite):
+            self._containers[sprite] = None
+        self.refresh_sprite(sprite)
+
+    def _unregister_sprite(self, sprite):
+        sprite._managed = False
+        self._event_subscribers.clear()
+        self._updated_sprites = None
+        self._unsynced.discard(sprite)
+        if self._draw_order is not None:
+            self._remove_from_draw_order(sprite)
+        if self._registered.pop(sprite, None) is not None:
+            self._remove_name(sprite, sprite.name)
+        self._containers.pop(sprite, None)
+        self._focus_index.discard(sprite)
+        self._focused.pop(sprite, None)
+        if self._cull_index is not None:
+            self._cull_index.discard(sprite)
+        if self._kinematics is not None:
+            self._kinematics.discard(sprite)
+        if self._collisions is not None:
+            self._collisions.discard(sprite)
+
+    @staticmethod
+    def _is_container(sprite):
+        return getattr(type(sprite), "find_by_name", None) is not XPGESprite.find_by_name
+
+    def _add_name(self, sprite):
+        if sprite.name is not None:
+            self._names.setdefault(sprite.name, list()).append(sprite)
+
+    def _remove_name(self, sprite, name):
+        sprites = self._names.get(name)
+        if sprites is not None:
+            sprites.remove(sprite)
+            if not sprites:
+                del self._names[name]
+
+    def _update_focus(self, x, y):
+        if self._unsynced:
+            self._synchronise_indexes()
+        generation = self._scene_generation
+        candidates = dict.fromkeys(self._focused)
+        candidates.update(dict.fromkeys(self._focus_index.query_point(x, y)))
+        for sprite in candidates:
+            if sprite.is_active and sprite.takes_focus:
+                sprite._set_focus(sprite.contains_point(x, y))
+                if self._scene_generation != generation:
+                    break
+            if sprite.focus:
+                self._focused[sprite] = None
+            else:
+                self._focused.pop(sprite, None)
 
     def find_by_name(self, name):
         """
         Find elements of the given name.
 
+        The sprites are looked up in the name index maintained on spawning, killing and renaming them, and they are
+        returned in the order they have entered the scene. The sprites whose class overrides find_by_name, e.g.
+        containers exposing their children, are asked for the matching elements instead, at their place in the order.
+
         :param name: name of the elements to find
         :type name: str
         :return: list of elements of the given name
         :rtype: list
         """
 
+        sprites = self._names.get(name, ())
+        if not self._containers:
+            return list(sprites)
+        candidates = [sprite for sprite in sprites if sprite not in self._containers]
+        candidates.extend(self._containers)
+        candidates.sort(key=self._registered.__getitem__)
         result = list()
-        for sprite in self._sprites:
-            result.extend(sprite.find_by_name(name))
+        for sprite in candidates:
+            if sprite in self._containers:
+                result.extend(sprite.find_by_name(name))
+            else:
+                result.append(sprite)
         return result
 
     def get_by_name(self, name):
@@ -173,7 +999,10 @@ class SimpleSceneManager:
         :return: element
         """
 
-        sprites = self.find_by_name(name)
-        if len(sprites) == 0:
+        if self._containers:
+            sprites = self.find_by_name(name)
+        else:
+            sprites = self._names.get(name)
+        if not sprites:
             return None
         return sprites[0]
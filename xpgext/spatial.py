@@ -0,0 +1,146 @@
+import pygame
+
+
+class SpatialGrid:
+    """
+    Uniform grid indexing objects by their rectangles.
+
+    The grid divides the plane into square cells and remembers which objects overlap each cell, so point and area
+    queries only have to check the objects in the cells they touch. Indexed objects must have a rect attribute
+    holding a pygame.Rect. The grid keeps a copy of the rectangle of each object, so it has to be told about their
+    changes with the update or refresh methods.
+
+    :param cell_size: the width and the height of a single cell in pixels
+    :type cell_size: int
+    """
+
+    def __init__(self, cell_size=64):
+        self._cell_size = cell_size
+        self._cells = dict()
+        self._entries = dict()
+
+    @property
+    def cell_size(self):
+        """The width and the height of a single cell in pixels."""
+
+        return self._cell_size
+
+    def __contains__(self, item):
+        return item in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, item):
+        """
+        Add the object to the grid, or update its position if it is already there.
+
+        :param item: object with a rect attribute
+        """
+
+        if item in self._entries:
+            self.update(item)
+            return None
+        rect = pygame.Rect(item.rect)
+        cells = self._cells_of(rect)
+        self._entries[item] = (rect, cells)
+        for cell in cells:
+            self._cells.setdefault(cell, dict())[item] = None
+
+    def discard(self, item):
+        """
+        Remove the object from the grid if it is present.
+
+        :param item: object to remove
+        """
+
+        entry = self._entries.pop(item, None)
+        if entry is not None:
+            self._remove_from_cells(item, entry[1])
+
+    def update(self, item):
+        """
+        Update the position of the object in the grid.
+
+        :param item: object already present in the grid
+        :return: True if the rectangle of the object has changed
+        :rtype: bool
+        """
+
+        rect, cells = self._entries[item]
+        if rect == item.rect:
+            return False
+        rect = pygame.Rect(item.rect)
+        new_cells = self._cells_of(rect)
+        if new_cells != cells:
+            self._remove_from_cells(item, cells)
+            for cell in new_cells:
+                self._cells.setdefault(cell, dict())[item] = None
+        self._entries[item] = (rect, new_cells)
+        return True
+
+    def refresh(self):
+        """Update the positions of all the objects in the grid."""
+
+        for item in self._entries:
+            self.update(item)
+
+    def clear(self):
+        """Remove all the objects from the grid."""
+
+        self._cells.clear()
+        self._entries.clear()
+
+    def query_point(self, x, y):
+        """
+        Find the objects whose rectangles contain the given point.
+
+        :param x: x coordinate of the point
+        :type x: int
+        :param y: y coordinate of the point
+        :type y: int
+        :return: list of the objects
+        :rtype: list
+        """
+
+        cell = self._cells.get((x // self._cell_size, y // self._cell_size))
+        if cell is None:
+            return list()
+        entries = self._entries
+        return [item for item in cell if entries[item][0].collidepoint(x, y)]
+
+    def query_rect(self, rect):
+        """
+        Find the objects whose rectangles overlap the given one.
+
+        :param rect: the area to check
+        :type rect: pygame.Rect
+        :return: list of the objects, each one appearing once
+        :rtype: list
+        """
+
+        result = dict()
+        entries = self._entries
+        for cell in self._cells_of(rect):
+            for item in self._cells.get(cell, ()):
+                if item not in result and entries[item][0].colliderect(rect):
+                    result[item] = None
+        return list(result)
+
+    def _cells_of(self, rect):
+        size = self._cell_size
+        left = rect.left // size
+        top = rect.top // size
+        right = (rect.right - 1) // size if rect.width > 0 else left
+        bottom = (rect.bottom - 1) // size if rect.height > 0 else top
+        return tuple((x, y) for x in range(left, right + 1) for y in range(top, bottom + 1))
+
+    def _remove_from_cells(self, item, cells):
+        for cell in cells:
+            items = self._cells[cell]
+            del items[item]
+            if not items:
+                del self._cells[cell]
@@ -1,6 +1,13 @@
 import pygame
 from pygame.locals import *
 
+from xpgext import masks, transform
+
+HOOKS = ("on_scene_loaded", "on_update", "on_handle_event", "on_click", "on_hover", "on_hover_exit", "on_spawn",
+         "on_kill", "on_suspend", "on_resume", "on_collision_enter", "on_collision_stay", "on_collision_exit")
+
+_overridden_hooks = dict()
+
 
 class ComponentNotFoundError(Exception):
     """
@@ -8,24 +15,216 @@ class ComponentNotFoundError(Exception):
     """
 
 
-class XPGESprite(pygame.sprite.Sprite):
+def get_overridden_hooks(component_type):
     """
-    Base class for all the visible game elements.
+    Get the names of the hooks of BehaviourBase overridden by the given type.
+
+    The result is computed once per type. Types that do not derive from BehaviourBase, i.e. from SpriteBehaviour
+    or CompactBehaviour, are assumed to implement all the hooks.
+
+    :param component_type: type of the component
+    :type component_type: type
+    :return: set of the names of the overridden hooks
+    :rtype: frozenset
     """
 
-    def __init__(self, scene_manager, *groups):
-        super().__init__(*groups)
+    hooks = _overridden_hooks.get(component_type)
+    if hooks is None:
+        if isinstance(component_type, type) and issubclass(component_type, BehaviourBase):
+            hooks = frozenset(hook for hook in HOOKS
+                              if getattr(component_type, hook) is not getattr(BehaviourBase, hook))
+        else:
+            hooks = frozenset(HOOKS)
+        _overridden_hooks[component_type] = hooks
+    return hooks
+
+
+class ComponentList(list):
+    """
+    List holding the components of a XPGESprite.
+
+    It behaves like a regular list, but it lets the sprite know whenever its content changes, so the sprite can
+    invalidate the data it caches about its components.
+
+    :param sprite: the sprite owning the list
+    :type sprite: XPGESprite
+    """
+
+    __slots__ = ("_sprite",)
+
+    def __init__(self, sprite):
+        super().__init__()
+        self._sprite = sprite
+
+    def _changed(self):
+        self._sprite._components_changed()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._changed()
+        return result
+
+    def __imul__(self, other):
+        result = super().__imul__(other)
+        self._changed()
+        return result
+
+    def append(self, component):
+        super().append(component)
+        self._changed()
+
+    def extend(self, components):
+        super().extend(components)
+        self._changed()
+
+    def insert(self, index, component):
+        super().insert(index, component)
+        self._changed()
+
+    def remove(self, component):
+        super().remove(component)
+        self._changed()
+
+    def pop(self, index=-1):
+        component = super().pop(index)
+        self._changed()
+        return component
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        super().reverse()
+        self._changed()
+
+
+_set_rect_attribute = pygame.Rect.__setattr__
+
+
+class SpriteRect(pygame.Rect):
+    """
+    Rectangle of a XPGESprite.
+
+    It behaves like a regular pygame.Rect, but it lets the sprite know whenever it is modified in place, so the scene
+    manager can keep its spatial indexes up to date however the sprite is moved. The rectangles derived from it,
+    e.g. by copy or move, are not bound to any sprite.
+
+    :param sprite: the sprite owning the rectangle
+    :type sprite: XPGESprite
+    """
+
+    __slots__ = ("_sprite",)
+
+    def __init__(self, sprite):
+        super().__init__(0, 0, 0, 0)
+        _set_rect_attribute(self, "_sprite", sprite)
+
+    def __reduce__(self):
+        return pygame.Rect, tuple(self)
+
+    def _changed(self):
+        try:
+            sprite = self._sprite
+        except AttributeError:
+            return None
+        if sprite._managed:
+            sprite._scene_manager.invalidate_sprite(sprite)
+
+    def __setattr__(self, name, value):
+        _set_rect_attribute(self, name, value)
+        self._changed()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed()
+
+    def update(self, *args):
+        super().update(*args)
+        self._changed()
+
+    def normalize(self):
+        super().normalize()
+        self._changed()
+
+    def move_ip(self, *args):
+        super().move_ip(*args)
+        self._changed()
+
+    def inflate_ip(self, *args):
+        super().inflate_ip(*args)
+        self._changed()
+
+    def scale_by_ip(self, *args, **kwargs):
+        super().scale_by_ip(*args, **kwargs)
+        self._changed()
+
+    def clamp_ip(self, rect):
+        super().clamp_ip(rect)
+        self._changed()
+
+    def union_ip(self, rect):
+        super().union_ip(rect)
+        self._changed()
+
+    def unionall_ip(self, rects):
+        super().unionall_ip(rects)
+        self._changed()
+
 
+class SpriteBase:
+    """
+    Implementation of the visible game elements shared by XPGESprite and CompactSprite.
+
+    All the state of the sprite is kept in slots. Derive from XPGESprite or CompactSprite rather than from this class.
+
+    :param scene_manager: the scene manager of the sprite
+    """
+
+    __slots__ = ("_previous_focus", "_managed", "_scene_manager", "_image", "_area", "_rendered_image",
+                 "_rendered_area", "_rotation", "_scale", "_flip_x", "_flip_y", "_mask", "_use_mask", "_rect",
+                 "_is_active", "_takes_focus", "_components", "_components_by_type", "_event_handlers",
+                 "_hook_components", "_focus", "_name", "_dirty", "_layer", "_depth")
+
+    def __init__(self, scene_manager):
         self._previous_focus = False
+        self._managed = False
 
         self._scene_manager = scene_manager
         self._image = None
-        self._rect = pygame.Rect(0, 0, 0, 0)
+        self._area = None
+        self._rendered_image = None
+        self._rendered_area = None
+        self._rotation = 0.0
+        self._scale = 1.0
+        self._flip_x = False
+        self._flip_y = False
+        self._mask = None
+        self._use_mask = False
+        self._rect = SpriteRect(self)
         self._is_active = True
         self._takes_focus = True
-        self._components = list()
+        self._components = ComponentList(self)
+        self._components_by_type = dict()
+        self._event_handlers = dict()
+        self._hook_components = dict()
         self._focus = False
         self._name = None
+        self._dirty = True
+        self._layer = 0
+        self._depth = 0
 
     @property
     def scene_manager(self):
@@ -46,7 +245,7 @@ class XPGESprite(pygame.sprite.Sprite):
 
         The instance of pygame.Surface assigned to this property will be the image representing this sprite object
         on the screen. What is more, on assignment, the width and height property of the rect of the sprite will be
-        adjusted to the size of the new surface.
+        adjusted to the size of the new surface, transformed by the rotation, the scale and the flip of the sprite.
         """
 
         return self._image
@@ -54,19 +253,247 @@ class XPGESprite(pygame.sprite.Sprite):
     @image.setter
     def image(self, surface):
         self._image = surface
-        self._rect.width = self._image.get_rect().width
-        self._rect.height = self._image.get_rect().height
+        self._area = None
+        self._update_rendered_image()
+        self._dirty = True
+        self._notify_changed()
+
+    @property
+    def area(self):
+        """
+        The part of the image representing the sprite, or None if it is the whole image.
+
+        It lets many sprites share a single large surface, e.g. a page of a TextureAtlas. On assignment, the width
+        and height of the rect of the sprite are adjusted to the size of the area. Assigning a new image resets the
+        area to None, so the image has to be assigned first.
+        """
+
+        return self._area
+
+    @area.setter
+    def area(self, area):
+        self._area = None if area is None else pygame.Rect(area)
+        self._update_rendered_image()
+        self._dirty = True
+        self._notify_changed()
+
+    @property
+    def rotation(self):
+        """
+        The counterclockwise rotation of the image in degrees.
+
+        The transformed images are shared by all the sprites through the TransformCache xpgext.transform.default_cache,
+        which rounds the angle to its angle_step. When the rotation, the scale or the flip changes, the rect of the
+        sprite is resized about its center.
+        """
+
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value):
+        self.set_transform(rotation=value)
+
+    @property
+    def scale(self):
+        """The scale of the image. The default scale is 1."""
+
+        return self._scale
+
+    @scale.setter
+    def scale(self, value):
+        self.set_transform(scale=value)
+
+    @property
+    def flip_x(self):
+        """Is the image flipped horizontally?"""
+
+        return self._flip_x
+
+    @flip_x.setter
+    def flip_x(self, value):
+        self.set_transform(flip_x=value)
+
+    @property
+    def flip_y(self):
+        """Is the image flipped vertically?"""
+
+        return self._flip_y
+
+    @flip_y.setter
+    def flip_y(self, value):
+        self.set_transform(flip_y=value)
+
+    def set_transform(self, rotation=None, scale=None, flip_x=None, flip_y=None):
+        """
+        Change several transformation parameters at once, so the transformed image is looked up only once.
+
+        The parameters that are None are left unchanged.
+
+        :param rotation: the counterclockwise rotation in degrees
+        :type rotation: float
+        :param scale: the scale of the image
+        :type scale: float
+        :param flip_x: flip the image horizontally
+        :type flip_x: bool
+        :param flip_y: flip the image vertically
+        :type flip_y: bool
+        :raise ValueError: when the scale is not positive
+        """
+
+        if scale is not None and scale <= 0:
+            raise ValueError("scale must be positive, got {}".format(scale))
+        if rotation is not None:
+            self._rotation = rotation
+        if scale is not None:
+            self._scale = scale
+        if flip_x is not None:
+            self._flip_x = flip_x
+        if flip_y is not None:
+            self._flip_y = flip_y
+        center = self._rect.center
+        self._update_rendered_image()
+        self._rect.center = center
+        self._dirty = True
+        self._notify_changed()
+
+    @property
+    def rendered_image(self):
+        """
+        The surface blitted when drawing the sprite: the image transformed by the rotation, the scale and the flip.
+        """
+
+        return self._rendered_image
+
+    @property
+    def rendered_area(self):
+        """The part of the rendered image blitted when drawing the sprite, or None if it is the whole image."""
+
+        return self._rendered_area
+
+    @property
+    def use_mask(self):
+        """
+        Is the sprite hit-tested by the pixels of its image instead of its rect?
+
+        When True, the transparent parts of the image do not take the focus of the mouse cursor, and they do not
+        collide with other sprites in the CollisionSystem. The rect is always checked first, so the mask is consulted
+        only for the points and the sprites overlapping the rect. The default is False.
+        """
+
+        return self._use_mask
+
+    @use_mask.setter
+    def use_mask(self, value):
+        self._use_mask = value
+
+    @property
+    def mask(self):
+        """
+        The collision mask of the rendered image.
+
+        The mask is taken from the MaskCache xpgext.masks.default_cache when it is first needed after the image,
+        its area or its transformation has changed, so the sprites showing the same image share a single mask.
+
+        :rtype: pygame.mask.Mask
+        """
+
+        if self._mask is None and self._rendered_image is not None:
+            self._mask = masks.default_cache.get(self._rendered_image, self._rendered_area)
+        return self._mask
+
+    def contains_point(self, x, y):
+        """
+        Check whether the point lies within the sprite.
+
+        :param x: x coordinate of the point
+        :type x: int
+        :param y: y coordinate of the point
+        :type y: int
+        :return: True if the point is within the rect and, if use_mask is set, on a solid pixel of the image
+        :rtype: bool
+        """
+
+        if not self._rect.collidepoint(x, y):
+            return False
+        if not self._use_mask:
+            return True
+        mask = self.mask
+        return mask is None or mask.get_at((x - self._rect.x, y - self._rect.y)) != 0
+
+    def collides_with(self, other):
+        """
+        Check whether the sprite overlaps the other one.
+
+        :param other: the other sprite
+        :type other: XPGESprite
+        :return: True if the rects overlap and, if any of the sprites uses its mask, their solid pixels overlap
+        :rtype: bool
+        """
+
+        if not self._rect.colliderect(other.rect):
+            return False
+        if not self._use_mask and not other.use_mask:
+            return True
+        return self._get_hit_mask().overlap(other._get_hit_mask(),
+                                            (other.rect.x - self._rect.x, other.rect.y - self._rect.y)) is not None
+
+    def _get_hit_mask(self):
+        mask = self.mask if self._use_mask else None
+        if mask is None:
+            mask = pygame.mask.Mask(self._rect.size, fill=True)
+        return mask
+
+    def _update_rendered_image(self):
+        self._mask = None
+        if self._image is None:
+            return None
+        if self._rotation == 0 and self._scale == 1 and not self._flip_x and not self._flip_y:
+            self._rendered_image = self._image
+            self._rendered_area = self._area
+        else:
+            self._rendered_image = transform.default_cache.get(self._image, self._rotation, self._scale,
+                                                               self._flip_x, self._flip_y, self._area)
+            self._rendered_area = None
+        if self._rendered_area is None:
+            self._rect.width, self._rect.height = self._rendered_image.get_size()
+        else:
+            self._rect.width, self._rect.height = self._rendered_area.size
 
     @property
     def rect(self):
         """
         The rectangle of the sprite.
 
-        The instance of pygame.Rect holding information about the position and the size of the sprite.
+        The instance of pygame.Rect holding information about the position and the size of the sprite. It can be
+        modified in place, as the scene manager is notified about its changes.
         """
 
         return self._rect
 
+    @property
+    def dirty(self):
+        """
+        Does the sprite need to be redrawn?
+
+        This flag is used by the DirtyRectRenderer. Changes of the position, the size, the image and the activity
+        of the sprite are detected automatically, but when the content of the image surface is modified in place,
+        this property has to be set to True. The renderer resets it after drawing the sprite.
+
+        Setting it to True also drops the collision mask of the sprite and discards the masks of its rendered image
+        from xpgext.masks.default_cache, so the mask is recomputed from the modified pixels. Other sprites showing the
+        same image keep their masks until they are marked dirty as well.
+        """
+
+        return self._dirty
+
+    @dirty.setter
+    def dirty(self, value):
+        self._dirty = value
+        if value:
+            self._mask = None
+            if self._rendered_image is not None:
+                masks.default_cache.discard(self._rendered_image)
+
     @property
     def is_active(self):
         """
@@ -92,6 +519,7 @@ class XPGESprite(pygame.sprite.Sprite):
     @takes_focus.setter
     def takes_focus(self, value):
         self._takes_focus = value
+        self._notify_changed()
 
     @property
     def components(self):
@@ -103,13 +531,20 @@ class XPGESprite(pygame.sprite.Sprite):
 
         return self._components
 
+    def _components_changed(self):
+        self._components_by_type.clear()
+        self._event_handlers.clear()
+        self._hook_components.clear()
+        if self._managed:
+            self._scene_manager.refresh_event_handlers(self)
+
     @property
     def focus(self):
         """
         Is mouse cursor over the sprite?
 
         This read-only property returns True when the coordinates of the mouse cursor collide with the rectangle
-        of the sprite.
+        of the sprite, or with its solid pixels if use_mask is set.
         """
 
         return self._focus
@@ -127,7 +562,47 @@ class XPGESprite(pygame.sprite.Sprite):
 
     @name.setter
     def name(self, new_name):
+        old_name = self._name
         self._name = new_name
+        if self._managed and new_name != old_name:
+            self._scene_manager.rename_sprite(self, old_name)
+
+    @property
+    def layer(self):
+        """
+        The drawing layer of the sprite.
+
+        Sprites on higher layers are drawn over the sprites on lower ones, and they receive events first. The default
+        layer is 0.
+        """
+
+        return self._layer
+
+    @layer.setter
+    def layer(self, value):
+        if value != self._layer:
+            self._layer = value
+            if self._managed:
+                self._scene_manager.reorder_sprite(self)
+
+    @property
+    def depth(self):
+        """
+        The drawing order of the sprite within its layer.
+
+        Sprites with higher depth are drawn over the sprites with lower depth on the same layer. For y-sorting, set it
+        to the bottom of the rect of the sprite. The scene manager repositions only the changed sprite, so the depth
+        can be updated every frame. The default depth is 0.
+        """
+
+        return self._depth
+
+    @depth.setter
+    def depth(self, value):
+        if value != self._depth:
+            self._depth = value
+            if self._managed:
+                self._scene_manager.reorder_sprite(self)
 
     @property
     def position(self):
@@ -142,6 +617,11 @@ class XPGESprite(pygame.sprite.Sprite):
     @position.setter
     def position(self, new_position):
         self._rect.topleft = new_position
+        self._notify_changed()
+
+    def _notify_changed(self):
+        if self._managed:
+            self._scene_manager.refresh_sprite(self)
 
     def update(self):
         """
@@ -149,12 +629,12 @@ class XPGESprite(pygame.sprite.Sprite):
         """
 
         if self._is_active:
-            for component in self._components:
+            for component in self.components_with_hook("on_update"):
                 component.on_update()
 
     def handle_event(self, event):
         """
-        Handle the given event. It is passed to each of its components
+        Handle the given event. It is passed to each of its components that handle events of its type.
 
         :param event: event
         :type event: pygame.event.Event
@@ -165,53 +645,119 @@ class XPGESprite(pygame.sprite.Sprite):
         self._handle_mouse_motion(event)
         handled = self._handle_mouse_button_up(event)
         if not handled:
-            for component in self._components:
+            for component in self._get_event_handlers(event.type):
                 if component.on_handle_event(event):
                     handled = True
                     break
         return handled
 
+    def handles_event_type(self, event_type):
+        """
+        Check whether the events of the given type need to be passed to this sprite.
+
+        The scene manager uses this method to build its dispatch table. The result depends on the components of the
+        sprite and their handled_event_types attribute. Sprites whose class overrides handle_event receive all
+        the events.
+
+        :param event_type: pygame event type
+        :type event_type: int
+        :rtype: bool
+        """
+
+        if getattr(type(self), "handle_event", None) is not SpriteBase.handle_event:
+            return True
+        if event_type == MOUSEMOTION and not self._managed:
+            return True
+        if event_type == MOUSEBUTTONUP and len(self.components_with_hook("on_click")) > 0:
+            return True
+        return len(self._get_event_handlers(event_type)) > 0
+
+    def components_with_hook(self, hook):
+        """
+        Get the components implementing the given hook of SpriteBehaviour.
+
+        The components that do not override the hook, neither in their class nor on the instance, are skipped,
+        so calling their no-op implementation costs nothing. The result is cached until the components list changes.
+
+        :param hook: name of the hook, e.g. 'on_update'
+        :type hook: str
+        :return: list of the components in their order
+        :rtype: list
+        """
+
+        components = self._hook_components.get(hook)
+        if components is None:
+            components = [component for component in self._components
+                          if hook in get_overridden_hooks(type(component))
+                          or hook in getattr(component, "__dict__", ())]
+            self._hook_components[hook] = components
+        return components
+
+    def _get_event_handlers(self, event_type):
+        handlers = self._event_handlers.get(event_type)
+        if handlers is None:
+            handlers = list()
+            for component in self.components_with_hook("on_handle_event"):
+                event_types = getattr(type(component), "handled_event_types", None)
+                if event_types is None or event_type in event_types:
+                    handlers.append(component)
+            self._event_handlers[event_type] = handlers
+        return handlers
+
     def _handle_mouse_motion(self, event):
-        if event.type == MOUSEMOTION and self._takes_focus:
-            self._previous_focus = self._focus
-            self._focus = self._rect.collidepoint(event.pos[0], event.pos[1])
-            self._handle_hover()
+        if event.type == MOUSEMOTION and self._takes_focus and not self._managed:
+            self._set_focus(self.contains_point(event.pos[0], event.pos[1]))
+
+    def _set_focus(self, focus):
+        self._previous_focus = self._focus
+        self._focus = focus
+        self._handle_hover()
 
     def _handle_hover(self):
         if self._focus is self._previous_focus:
             return None
-        for component in self._components:
-            if self._focus:
+        if self._focus:
+            for component in self.components_with_hook("on_hover"):
                 component.on_hover()
-            else:
+        else:
+            for component in self.components_with_hook("on_hover_exit"):
                 component.on_hover_exit()
 
     def _handle_mouse_button_up(self, event):
         handled = False
         if event.type == MOUSEBUTTONUP and self._focus:
-            for component in self._components:
+            for component in self.components_with_hook("on_click"):
                 if component.on_click(event.button):
                     handled = True
                     break
         return handled
 
-    def draw(self, surface):
+    def draw(self, surface, offset=None):
         """
         Draw the sprite onto the given surface.
 
         :param surface: the destination surface
         :type surface: pygame.Surface
+        :param offset: the translation from world to surface coordinates, given when the scene is seen by a camera
+        :type offset: tuple
         """
 
         if self._is_active:
-            surface.blit(self._image, self._rect.topleft)
+            if offset is None:
+                position = self._rect.topleft
+            else:
+                position = (self._rect.x + offset[0], self._rect.y + offset[1])
+            if self._rendered_area is None:
+                surface.blit(self._rendered_image, position)
+            else:
+                surface.blit(self._rendered_image, position, self._rendered_area)
 
     def get_component_by_type(self, component_type):
         """
         Get the component of the sprite that is of the given type.
 
         If there is more than one components of this type, this method returns the first, whose type matches the given
-        one.
+        one. Instances of the subclasses of the given type match as well.
 
         :param component_type: type of the component
         :type component_type: type
@@ -220,7 +766,10 @@ class XPGESprite(pygame.sprite.Sprite):
         :raise ComponentNotFoundError: when no component of the given type has been found
         """
 
-        return self.get_component_by_type_name(component_type.__name__)
+        components = self._find_components_by_type(component_type)
+        if len(components) == 0:
+            raise ComponentNotFoundError(component_type.__name__)
+        return components[0]
 
     def get_component_by_type_name(self, component_type_name):
         """
@@ -243,7 +792,9 @@ class XPGESprite(pygame.sprite.Sprite):
 
     def find_components_by_type(self, component_type):
         """
-        Find all the components of the sprite of the given type.
+        Find all the components of the sprite of the given type, including the instances of its subclasses.
+
+        The result is cached until the components list changes.
 
         :param component_type: type of the component
         :type component_type: type
@@ -251,7 +802,14 @@ class XPGESprite(pygame.sprite.Sprite):
         :rtype: list
         """
 
-        return self.find_components_by_type_name(component_type.__name__)
+        return list(self._find_components_by_type(component_type))
+
+    def _find_components_by_type(self, component_type):
+        components = self._components_by_type.get(component_type)
+        if components is None:
+            components = [component for component in self._components if isinstance(component, component_type)]
+            self._components_by_type[component_type] = components
+        return components
 
     def find_components_by_type_name(self, component_type_name):
         """
@@ -271,9 +829,11 @@ class XPGESprite(pygame.sprite.Sprite):
 
     def find_by_name(self, name):
         """
-        This function is not intended to be used on its own.
+        Find the elements of the given name: this sprite if its name matches the given one.
 
-        Returns a list containing this instance if its name matches the given one.
+        SimpleSceneManager looks plain sprites up in its name index without calling this method. Override it
+        in sprites containing other elements, e.g. to return the matching children as well; the scene manager then
+        calls it from find_by_name and get_by_name.
 
         :param name: name to check
         :type name: str
@@ -287,13 +847,54 @@ class XPGESprite(pygame.sprite.Sprite):
         return result
 
 
-class SpriteBehaviour:
+class XPGESprite(SpriteBase, pygame.sprite.Sprite):
     """
-    Base class for scripts controlling sprite behaviour.
+    Base class for all the visible game elements.
 
-    Override the appropriate method and add the instance to sprite.components list.
+    Besides the state kept in the slots of SpriteBase, the sprite is a pygame.sprite.Sprite, so it can be added
+    to pygame sprite groups, and its subclasses can create any attributes.
+
+    :param scene_manager: the scene manager of the sprite
+    :param groups: pygame sprite groups to add the sprite to
     """
 
+    def __init__(self, scene_manager, *groups):
+        pygame.sprite.Sprite.__init__(self, *groups)
+        SpriteBase.__init__(self, scene_manager)
+
+
+class CompactSprite(SpriteBase):
+    """
+    Lightweight sprite for large populations, e.g. bullets or tiles counted in tens of thousands.
+
+    It has the same properties and methods as XPGESprite and is handled by the scene manager, the renderers and
+    the subsystems in the same way, but it is not a pygame.sprite.Sprite: it has no instance dictionary and no
+    bookkeeping of pygame sprite groups, which the scene manager does not use. Together with CompactBehaviour
+    components, this takes about a third less memory per sprite than XPGESprite; run
+    python -m benchmarks.memory_benchmark for the figures on a given platform.
+
+    Subclasses should declare __slots__ as well, listing their own attributes, or they get an instance dictionary
+    back.
+
+    :param scene_manager: the scene manager of the sprite
+    """
+
+    __slots__ = ()
+
+
+class BehaviourBase:
+    """
+    Implementation of the scripts controlling sprite behaviour shared by SpriteBehaviour and CompactBehaviour.
+
+    Derive from SpriteBehaviour or CompactBehaviour rather than from this class.
+
+    :param sprite: the sprite to which the script belongs
+    """
+
+    __slots__ = ("_sprite",)
+
+    handled_event_types = None
+
     def __init__(self, sprite):
         self._sprite = sprite
 
@@ -306,7 +907,7 @@ class SpriteBehaviour:
     @property
     def scene_manager(self):
         """
-        Alias for SpriteBehaviour.sprite.scene_manager.
+        Alias for sprite.scene_manager.
 
         This property provides easier access to the scene manager.
         """
@@ -362,3 +963,64 @@ class SpriteBehaviour:
         """
         Method called when the sprite is removed from the scene manager.
         """
+
+    def on_suspend(self):
+        """
+        Method called when the scene of the sprite is suspended, because another scene has been loaded.
+
+        Scenes are suspended only when SimpleSceneManager.scene_retention is greater than 0.
+        """
+
+    def on_resume(self):
+        """
+        Method called when the suspended scene of the sprite is loaded again.
+        """
+
+    def on_collision_enter(self, other):
+        """
+        Method called when the sprite starts touching another sprite.
+
+        Collisions are detected only for the sprites registered in SimpleSceneManager.collisions.
+
+        :param other: the other sprite
+        :type other: XPGESprite
+        """
+
+    def on_collision_stay(self, other):
+        """
+        Method called on every update while the sprite keeps touching another sprite.
+
+        :param other: the other sprite
+        :type other: XPGESprite
+        """
+
+    def on_collision_exit(self, other):
+        """
+        Method called when the sprite stops touching another sprite, or when the other sprite has been removed from
+        the collision system.
+
+        :param other: the other sprite
+        :type other: XPGESprite
+        """
+
+
+class SpriteBehaviour(BehaviourBase):
+    """
+    Base class for scripts controlling sprite behaviour.
+
+    Override the appropriate method and add the instance to sprite.components list.
+
+    Set the class attribute handled_event_types to a collection of pygame event types to receive only the events
+    of these types in on_handle_event. When it is None, the component receives all the events.
+    """
+
+
+class CompactBehaviour(BehaviourBase):
+    """
+    Lightweight script for large populations of sprites, e.g. the ones of CompactSprite.
+
+    It works exactly like SpriteBehaviour, but it has no instance dictionary. Subclasses have to declare __slots__
+    listing their own attributes to stay compact, e.g. __slots__ = ("velocity",).
+    """
+
+    __slots__ = ()
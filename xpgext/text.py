@@ -0,0 +1,149 @@
+from xpgext.assets import LRUCache
+from xpgext.sprite import XPGESprite
+
+DEFAULT_MEMORY_BUDGET = 8 * 1024 * 1024
+
+
+class TextCache(LRUCache):
+    """
+    Cache of rendered strings.
+
+    The strings are looked up by the font, the text, the colour, the antialiasing and the background, so all the
+    labels showing the same text share a single surface, and a counter cycling through a few values renders each
+    of them only once. When the total size of the cached surfaces exceeds the memory budget, the least recently used
+    ones are evicted.
+
+    :param memory_budget: the maximum number of bytes taken by the pixels of the cached surfaces
+    :type memory_budget: int
+    """
+
+    def __init__(self, memory_budget=DEFAULT_MEMORY_BUDGET):
+        super().__init__(memory_budget)
+
+    def render(self, font, text, colour, antialias=True, background=None):
+        """
+        Get the rendered string, rendering it with pygame.font.Font.render if it is not cached.
+
+        :param font: the font; its size is a part of the font object
+        :type font: pygame.font.Font
+        :param text: the string to render
+        :type text: str
+        :param colour: the colour of the text
+        :type colour: tuple
+        :param antialias: smooth the edges of the characters
+        :type antialias: bool
+        :param background: the colour of the background, or None for a transparent background
+        :type background: tuple
+        :return: the rendered text
+        :rtype: pygame.Surface
+        """
+
+        key = (font, text, tuple(colour), bool(antialias), None if background is None else tuple(background))
+        surface = self._lookup(key)
+        if surface is not None:
+            return surface
+        return self._store(key, font.render(text, antialias, colour, background))
+
+
+default_cache = TextCache()
+
+
+class LabelSprite(XPGESprite):
+    """
+    Sprite showing a single line of text.
+
+    The text is rendered through the TextCache xpgext.text.default_cache, and only when one of the properties
+    of the label actually changes, so assigning the same score every frame costs nothing.
+
+    :param scene_manager: the scene manager of the sprite
+    :param font: the font of the text
+    :type font: pygame.font.Font
+    :param text: the text
+    :type text: str
+    :param colour: the colour of the text
+    :type colour: tuple
+    :param antialias: smooth the edges of the characters
+    :type antialias: bool
+    :param background: the colour of the background, or None for a transparent background
+    :type background: tuple
+    """
+
+    def __init__(self, scene_manager, font, text="", colour=(255, 255, 255), antialias=True, background=None,
+                 *groups):
+        super().__init__(scene_manager, *groups)
+        self._font = font
+        self._text = str(text)
+        self._colour = tuple(colour)
+        self._antialias = antialias
+        self._background = None if background is None else tuple(background)
+        self._render()
+
+    @property
+    def text(self):
+        """
+        The text of the label.
+
+        Values other than strings, e.g. numbers, are converted with str.
+        """
+
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        value = str(value)
+        if value != self._text:
+            self._text = value
+            self._render()
+
+    @property
+    def font(self):
+        """The font of the text."""
+
+        return self._font
+
+    @font.setter
+    def font(self, value):
+        if value is not self._font:
+            self._font = value
+            self._render()
+
+    @property
+    def colour(self):
+        """The colour of the text."""
+
+        return self._colour
+
+    @colour.setter
+    def colour(self, value):
+        value = tuple(value)
+        if value != self._colour:
+            self._colour = value
+            self._render()
+
+    @property
+    def antialias(self):
+        """Are the edges of the characters smoothed?"""
+
+        return self._antialias
+
+    @antialias.setter
+    def antialias(self, value):
+        if value != self._antialias:
+            self._antialias = value
+            self._render()
+
+    @property
+    def background(self):
+        """The colour of the background, or None for a transparent background."""
+
+        return self._background
+
+    @background.setter
+    def background(self, value):
+        value = None if value is None else tuple(value)
+        if value != self._background:
+            self._background = value
+            self._render()
+
+    def _render(self):
+        self.image = default_cache.render(self._font, self._text, self._colour, self._antialias, self._background)
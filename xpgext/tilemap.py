@@ -0,0 +1,242 @@
+from array import array
+
+import pygame
+
+from xpgext.sprite import XPGESprite
+
+EMPTY_TILE = 0
+
+
+def split_tileset(surface, tile_size):
+    """
+    Cut the tileset image into the images of single tiles.
+
+    The tiles are read row by row. The returned surfaces are subsurfaces sharing the pixels of the given image.
+
+    :param surface: the tileset image
+    :type surface: pygame.Surface
+    :param tile_size: the width and the height of a tile in pixels
+    :type tile_size: tuple
+    :return: list of the tile images
+    :rtype: list
+    """
+
+    width, height = tile_size
+    return [surface.subsurface((x, y, width, height))
+            for y in range(0, surface.get_height() - height + 1, height)
+            for x in range(0, surface.get_width() - width + 1, width)]
+
+
+class TilemapSprite(XPGESprite):
+    """
+    Sprite drawing a whole grid of tiles.
+
+    The map holds the index of the tile of each cell in a compact array. Index 0 (EMPTY_TILE) stands for an empty
+    cell, and index n stands for the image tileset[n - 1]. The map is divided into square chunks of chunk_size tiles,
+    and each chunk is pre-rendered into its own surface the first time it becomes visible. Changing a tile only marks
+    its chunk for re-rendering, and drawing blits only the chunks visible on the destination surface, so a large level
+    costs a single sprite in the scene manager and a few blits per frame.
+
+    :param scene_manager: the scene manager of the sprite
+    :param tileset: sequence of the tile images, all of the tile size
+    :param map_size: the number of the columns and the rows of the map
+    :type map_size: tuple
+    :param tile_size: the width and the height of a tile in pixels
+    :type tile_size: tuple
+    :param chunk_size: the number of tiles along the side of a chunk
+    :type chunk_size: int
+    """
+
+    def __init__(self, scene_manager, tileset, map_size, tile_size, chunk_size=16, *groups):
+        super().__init__(scene_manager, *groups)
+        self._tileset = list(tileset)
+        self._map_size = tuple(map_size)
+        self._tile_size = tuple(tile_size)
+        self._chunk_size = chunk_size
+        self._tiles = array("H", bytes(2 * map_size[0] * map_size[1]))
+        self._chunks = dict()
+        self._dirty_chunks = set()
+        self._blits = list()
+        self._rect.size = (map_size[0] * tile_size[0], map_size[1] * tile_size[1])
+
+    @property
+    def tileset(self):
+        """
+        The tile images.
+
+        Assigning a new tileset re-renders all the chunks.
+        """
+
+        return self._tileset
+
+    @tileset.setter
+    def tileset(self, tileset):
+        self._tileset = list(tileset)
+        self.invalidate()
+
+    @property
+    def map_size(self):
+        """The number of the columns and the rows of the map."""
+
+        return self._map_size
+
+    @property
+    def tile_size(self):
+        """The width and the height of a tile in pixels."""
+
+        return self._tile_size
+
+    @property
+    def chunk_size(self):
+        """The number of tiles along the side of a pre-rendered chunk."""
+
+        return self._chunk_size
+
+    @property
+    def tiles(self):
+        """
+        Read-only copy of the tile indices, row by row.
+
+        :rtype: array.array
+        """
+
+        return array("H", self._tiles)
+
+    def get_tile(self, column, row):
+        """
+        Get the index of the tile in the given cell.
+
+        :param column: the column of the cell
+        :type column: int
+        :param row: the row of the cell
+        :type row: int
+        :rtype: int
+        """
+
+        return self._tiles[row * self._map_size[0] + column]
+
+    def set_tile(self, column, row, tile):
+        """
+        Change the tile in the given cell.
+
+        Only the chunk containing the cell is rendered again, and only if the index has changed.
+
+        :param column: the column of the cell
+        :type column: int
+        :param row: the row of the cell
+        :type row: int
+        :param tile: the index of the tile, or EMPTY_TILE
+        :type tile: int
+        """
+
+        if not (0 <= column < self._map_size[0] and 0 <= row < self._map_size[1]):
+            raise IndexError("cell ({}, {}) is outside of the map".format(column, row))
+        index = row * self._map_size[0] + column
+        if self._tiles[index] != tile:
+            self._tiles[index] = tile
+            self._dirty_chunks.add((column // self._chunk_size, row // self._chunk_size))
+            self._dirty = True
+
+    def load_tiles(self, rows):
+        """
+        Replace all the tiles of the map.
+
+        :param rows: sequence of the rows of the map, each one being a sequence of the tile indices
+        """
+
+        tiles = array("H")
+        for row in rows:
+            if len(row) != self._map_size[0]:
+                raise ValueError("expected rows of {} tiles, got {}".format(self._map_size[0], len(row)))
+            tiles.extend(row)
+        if len(tiles) != len(self._tiles):
+            raise ValueError("expected {} rows".format(self._map_size[1]))
+        self._tiles = tiles
+        self.invalidate()
+
+    def get_cell_at(self, x, y):
+        """
+        Get the cell of the map under the given point.
+
+        :param x: x coordinate of the point, in the coordinates of the rect of the sprite
+        :type x: int
+        :param y: y coordinate of the point
+        :type y: int
+        :return: tuple (column, row), or None if the point is outside of the map
+        :rtype: tuple
+        """
+
+        if not self._rect.collidepoint(x, y):
+            return None
+        return (x - self._rect.x) // self._tile_size[0], (y - self._rect.y) // self._tile_size[1]
+
+    def invalidate(self):
+        """Render all the chunks again before they are drawn next time."""
+
+        self._dirty_chunks.update(self._chunks)
+        self._dirty = True
+
+    def draw(self, surface, offset=None):
+        """
+        Draw the chunks of the map visible within the clipping area of the given surface.
+
+        :param surface: the destination surface
+        :type surface: pygame.Surface
+        :param offset: the translation from world to surface coordinates, given when the scene is seen by a camera
+        :type offset: tuple
+        """
+
+        if not self._is_active:
+            return None
+        dx, dy = offset if offset is not None else (0, 0)
+        left = self._rect.x + dx
+        top = self._rect.y + dy
+        visible = surface.get_clip().clip(pygame.Rect(left, top, self._rect.width, self._rect.height))
+        if visible.width == 0 or visible.height == 0:
+            return None
+
+        chunk_width = self._chunk_size * self._tile_size[0]
+        chunk_height = self._chunk_size * self._tile_size[1]
+        first_column = (visible.left - left) // chunk_width
+        last_column = (visible.right - 1 - left) // chunk_width
+        first_row = (visible.top - top) // chunk_height
+        last_row = (visible.bottom - 1 - top) // chunk_height
+        blits = self._blits
+        for chunk_row in range(first_row, last_row + 1):
+            for chunk_column in range(first_column, last_column + 1):
+                blits.append((self._get_chunk(chunk_column, chunk_row),
+                              (left + chunk_column * chunk_width, top + chunk_row * chunk_height)))
+        surface.blits(blits, doreturn=False)
+        blits.clear()
+
+    def _get_chunk(self, chunk_column, chunk_row):
+        key = (chunk_column, chunk_row)
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            chunk = pygame.Surface((self._chunk_size * self._tile_size[0], self._chunk_size * self._tile_size[1]),
+                                   pygame.SRCALPHA)
+            self._chunks[key] = chunk
+            self._dirty_chunks.discard(key)
+            self._render_chunk(chunk, chunk_column, chunk_row)
+        elif key in self._dirty_chunks:
+            self._dirty_chunks.discard(key)
+            self._render_chunk(chunk, chunk_column, chunk_row)
+        return chunk
+
+    def _render_chunk(self, chunk, chunk_column, chunk_row):
+        chunk.fill((0, 0, 0, 0))
+        columns, rows = self._map_size
+        tile_width, tile_height = self._tile_size
+        first_column = chunk_column * self._chunk_size
+        first_row = chunk_row * self._chunk_size
+        tiles = self._tiles
+        tileset = self._tileset
+        blits = list()
+        for row in range(first_row, min(first_row + self._chunk_size, rows)):
+            start = row * columns
+            y = (row - first_row) * tile_height
+            for column in range(first_column, min(first_column + self._chunk_size, columns)):
+                tile = tiles[start + column]
+                if tile != EMPTY_TILE:
+                    blits.append((tileset[tile - 1], ((column - first_column) * tile_width, y)))
+        chunk.blits(blits, doreturn=False)
@@ -0,0 +1,96 @@
+import weakref
+
+import pygame
+
+from xpgext.assets import LRUCache
+
+DEFAULT_MEMORY_BUDGET = 32 * 1024 * 1024
+
+
+class TransformCache(LRUCache):
+    """
+    Cache of the rotated, scaled and flipped versions of images.
+
+    The transformations are looked up by the source surface, its area and the transformation parameters. The angle
+    and the scale are rounded to the given steps, so sprites with almost equal transformations share a single
+    surface, and a sprite turning slowly does not create a new surface every frame. When the total size of the cached
+    surfaces exceeds the memory budget, the least recently used ones are evicted. The cache holds only weak
+    references to the source images, and their transformations are evicted once they are garbage collected.
+
+    :param memory_budget: the maximum number of bytes taken by the pixels of the cached surfaces
+    :type memory_budget: int
+    :param angle_step: the precision of the rotation in degrees
+    :type angle_step: float
+    :param scale_step: the precision of the scale
+    :type scale_step: float
+    """
+
+    def __init__(self, memory_budget=DEFAULT_MEMORY_BUDGET, angle_step=1.0, scale_step=0.01):
+        super().__init__(memory_budget)
+        self._angle_step = angle_step
+        self._scale_step = scale_step
+
+    @property
+    def angle_step(self):
+        """The precision of the rotation in degrees."""
+
+        return self._angle_step
+
+    @property
+    def scale_step(self):
+        """The precision of the scale."""
+
+        return self._scale_step
+
+    def get(self, surface, rotation=0.0, scale=1.0, flip_x=False, flip_y=False, area=None):
+        """
+        Get the transformed image, computing it if it is not cached.
+
+        The image is flipped first, then scaled and rotated counterclockwise about its center. Rotations by multiples
+        of 90 degrees are exact, other angles are filtered. When the rounded transformation changes nothing, the source
+        image, or its area, is returned without being cached.
+
+        :param surface: the source image
+        :type surface: pygame.Surface
+        :param rotation: the angle in degrees
+        :type rotation: float
+        :param scale: the scale factor
+        :type scale: float
+        :param flip_x: flip the image horizontally
+        :type flip_x: bool
+        :param flip_y: flip the image vertically
+        :type flip_y: bool
+        :param area: the part of the source image to transform, or None for the whole image
+        :type area: pygame.Rect
+        :return: the transformed image
+        :rtype: pygame.Surface
+        """
+
+        rotation = round(rotation / self._angle_step) * self._angle_step % 360
+        scale = round(scale / self._scale_step) * self._scale_step
+        if rotation == 0 and scale == 1 and not flip_x and not flip_y:
+            return surface if area is None else surface.subsurface(area)
+        key = (weakref.ref(surface), None if area is None else tuple(area), rotation, scale, bool(flip_x),
+               bool(flip_y))
+        result = self._lookup(key)
+        if result is not None:
+            return result
+        result = self._transform(surface if area is None else surface.subsurface(area), rotation, scale, flip_x,
+                                 flip_y)
+        return self._store(key, result, surface)
+
+    @staticmethod
+    def _transform(surface, rotation, scale, flip_x, flip_y):
+        if flip_x or flip_y:
+            surface = pygame.transform.flip(surface, flip_x, flip_y)
+        if rotation % 90 != 0:
+            return pygame.transform.rotozoom(surface, rotation, scale)
+        if rotation != 0:
+            surface = pygame.transform.rotate(surface, rotation)
+        if scale != 1:
+            width, height = surface.get_size()
+            return pygame.transform.scale(surface, (max(1, round(width * scale)), max(1, round(height * scale))))
+        return surface
+
+
+default_cache = TransformCache()